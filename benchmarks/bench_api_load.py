@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""API 서버 부하 테스트 (FakeChatModel + 해싱 임베딩, OpenAI/모델 파일 불필요).
+
+서버를 별도 프로세스로 띄우고 /health/ready가 200이 될 때까지 기다린 뒤, concurrency개 클라이언트가
+questions개 질문 중 하나를 골라 /chat(또는 --stream이면 /chat/stream)을 반복 호출합니다.
+질문 종류가 적을수록 동시에 같은 질문이 몰려 요청 합치기 효과가 커집니다. 답변 캐시는 기본으로 끕니다.
+
+    python benchmarks/bench_api_load.py --concurrency 64 --requests 2000 --questions 20
+    python benchmarks/bench_api_load.py --llm-concurrency 4 --rate-limit 600   # 429 비율 확인
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+TOPICS = ["수강신청", "도서관 휴관", "주차장 공사", "장학금 신청", "기숙사 입사", "등록금 납부", "졸업 요건", "휴학 신청"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        API_LLM_CONCURRENCY=str(args.llm_concurrency),
+        API_RATE_LIMIT_PER_MINUTE=str(args.rate_limit),
+        ANSWER_CACHE="on" if args.answer_cache else "off",
+        RAG_RETRIEVAL_MODE="vector",
+        # 해싱 임베딩은 유사도가 낮게 나오므로 컷오프를 꺼서 모든 요청이 LLM 경로를 타게 함
+        RAG_RELEVANCE_THRESHOLD="-1"
+    )
+    command = [
+        sys.executable, "-m", "src.interfaces.api.server",
+        "--port", str(port), "--workers", str(args.workers),
+        "--fake-llm", "--fake-embeddings", "--sample-data",
+        "--fake-first-token-ms", str(args.first_token_ms), "--fake-token-ms", str(args.token_ms)
+    ]
+    return subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("서버가 준비되지 않았습니다")
+
+
+async def one_request(client: httpx.AsyncClient, question: str, stream: bool) -> dict:
+    start = time.perf_counter()
+    if stream:
+        first_token = None
+        async with client.stream("POST", "/chat/stream", json={"question": question}) as response:
+            async for line in response.aiter_lines():
+                if first_token is None and line == "event: token":
+                    first_token = time.perf_counter() - start
+        return {"status": response.status_code, "seconds": time.perf_counter() - start, "ttft": first_token}
+
+    response = await client.post("/chat", json={"question": question})
+    body = response.json() if response.status_code == 200 else {}
+    return {"status": response.status_code, "seconds": time.perf_counter() - start, "coalesced": body.get("coalesced")}
+
+
+async def run_load(args, base_url: str) -> list:
+    rng = random.Random(0)
+    questions = [f"{TOPICS[i % len(TOPICS)]} 일정 알려주세요 ({i})" for i in range(args.questions)]
+    results = []
+    remaining = args.requests
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+        await wait_ready(client)
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                results.append(await one_request(client, rng.choice(questions), args.stream))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        stats = (await client.get("/stats")).json()
+    return results, elapsed, stats
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--rate-limit", type=float, default=0, help="클라이언트별 분당 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=5.0)
+    parser.add_argument("--answer-cache", action="store_true")
+    parser.add_argument("--stream", action="store_true")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(args, port)
+    try:
+        results, elapsed, stats = asyncio.run(run_load(args, f"http://127.0.0.1:{port}"))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    ok = [result for result in results if result["status"] == 200]
+    latencies = [result["seconds"] * 1000 for result in ok]
+    print(f"🏁 API 부하 테스트 ({'/chat/stream' if args.stream else '/chat'}, 워커 {args.workers}, "
+          f"동시 {args.concurrency}, 질문 {args.questions}종, LLM 동시 {args.llm_concurrency})")
+    print("=" * 72)
+    print(f"요청 {len(results)}개 / {elapsed:.1f}s  →  {len(results) / elapsed:.1f} req/s")
+    print(f"성공 {len(ok)}  429 {sum(r['status'] == 429 for r in results)}  "
+          f"기타 {sum(r['status'] not in (200, 429) for r in results)}")
+    print(f"지연(ms)  p50 {percentile(latencies, 0.5):.0f}  p95 {percentile(latencies, 0.95):.0f}  "
+          f"p99 {percentile(latencies, 0.99):.0f}")
+    if args.stream:
+        ttft = [result["ttft"] * 1000 for result in ok if result["ttft"] is not None]
+        print(f"첫 토큰(ms)  p50 {percentile(ttft, 0.5):.0f}  p95 {percentile(ttft, 0.95):.0f}")
+    else:
+        coalesced = sum(1 for result in ok if result.get("coalesced"))
+        print(f"합쳐진 요청 {coalesced}개 ({coalesced / max(1, len(ok)):.0%}), "
+              f"마지막 응답 워커 기준 LLM 실행 {stats['coalescing']['executed']}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""임베딩 백엔드별 처리량(texts/s)과 기존 HuggingFace 백엔드 대비 코사인 오차를 비교합니다.
+
+짧은 제목부터 긴 본문까지 길이가 섞인 공지사항 형태의 문장을 만들어
+huggingface / onnx(fp32) / onnx(int8) 백엔드로 배치 크기별 임베딩합니다.
+처음 onnx 백엔드를 쓸 때는 모델 변환 시간이 들므로 측정 전에 한 번 준비합니다.
+
+    python benchmarks/bench_embedding_backends.py --texts 512 --batch-sizes 8,32,64 --threads 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+
+TITLES = [
+    "2024학년도 1학기 국가장학금 2차 신청 안내",
+    "천안캠퍼스 도서관 열람실 운영시간 변경",
+    "수강신청 정정기간 및 유의사항",
+    "교내 근로장학생 모집 공고",
+    "예산캠퍼스 학생식당 메뉴 안내",
+]
+SENTENCES = [
+    "신청 기간 내에 한국장학재단 홈페이지에서 온라인으로 신청해야 합니다.",
+    "기간을 지나 제출한 서류는 접수하지 않으니 유의하시기 바랍니다.",
+    "자세한 사항은 학생지원팀으로 문의해 주시기 바랍니다.",
+    "시험 기간에는 열람실을 24시간 개방하며 좌석 예약 시스템을 통해 이용할 수 있습니다.",
+    "수강 정정은 포털 시스템에서만 가능하며 방문 접수는 받지 않습니다.",
+    "선발 인원은 학과별로 배정되며 가계 곤란 학생을 우선 선발합니다.",
+]
+
+
+def make_texts(count: int) -> list:
+    """제목만 있는 짧은 문장과 본문이 여러 문장인 긴 문장을 섞어 만듭니다."""
+    rng = np.random.default_rng(0)
+    texts = []
+    for i in range(count):
+        sentences = [SENTENCES[j] for j in rng.integers(0, len(SENTENCES), int(rng.integers(0, 12)))]
+        texts.append(" ".join([f"{TITLES[i % len(TITLES)]} ({i})"] + sentences))
+    return texts
+
+
+def throughput(embeddings: KoreanEmbeddings, texts: list, repeats: int) -> tuple:
+    embeddings.embed_documents(texts[:8])
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        vectors = embeddings.embed_documents(texts)
+        timings.append(time.perf_counter() - start)
+    return len(texts) / min(timings), np.asarray(vectors, dtype=np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--batch-sizes", default="8,32,64")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    batch_sizes = [int(value) for value in args.batch_sizes.split(",")]
+    backends = [("huggingface", False), ("onnx", False), ("onnx", True)]
+
+    print(f"🏁 임베딩 백엔드 비교 ({len(texts)}개 문장, threads={args.threads or 'default'})")
+    print("=" * 72)
+    print(f"{'backend':<14}{'batch':>7}{'texts/s':>11}{'speedup':>10}{'cos mean':>12}{'cos min':>11}")
+
+    reference = {}
+    for batch_size in batch_sizes:
+        baseline_rate = None
+        for backend, quantize in backends:
+            embeddings = KoreanEmbeddings(
+                use_cache=False, backend=backend, batch_size=batch_size,
+                num_threads=args.threads, quantize=quantize
+            )
+            rate, vectors = throughput(embeddings, texts, args.repeats)
+
+            if backend == "huggingface":
+                baseline_rate = rate
+                reference[batch_size] = vectors
+            # 모두 정규화된 벡터이므로 행별 내적이 코사인 유사도
+            cosines = np.einsum("ij,ij->i", vectors, reference[batch_size])
+            name = f"{backend}{'-int8' if quantize else ''}"
+            print(f"{name:<14}{batch_size:>7}{rate:>11.1f}{rate / baseline_rate:>9.2f}x"
+                  f"{cosines.mean():>12.5f}{cosines.min():>11.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""이벤트 코덱별 메시지 크기와 인코딩/디코딩 시간을 기존 JSON 형식과 비교합니다."""
+
+import os
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.domain.models import Campus, NoticeCategory
+from src.infrastructure.messaging.codecs import BinaryEventCodec, JsonEventCodec, decode_event
+from src.infrastructure.messaging.events import NoticeEvent, EventType
+
+ITERATIONS = 2000
+
+CONTENT = """2024학년도 2학기 국가장학금 2차 신청 안내
+
+신청 기간: 2024년 8월 21일(수) 09:00 ~ 9월 19일(목) 18:00
+신청 방법: 한국장학재단 홈페이지 또는 모바일 앱
+서류 제출 및 가구원 동의: 2024년 9월 26일(목) 18:00까지
+
+유의사항:
+1. 신입생, 편입생, 재입학생은 2차 신청 기간에 반드시 신청하시기 바랍니다.
+2. 재학생은 1차 신청이 원칙이며, 2차 신청은 재학 중 2회에 한해 구제 신청이 가능합니다.
+3. 가구원 정보제공 동의가 완료되지 않으면 소득 구간 산정이 되지 않습니다.
+
+문의처: 학생지원과 장학팀 (041-850-8000)
+"""
+
+
+def make_event(repeat: int) -> NoticeEvent:
+    return NoticeEvent(
+        event_id=str(uuid4()),
+        event_type=EventType.NOTICE_CREATED,
+        timestamp=datetime.now(),
+        source_service="benchmark",
+        notice_id="bench-1",
+        title="국가장학금 2차 신청 안내",
+        content=CONTENT * repeat,
+        url="https://www.kongju.ac.kr/notice/bench-1",
+        campus=Campus.ALL,
+        category=NoticeCategory.SCHOLARSHIP,
+        published_date=datetime.now(),
+        department="학생지원과"
+    )
+
+
+def available_codecs() -> list:
+    codecs = [JsonEventCodec()]
+    for serializer in ("msgpack", "orjson"):
+        for compression in (None, "zstd", "zlib"):
+            try:
+                codecs.append(BinaryEventCodec(serializer=serializer, compression=compression))
+            except ImportError:
+                pass
+    return codecs
+
+
+def measure(codec, event: NoticeEvent) -> dict:
+    payload = codec.encode(event)
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        codec.encode(event)
+    encode_us = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        decode_event(payload)
+    decode_us = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    return {"size": len(payload), "encode_us": encode_us, "decode_us": decode_us}
+
+
+def main():
+    print("📦 이벤트 코덱 비교 (기준: 기존 JSON)")
+    print("=" * 72)
+
+    for repeat in (1, 10):
+        event = make_event(repeat)
+        baseline = measure(JsonEventCodec(), event)
+        print(f"\n본문 길이 {len(event.content)}자")
+        print(f"{'codec':<16}{'bytes':>9}{'ratio':>8}{'encode(us)':>13}{'decode(us)':>13}")
+        for codec in available_codecs():
+            result = measure(codec, event)
+            print(
+                f"{codec.name:<16}{result['size']:>9}{result['size'] / baseline['size']:>8.2f}"
+                f"{result['encode_us']:>13.1f}{result['decode_us']:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Chroma와 FAISS(flat/hnsw/ivf) 저장소의 검색 지연 시간, recall@10, 메모리(RSS)를 비교합니다.
+
+실제 임베딩 대신 군집 구조를 가진 정규화된 합성 벡터를 사용하며, 저장소마다 별도 프로세스에서
+디스크에 저장된 인덱스를 열어 측정하므로 RSS는 서빙 노드가 인덱스를 열었을 때의 증가량입니다.
+
+    python benchmarks/bench_faiss_vs_chroma.py --sizes 10000,100000,1000000 --dim 768
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+CAMPUSES = ["ALL", "SINGWAN", "CHEONAN", "YESAN"]
+BATCH_SIZE = 50_000
+CLUSTERS = 1000
+TOP_K = 10
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def make_vectors(start: int, count: int, dim: int) -> np.ndarray:
+    """BATCH_SIZE 경계마다 시드를 고정해 생성합니다. start는 BATCH_SIZE의 배수여야 같은 벡터가 나옵니다."""
+    centers = np.random.default_rng(0).standard_normal((CLUSTERS, dim)).astype(np.float32)
+    vectors = []
+    for offset in range(start, start + count, BATCH_SIZE):
+        size = min(BATCH_SIZE, start + count - offset)
+        rng = np.random.default_rng(offset + 1)
+        batch = centers[rng.integers(0, CLUSTERS, size)] + 0.6 * rng.standard_normal((size, dim)).astype(np.float32)
+        vectors.append(batch)
+    vectors = np.vstack(vectors)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_queries(size: int, count: int, dim: int) -> np.ndarray:
+    rng = np.random.default_rng(12345)
+    positions = np.sort(rng.integers(0, size, count))
+    base = np.vstack([
+        make_vectors(start, min(BATCH_SIZE, size - start), dim)[positions[(positions >= start) & (positions < start + BATCH_SIZE)] - start]
+        for start in range(0, size, BATCH_SIZE)
+    ])
+    queries = base + 0.1 * rng.standard_normal(base.shape).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def ground_truth(size: int, dim: int, queries: np.ndarray) -> np.ndarray:
+    best_scores = np.full((len(queries), TOP_K), -np.inf, dtype=np.float32)
+    best_ids = np.zeros((len(queries), TOP_K), dtype=np.int64)
+    for start in range(0, size, BATCH_SIZE):
+        vectors = make_vectors(start, min(BATCH_SIZE, size - start), dim)
+        scores = queries @ vectors.T
+        ids = np.broadcast_to(np.arange(start, start + len(vectors)), scores.shape)
+        merged_scores = np.hstack([best_scores, scores])
+        merged_ids = np.hstack([best_ids, ids])
+        top = np.argpartition(-merged_scores, TOP_K, axis=1)[:, :TOP_K]
+        best_scores = np.take_along_axis(merged_scores, top, axis=1)
+        best_ids = np.take_along_axis(merged_ids, top, axis=1)
+    return best_ids
+
+
+def make_documents(start: int, count: int) -> list:
+    from langchain.schema import Document
+
+    return [
+        Document(
+            page_content=f"합성 공지사항 {i}",
+            metadata={"notice_id": f"b{i}", "title": f"공지 {i}", "campus": CAMPUSES[i % len(CAMPUSES)]}
+        )
+        for i in range(start, start + count)
+    ]
+
+
+class PrecomputedOnly:
+    """벤치마크에서는 임베딩 모델을 쓰지 않음."""
+
+    def embed_documents(self, texts):
+        raise RuntimeError("precomputed embeddings only")
+
+    def embed_query(self, text):
+        raise RuntimeError("precomputed embeddings only")
+
+
+def build(store: str, directory: str, size: int, dim: int) -> dict:
+    start_time = time.perf_counter()
+
+    if store == "chroma":
+        import chromadb
+
+        client = chromadb.PersistentClient(path=directory)
+        collection = client.get_or_create_collection("notice_collection", embedding_function=None)
+        for batch_start in range(0, size, BATCH_SIZE):
+            vectors = make_vectors(batch_start, min(BATCH_SIZE, size - batch_start), dim)
+            # Chroma의 add 한 번에 넣을 수 있는 개수 제한 때문에 5000개씩 나눠 추가
+            for offset in range(0, len(vectors), 5000):
+                start = batch_start + offset
+                count = min(5000, len(vectors) - offset)
+                documents = make_documents(start, count)
+                collection.add(
+                    ids=[f"b{i}:0" for i in range(start, start + count)],
+                    embeddings=vectors[offset:offset + count].tolist(),
+                    documents=[doc.page_content for doc in documents],
+                    metadatas=[doc.metadata for doc in documents]
+                )
+    else:
+        from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+
+        vector_store = FaissNoticeVectorStore(
+            directory, index_type=store.split("-")[1], embeddings=PrecomputedOnly(), autosave=False
+        )
+        for start in range(0, size, BATCH_SIZE):
+            count = min(BATCH_SIZE, size - start)
+            vector_store.add_embeddings(make_documents(start, count), make_vectors(start, count, dim))
+        vector_store.save()
+
+    return {"build_s": time.perf_counter() - start_time}
+
+
+def serve(store: str, directory: str, size: int, dim: int, query_count: int) -> dict:
+    import chromadb
+    from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+
+    queries = make_queries(size, query_count, dim)
+    truth = np.load(os.path.join(directory, "..", "truth.npy"))
+    # 라이브러리 import 이후를 기준으로 해서 인덱스를 여는 데 드는 메모리만 측정
+    baseline_rss = rss_mb()
+
+    if store == "chroma":
+        collection = chromadb.PersistentClient(path=directory).get_collection("notice_collection")
+
+        def search(query):
+            response = collection.query(
+                query_embeddings=[query.tolist()],
+                n_results=TOP_K,
+                include=['documents', 'metadatas', 'distances']
+            )
+            return [metadata["notice_id"] for metadata in response["metadatas"][0]]
+    else:
+        vector_store = FaissNoticeVectorStore(
+            directory, index_type=store.split("-")[1], read_only=True, embeddings=PrecomputedOnly()
+        )
+
+        def search(query):
+            return [doc.metadata["notice_id"] for doc, _ in vector_store.similarity_search_by_vector_with_score(query, TOP_K)]
+
+    for query in queries[:10]:
+        search(query)
+
+    timings = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        found = search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        hits += len({int(notice_id[1:]) for notice_id in found} & set(expected.tolist()))
+
+    timings.sort()
+    return {
+        "p50_ms": timings[len(timings) // 2],
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "recall": hits / (len(queries) * TOP_K),
+        "rss_mb": rss_mb() - baseline_rss
+    }
+
+
+def run_worker(mode: str, store: str, directory: str, size: int, dim: int, query_count: int) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, "--store", store, "--directory", directory,
+         "--sizes", str(size), "--dim", str(dim), "--queries", str(query_count)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--stores", default="chroma,faiss-flat,faiss-hnsw,faiss-ivf")
+    parser.add_argument("--worker", choices=["build", "serve"])
+    parser.add_argument("--store")
+    parser.add_argument("--directory")
+    args = parser.parse_args()
+
+    if args.worker:
+        size = int(args.sizes)
+        if args.worker == "build":
+            result = build(args.store, args.directory, size, args.dim)
+        else:
+            result = serve(args.store, args.directory, size, args.dim, args.queries)
+        print(json.dumps(result))
+        return
+
+    print(f"🏁 Chroma vs FAISS (dim={args.dim}, queries={args.queries}, recall@{TOP_K})")
+    print("=" * 80)
+    print(f"{'chunks':>9} {'store':<12}{'build(s)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'recall':>9}{'RSS(MB)':>10}")
+
+    for size in [int(value) for value in args.sizes.split(",")]:
+        with tempfile.TemporaryDirectory() as root:
+            queries = make_queries(size, args.queries, args.dim)
+            np.save(os.path.join(root, "truth.npy"), ground_truth(size, args.dim, queries))
+
+            for store in args.stores.split(","):
+                directory = os.path.join(root, store)
+                built = run_worker("build", store, directory, size, args.dim, args.queries)
+                served = run_worker("serve", store, directory, size, args.dim, args.queries)
+                print(
+                    f"{size:>9} {store:<12}{built['build_s']:>10.1f}{served['p50_ms']:>10.2f}"
+                    f"{served['p95_ms']:>10.2f}{served['recall']:>9.3f}{served['rss_mb']:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
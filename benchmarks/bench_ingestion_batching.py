@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""배치 크기/대기 시간 설정별 공지사항 적재 처리량(notices/s)을 측정합니다."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.domain.models import Campus, NoticeCategory
+from src.infrastructure.messaging.events import NoticeEvent, EventType
+from src.infrastructure.messaging.handlers.event_batcher import EventBatcher
+from src.infrastructure.messaging.handlers.notice_handler import RAGEventHandler
+from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+
+NOTICE_COUNT = 500
+BATCH_SIZES = [1, 16, 64, 256]
+
+
+def make_events(count: int, prefix: str) -> list:
+    return [
+        NoticeEvent(
+            event_id=str(uuid4()),
+            event_type=EventType.NOTICE_CREATED,
+            timestamp=datetime.now(),
+            source_service="benchmark",
+            notice_id=f"{prefix}-{i}",
+            title=f"벤치마크 공지사항 {i}",
+            content=f"{i}번째 공지사항 본문입니다. 신청 기간과 문의처를 확인해 주세요. " * 8,
+            url=f"https://www.kongju.ac.kr/notice/{prefix}-{i}",
+            campus=Campus.ALL,
+            category=NoticeCategory.ACADEMIC,
+            published_date=datetime.now()
+        )
+        for i in range(count)
+    ]
+
+
+async def run(batch_size: int, handler: RAGEventHandler) -> dict:
+    batcher = EventBatcher(handler.handle_notice_events, max_batch_size=batch_size, max_batch_delay=0.05)
+    events = make_events(NOTICE_COUNT, f"bs{batch_size}")
+
+    start = time.perf_counter()
+    for event in events:
+        await batcher.add(event)
+    await batcher.close()
+    elapsed = time.perf_counter() - start
+
+    stats = batcher.get_stats()
+    stats["wall_throughput"] = NOTICE_COUNT / elapsed
+    return stats
+
+
+async def main():
+    print(f"📦 공지사항 {NOTICE_COUNT}건 적재 처리량 측정")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as persist_directory:
+        vector_store = NoticeVectorStore(persist_directory=persist_directory)
+        handler = RAGEventHandler(vector_store)
+
+        print(f"{'batch':>6}{'batches':>10}{'notices/s':>14}")
+        for batch_size in BATCH_SIZES:
+            stats = await run(batch_size, handler)
+            print(f"{batch_size:>6}{stats['total_batches']:>10}{stats['wall_throughput']:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""메타데이터 인덱스 기반 필터 검색의 지연 시간을 코퍼스 크기별로 측정합니다.
+
+- candidates: "CHEONAN + SCHOLARSHIP + 최근 30일" 후보 ID 계산 (결과 캐시를 비운 상태)
+- prefilter:  FaissNoticeVectorStore에서 후보를 먼저 구해 검색 범위를 좁히는 현재 방식
+- postfilter: 필터 없이 k * 20개를 검색한 뒤 메타데이터로 거르는 방식 (k개를 못 채우는 비율도 표시)
+
+    python benchmarks/bench_metadata_filter.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from langchain.schema import Document
+
+from src.domain.models import Campus
+from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+from src.infrastructure.vector_store.metadata_index import MetadataFilter
+
+CAMPUSES = ["ALL", "SINGWAN", "CHEONAN", "YESAN"]
+CATEGORIES = ["ACADEMIC", "STUDENT_NEWS", "LIBRARY", "SCHOLARSHIP", "RECRUITMENT", "GENERAL"]
+LAST_DAY = date(2024, 12, 31)
+TOP_K = 5
+
+
+class PrecomputedOnly:
+    """벤치마크에서는 임베딩 모델을 쓰지 않음."""
+
+    def embed_documents(self, texts):
+        raise RuntimeError("precomputed embeddings only")
+
+    def embed_query(self, text):
+        raise RuntimeError("precomputed embeddings only")
+
+
+def percentiles(timings: list) -> tuple:
+    timings = sorted(timings)
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.99) - 1]
+
+
+def build_store(directory: str, size: int, dim: int, index_type: str) -> FaissNoticeVectorStore:
+    rng = np.random.default_rng(0)
+    store = FaissNoticeVectorStore(directory, index_type=index_type, embeddings=PrecomputedOnly(), autosave=False)
+    for start in range(0, size, 50_000):
+        count = min(50_000, size - start)
+        vectors = rng.standard_normal((count, dim)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        documents = [
+            Document(
+                page_content=f"합성 공지사항 {i}",
+                metadata={
+                    "notice_id": f"b{i}",
+                    "campus": CAMPUSES[int(rng.integers(len(CAMPUSES)))],
+                    "category": CATEGORIES[int(rng.integers(len(CATEGORIES)))],
+                    "published_date": (LAST_DAY - timedelta(days=int(rng.integers(730)))).isoformat()
+                }
+            )
+            for i in range(start, start + count)
+        ]
+        store.add_embeddings(documents, vectors)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--index-type", default="hnsw")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    print(f"🏁 메타데이터 필터 검색 (faiss-{args.index_type}, dim={args.dim}, queries={args.queries}, k={TOP_K})")
+    print("=" * 88)
+    print(f"{'chunks':>9} {'candidates':>11}{'index p50/p99(ms)':>20}{'prefilter p50/p99':>20}"
+          f"{'postfilter p50/p99':>20}{'short':>7}")
+
+    for size in [int(value) for value in args.sizes.split(",")]:
+        with tempfile.TemporaryDirectory() as directory:
+            store = build_store(directory, size, args.dim, args.index_type)
+            queries = rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+            queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+            filters = [
+                MetadataFilter.recent(30, Campus.CHEONAN, ["SCHOLARSHIP"], today=LAST_DAY - timedelta(days=int(day)))
+                for day in rng.integers(0, 700, args.queries)
+            ]
+
+            index_timings = []
+            for metadata_filter in filters:
+                store.metadata_index._results.clear()
+                start = time.perf_counter()
+                candidates = store.metadata_index.candidates(metadata_filter)
+                index_timings.append((time.perf_counter() - start) * 1000)
+
+            prefilter_timings = []
+            for query, metadata_filter in zip(queries, filters):
+                start = time.perf_counter()
+                store.similarity_search_by_vector_with_score(query, TOP_K, metadata_filter=metadata_filter)
+                prefilter_timings.append((time.perf_counter() - start) * 1000)
+
+            postfilter_timings = []
+            short = 0
+            for query, metadata_filter in zip(queries, filters):
+                start = time.perf_counter()
+                rows = store.similarity_search_by_vector_with_score(query, TOP_K * 20)
+                found = [doc for doc, _ in rows if metadata_filter.matches(doc.metadata)][:TOP_K]
+                postfilter_timings.append((time.perf_counter() - start) * 1000)
+                short += len(found) < TOP_K
+
+            index_p50, index_p99 = percentiles(index_timings)
+            pre_p50, pre_p99 = percentiles(prefilter_timings)
+            post_p50, post_p99 = percentiles(postfilter_timings)
+            print(
+                f"{size:>9} {len(candidates):>11}{index_p50:>10.2f}/{index_p99:<9.2f}{pre_p50:>10.2f}/{pre_p99:<9.2f}"
+                f"{post_p50:>10.2f}/{post_p99:<9.2f}{short / len(queries):>7.0%}"
+            )
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""MMR 검색의 추가 지연 시간과 상위 k개에 포함된 공지사항 수를 일반 벡터 검색과 비교합니다.
+
+공지사항마다 서로 비슷한 청크 여러 개(겹치는 청크를 흉내 냄)를 가진 합성 임베딩을 NoticeVectorStore에 넣고,
+similarity_search_with_score와 max_marginal_relevance_search_with_score를 같은 질의로 호출합니다.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from langchain.schema import Document
+
+from src.infrastructure.embedding.similarity import mmr_select, normalize
+from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+
+TOP_K = 5
+
+
+class LookupEmbeddings:
+    """미리 만든 벡터를 텍스트로 찾아 돌려주는 벤치마크용 임베딩."""
+
+    def __init__(self, vectors: dict):
+        self.vectors = vectors
+
+    def embed_documents(self, texts):
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text):
+        return self.vectors[text]
+
+
+def percentiles(timings: list) -> str:
+    timings = sorted(timings)
+    return f"{timings[len(timings) // 2]:.2f}/{timings[int(len(timings) * 0.95) - 1]:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notices", type=int, default=2000)
+    parser.add_argument("--chunks-per-notice", type=int, default=4)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--fetch-k", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = normalize(rng.standard_normal((args.notices, args.dim)))
+    vectors = {}
+    documents = []
+    for notice, center in enumerate(centers):
+        # 같은 공지사항 청크끼리 코사인 0.9 안팎
+        chunks = normalize(center + 0.5 * rng.standard_normal((args.chunks_per_notice, args.dim)) / np.sqrt(args.dim))
+        for index, chunk in enumerate(chunks):
+            text = f"공지 {notice} 부분 {index}"
+            vectors[text] = chunk.tolist()
+            documents.append(Document(page_content=text, metadata={"notice_id": f"n{notice}", "campus": "ALL"}))
+
+    # 질의는 임의 공지사항 근처와 두 공지사항 사이에 고루 둠
+    queries = []
+    for i in range(args.queries):
+        first, second = rng.integers(0, args.notices, 2)
+        query = centers[first] + (0.7 * centers[second] if i % 2 else 0)
+        query = query + 0.3 * rng.standard_normal(args.dim) / np.sqrt(args.dim)
+        vectors[f"질의 {i}"] = normalize(query)[0].tolist()
+        queries.append(f"질의 {i}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=LookupEmbeddings(vectors))
+        for start in range(0, len(documents), 5000):
+            store.add_documents(documents[start:start + 5000])
+
+        for query in queries[:10]:
+            store.similarity_search_with_score(query, k=TOP_K)
+            store.max_marginal_relevance_search_with_score(query, k=TOP_K, fetch_k=args.fetch_k)
+
+        rows = {}
+        for name, search in [
+            ("vector", lambda q: store.similarity_search_with_score(q, k=TOP_K)),
+            ("mmr", lambda q: store.max_marginal_relevance_search_with_score(
+                q, k=TOP_K, fetch_k=args.fetch_k, lambda_mult=0.5)),
+            ("mmr+cap1", lambda q: store.max_marginal_relevance_search_with_score(
+                q, k=TOP_K, fetch_k=args.fetch_k, lambda_mult=0.5, max_chunks_per_notice=1)),
+        ]:
+            timings = []
+            notices = []
+            for query in queries:
+                start = time.perf_counter()
+                results = search(query)
+                timings.append((time.perf_counter() - start) * 1000)
+                notices.append(len({doc.metadata["notice_id"] for doc, _ in results}))
+            rows[name] = (percentiles(timings), float(np.mean(notices)))
+
+        pool = normalize(rng.standard_normal((args.fetch_k, args.dim)))
+        groups = [f"n{i // 2}" for i in range(args.fetch_k)]
+        rerank = []
+        for query in queries:
+            start = time.perf_counter()
+            mmr_select(vectors[query], pool, TOP_K, groups=groups, max_per_group=1)
+            rerank.append((time.perf_counter() - start) * 1000)
+
+    print(f"🏁 MMR 검색 비교 ({len(documents)}개 청크, dim={args.dim}, k={TOP_K}, fetch_k={args.fetch_k})")
+    print("=" * 56)
+    print(f"{'mode':<10}{'p50/p95(ms)':>16}{'notices in top-k':>20}")
+    for name, (latency, notice_count) in rows.items():
+        print(f"{name:<10}{latency:>16}{notice_count:>20.2f}")
+    print(f"{'rerank':<10}{percentiles(rerank):>16}{'(mmr_select만)':>20}")
+
+
+if __name__ == "__main__":
+    main()
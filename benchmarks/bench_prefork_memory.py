@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""pre-fork 워커(모델/인덱스 copy-on-write 공유)와 독립 프로세스 N개의 전체 메모리를 비교합니다.
+
+두 방식 모두 워커마다 warm-up과 검색을 몇 번 실행한 뒤(가중치와 인덱스 페이지를 실제로 읽은 상태에서) 측정합니다.
+RSS 합계는 공유 페이지를 중복해서 세므로 실제 사용량은 PSS 합계로 비교합니다.
+
+기본값은 KoSimCSE(roberta-base, 약 440MB)와 같은 크기의 numpy 가중치를 가진 합성 모델을 사용합니다.
+--real을 주면 KoreanEmbeddings를 사용합니다 (모델 파일 필요).
+
+    python benchmarks/bench_prefork_memory.py --workers 1,2,4
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+from src.interfaces.prefork import PreforkServer, init_store_worker, memory_report, prepare_shared_store
+
+DIM = 768
+QUERIES = ["장학금 신청 기간", "도서관 운영 시간", "수강 정정 방법", "기숙사 입사 신청"]
+
+
+class SyntheticModel:
+    """model_mb 크기의 가중치를 모두 읽어 임베딩을 만드는 벤치마크용 모델."""
+
+    def __init__(self, model_mb: int):
+        self.model_mb = model_mb
+        self.weights = None
+
+    def load(self):
+        if self.weights is None:
+            rows = self.model_mb * 1024 * 1024 // (4 * DIM)
+            self.weights = np.random.default_rng(0).standard_normal((rows, DIM), dtype=np.float32)
+
+    def warmup(self):
+        self.embed_query("워밍업")
+
+    def embed_documents(self, texts):
+        self.load()
+        rng = np.random.default_rng([ord(char) for text in texts for char in text])
+        inputs = rng.standard_normal((len(texts), len(self.weights)), dtype=np.float32)
+        vectors = inputs @ self.weights
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).tolist()
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def make_embeddings(args):
+    if args.real:
+        from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+        return KoreanEmbeddings(use_cache=False)
+    return SyntheticModel(args.model_mb)
+
+
+def build_store(directory: str, chunks: int):
+    rng = np.random.default_rng(1)
+    store = FaissNoticeVectorStore(directory, embeddings=SyntheticModel(1), autosave=False)
+    for start in range(0, chunks, 20_000):
+        count = min(20_000, chunks - start)
+        vectors = rng.standard_normal((count, DIM), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        documents = [
+            Document(page_content=f"공지 {i}", metadata={"notice_id": f"n{i}", "campus": "ALL"})
+            for i in range(start, start + count)
+        ]
+        store.add_embeddings(documents, vectors)
+    store.save()
+    store.close()
+
+
+def serve_queries(store):
+    for query in QUERIES:
+        store.similarity_search(query, k=5)
+
+
+def wait_forever():
+    while True:
+        time.sleep(3600)
+
+
+def independent_worker(directory: str, args, ready):
+    store = FaissNoticeVectorStore(directory, read_only=True, embeddings=make_embeddings(args))
+    store.warmup()
+    serve_queries(store)
+    ready.put(os.getpid())
+    wait_forever()
+
+
+def measure_prefork(directory: str, workers: int, args) -> dict:
+    ready = multiprocessing.get_context("fork").SimpleQueue()
+    store = FaissNoticeVectorStore(directory, read_only=True, embeddings=make_embeddings(args))
+    prepare_shared_store(store)
+
+    def serve(worker_id: int):
+        init_store_worker(store, workers)
+        serve_queries(store)
+        ready.put(os.getpid())
+        wait_forever()
+
+    server = PreforkServer(serve, workers=workers, restart=False)
+    server.start()
+    for _ in range(workers):
+        ready.get()
+    report = memory_report(server.pids + [os.getpid()])
+    server.stop()
+    store.close()
+    return report
+
+
+def measure_independent(directory: str, workers: int, args) -> dict:
+    context = multiprocessing.get_context("spawn")
+    ready = context.SimpleQueue()
+    processes = [context.Process(target=independent_worker, args=(directory, args, ready)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for _ in range(workers):
+        ready.get()
+    report = memory_report(process.pid for process in processes)
+    for process in processes:
+        os.kill(process.pid, signal.SIGTERM)
+        process.join()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--model-mb", type=int, default=440)
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--real", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_store(directory, args.chunks)
+
+        print(f"🏁 pre-fork vs 독립 프로세스 메모리 ({'KoreanEmbeddings' if args.real else f'합성 모델 {args.model_mb}MB'}, "
+              f"FAISS {args.chunks}개 x {DIM}차원)")
+        print("=" * 78)
+        print(f"{'workers':>8}  {'mode':<12}{'procs':>6}{'RSS sum(MB)':>14}{'PSS sum(MB)':>14}{'USS sum(MB)':>14}")
+        for workers in [int(value) for value in args.workers.split(",")]:
+            for name, measure in [("independent", measure_independent), ("prefork", measure_prefork)]:
+                report = measure(directory, workers, args)
+                print(f"{workers:>8}  {name:<12}{report['processes']:>6}{report['rss_mb']:>14.0f}"
+                      f"{report['pss_mb']:>14.0f}{report['uss_mb']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""동시 질의 임베딩을 개별 호출할 때와 EmbeddingBatcher로 묶을 때의 처리량/지연 시간을 비교합니다.
+
+기본값은 모델 없이 돌 수 있도록 numpy로 만든 작은 인코더(임베딩 → FFN 층 → mean pooling)를 사용합니다.
+호출마다 드는 고정 비용과 배치 행렬 곱의 효율이 실제 모델과 같은 방향으로 작용합니다.
+--real을 주면 KoreanEmbeddings(캐시 없음)로 측정합니다.
+
+    python benchmarks/bench_query_batching.py --clients 1,8,32 --waits 0,2,5
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.infrastructure.embedding.batching import EmbeddingBatcher
+
+SEQUENCE_LENGTH = 32
+
+
+class SyntheticEncoder:
+    """문자 코드 임베딩 + FFN 4층 + mean pooling으로 이루어진 벤치마크용 인코더."""
+
+    def __init__(self, dim: int = 384, layers: int = 4):
+        rng = np.random.default_rng(0)
+        self.table = rng.standard_normal((4096, dim)).astype(np.float32)
+        self.layers = [
+            (rng.standard_normal((dim, dim * 4)).astype(np.float32) / np.sqrt(dim),
+             rng.standard_normal((dim * 4, dim)).astype(np.float32) / np.sqrt(dim * 4))
+            for _ in range(layers)
+        ]
+
+    def embed_documents(self, texts):
+        ids = np.zeros((len(texts), SEQUENCE_LENGTH), dtype=np.int64)
+        for row, text in enumerate(texts):
+            codes = [ord(char) % 4096 for char in text[:SEQUENCE_LENGTH]]
+            ids[row, :len(codes)] = codes
+        hidden = self.table[ids]
+        for up, down in self.layers:
+            hidden = hidden + np.maximum(hidden @ up, 0) @ down
+        pooled = hidden.mean(axis=1)
+        return (pooled / np.linalg.norm(pooled, axis=1, keepdims=True)).tolist()
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def run_clients(embed_fn, clients: int, per_client: int) -> tuple:
+    latencies = []
+    lock = threading.Lock()
+
+    def client(client_id: int):
+        local = []
+        for i in range(per_client):
+            text = f"학생 {client_id}의 {i}번째 질문: 장학금 신청 기간은 언제인가요?"
+            start = time.perf_counter()
+            embed_fn(text)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", default="1,8,32")
+    parser.add_argument("--waits", default="0,2,5")
+    parser.add_argument("--queries", type=int, default=256, help="클라이언트 수와 관계없이 측정할 전체 질의 수")
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--real", action="store_true")
+    args = parser.parse_args()
+
+    if args.real:
+        from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+        model = KoreanEmbeddings(use_cache=False, query_batching=False)
+    else:
+        model = SyntheticEncoder()
+    model.embed_documents(["워밍업"] * 4)
+
+    print(f"🏁 질의 임베딩 배칭 비교 ({'KoreanEmbeddings' if args.real else 'synthetic encoder'}, "
+          f"max_batch={args.max_batch}, queries={args.queries})")
+    print("=" * 70)
+    print(f"{'clients':>8}  {'mode':<14}{'qps':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'mean batch':>12}")
+
+    for clients in [int(value) for value in args.clients.split(",")]:
+        per_client = max(1, args.queries // clients)
+        rows = [("direct", model.embed_query, None)]
+        for wait in [float(value) for value in args.waits.split(",")]:
+            batcher = EmbeddingBatcher(model.embed_documents, max_batch_size=args.max_batch, max_wait_ms=wait)
+            rows.append((f"batched {wait:g}ms", batcher.embed, batcher))
+
+        for name, embed_fn, batcher in rows:
+            qps, p50, p95 = run_clients(embed_fn, clients, per_client)
+            mean_batch = f"{batcher.stats()['mean_batch_size']:.1f}" if batcher else "1.0"
+            print(f"{clients:>8}  {name:<14}{qps:>10.1f}{p50:>10.2f}{p95:>10.2f}{mean_batch:>12}")
+            if batcher:
+                batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""단건 calculate_similarity 반복과 similarity 모듈의 배치 연산을 비교합니다.
+
+- top-k: 질의 하나와 n개 청크의 유사도를 구해 상위 10개 선택 (파이썬 루프 + 정렬 vs 행렬 곱 + argpartition)
+- 중복 후보: n개 청크 중 코사인 0.95 이상 쌍 찾기 (이중 루프는 n=1000, 배치는 n=10000까지만 측정)
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.infrastructure.embedding.korean_embeddings import calculate_similarity
+from src.infrastructure.embedding.similarity import near_duplicate_pairs, normalize, top_k_similar
+
+DIM = 768
+TOP_K = 10
+
+
+def elapsed_ms(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"🏁 유사도 계산 비교 (dim={DIM}, 최솟값 ms)")
+    print("=" * 72)
+    print(f"{'chunks':>8}{'loop top-k':>14}{'batch top-k':>14}{'loop dedup':>14}{'batch dedup':>14}")
+
+    for size in [1000, 10000, 50000]:
+        matrix = normalize(rng.standard_normal((size, DIM)))
+        vectors = matrix.tolist()
+        query = vectors[0]
+
+        def loop_top_k():
+            scores = [calculate_similarity(query, vector) for vector in vectors]
+            return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:TOP_K]
+
+        def loop_dedup():
+            return [
+                (i, j) for i in range(len(vectors)) for j in range(i + 1, len(vectors))
+                if calculate_similarity(vectors[i], vectors[j]) >= 0.95
+            ]
+
+        loop_top_k_ms = elapsed_ms(loop_top_k, repeat=1)
+        batch_top_k_ms = elapsed_ms(lambda: top_k_similar(np.asarray(query, dtype=np.float32), matrix, TOP_K))
+        loop_dedup_ms = f"{elapsed_ms(loop_dedup, repeat=1):.1f}" if size <= 1000 else "-"
+        # 중복 탐지는 O(n²)이라 5만 개에서는 생략
+        batch_dedup_ms = f"{elapsed_ms(lambda: near_duplicate_pairs(matrix), repeat=1):.1f}" if size <= 10000 else "-"
+        print(f"{size:>8}{loop_top_k_ms:>14.1f}{batch_top_k_ms:>14.2f}{loop_dedup_ms:>14}{batch_dedup_ms:>14}")
+
+
+if __name__ == "__main__":
+    main()
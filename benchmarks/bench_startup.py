@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""진입점별 import 시간과 최대 RSS를 측정합니다.
+
+각 진입점을 새 파이썬 프로세스에서 import(및 선택적으로 생성)하고, 같은 프로세스에서
+경과 시간과 ru_maxrss를 출력합니다. 프로세스마다 5번 반복해 중앙값을 보고합니다.
+--warmup을 주면 모델을 실제로 올리는 warmup() 단계까지 측정합니다 (모델 파일 필요).
+
+    python benchmarks/bench_startup.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+ENTRY_POINTS = {
+    "events": "from src.infrastructure.messaging.events import NoticeEvent",
+    "codecs": "from src.infrastructure.messaging.codecs import create_event_codec",
+    "streams broker": "from src.infrastructure.messaging.brokers.redis_streams_broker import RedisStreamsMessageBroker",
+    "domain models": "from src.domain.models import Notice",
+    "korean_embeddings": "from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings",
+    "chroma_store": "from src.infrastructure.vector_store.chroma_store import NoticeVectorStore",
+    "faiss_store": "from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore",
+    "notice_handler": "from src.infrastructure.messaging.handlers.notice_handler import RAGEventHandler",
+    "rag_service": "from src.application.services.rag_service import NoticeRAGSystem",
+    "chroma_store()": (
+        "import tempfile\n"
+        "from src.infrastructure.vector_store.chroma_store import NoticeVectorStore\n"
+        "store = NoticeVectorStore(tempfile.mkdtemp())"
+    ),
+}
+
+WARMUP_ENTRY_POINTS = {
+    "chroma_store().warmup()": (
+        "import tempfile\n"
+        "from src.infrastructure.vector_store.chroma_store import NoticeVectorStore\n"
+        "store = NoticeVectorStore(tempfile.mkdtemp())\n"
+        "store.warmup()"
+    ),
+}
+
+PROBE = """
+import resource, sys, time, json
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+try:
+    exec(compile({code!r}, "<entry>", "exec"))
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, "error": error}}))
+"""
+
+
+def measure(code: str, repeats: int) -> dict:
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(root=ROOT, code=code)],
+            capture_output=True, text=True, cwd=ROOT
+        ).stdout.strip().splitlines()
+        runs.append(json.loads(output[-1]))
+    runs.sort(key=lambda run: run["seconds"])
+    return runs[len(runs) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true")
+    args = parser.parse_args()
+
+    entry_points = dict(ENTRY_POINTS)
+    if args.warmup:
+        entry_points.update(WARMUP_ENTRY_POINTS)
+
+    print(f"🏁 진입점별 시작 비용 (중앙값, {args.repeats}회)")
+    print("=" * 60)
+    print(f"{'entry point':<26}{'time(ms)':>12}{'max RSS(MB)':>14}")
+    for name, code in entry_points.items():
+        result = measure(code, args.repeats)
+        note = f"  ⚠️ {result['error']}" if result["error"] else ""
+        print(f"{name:<26}{result['seconds'] * 1000:>12.0f}{result['rss_mb']:>14.1f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""NoticeVectorStore 메타데이터 조회/삭제 메서드의 호출당 지연 시간을 측정합니다.
+
+'before'는 호출마다 PersistentClient를 새로 만들고 컬렉션을 다시 여는 기존 방식,
+'after'는 인스턴스가 보유한 공유 클라이언트/컬렉션 핸들을 사용하는 현재 방식입니다.
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import chromadb
+
+from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+from src.application.processors.document_processor import create_sample_langchain_documents
+
+ITERATIONS = 200
+
+
+def measure(func, iterations: int = ITERATIONS) -> dict:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "mean": statistics.mean(timings),
+        "p50": timings[len(timings) // 2],
+        "p95": timings[int(len(timings) * 0.95) - 1]
+    }
+
+
+def legacy_calls(persist_directory: str, collection_name: str) -> dict:
+    def get_collection():
+        client = chromadb.PersistentClient(path=persist_directory)
+        return client.get_collection(name=collection_name)
+
+    return {
+        "get_existing_notice_ids": lambda: get_collection().get(include=['metadatas']),
+        "get_collection_info": lambda: get_collection().count(),
+        "get_documents_by_id": lambda: get_collection().get(
+            where={"notice_id": "12345"}, include=['documents', 'metadatas']
+        ),
+        "delete_documents_by_id": lambda: get_collection().get(
+            where={"notice_id": "missing"}, include=['metadatas']
+        ),
+    }
+
+
+def shared_calls(vector_store: NoticeVectorStore) -> dict:
+    return {
+        "get_existing_notice_ids": vector_store.get_existing_notice_ids,
+        "get_collection_info": vector_store.get_collection_info,
+        "get_documents_by_id": lambda: vector_store.get_documents_by_id("12345"),
+        "delete_documents_by_id": lambda: vector_store.delete_documents_by_id("missing"),
+    }
+
+
+def main():
+    print("⏱️  NoticeVectorStore 호출 지연 시간 측정")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as persist_directory:
+        vector_store = NoticeVectorStore(persist_directory=persist_directory)
+        vector_store.add_documents_with_dedup(create_sample_langchain_documents())
+
+        before = legacy_calls(persist_directory, vector_store.collection_name)
+        after = shared_calls(vector_store)
+
+        print(f"{'method':<26}{'before p50':>12}{'after p50':>12}{'before p95':>12}{'after p95':>12}")
+        for name in before:
+            b = measure(before[name])
+            a = measure(after[name])
+            print(f"{name:<26}{b['p50']:>10.3f}ms{a['p50']:>10.3f}ms{b['p95']:>10.3f}ms{a['p95']:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
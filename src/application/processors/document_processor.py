@@ -1,5 +1,5 @@
 from typing import List
-from langchain.schema import Document
+from langchain_core.documents import Document
 
 from ...domain.models import NoticeDocument, Notice
 from .text_splitter import NoticeTextSplitter
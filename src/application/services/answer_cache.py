@@ -0,0 +1,166 @@
+import copy
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+from ...domain.models import Campus
+from ...infrastructure.embedding.similarity import cosine_matrix, top_k_similar
+from ...shared.utils.env import load_env
+
+
+@dataclass
+class AnswerCacheEntry:
+    embedding: np.ndarray
+    campus_scope: str
+    response: Dict[str, Any]
+    notice_ids: Set[str]
+    # 답변 근거 문서 중 가장 낮은 질의 유사도. 새 청크가 이보다 가까우면 검색 결과가 바뀔 수 있음
+    min_similarity: float
+    created_at: float = field(default_factory=time.time)
+
+
+def campus_scope(campus_filter: Optional[Campus]) -> str:
+    return campus_filter.value if campus_filter else Campus.ALL.value
+
+
+class SemanticAnswerCache:
+    """질의 임베딩 유사도로 이전 답변을 재사용하는 캐시 (캠퍼스 필터 단위로 분리).
+
+    공지사항이 추가/변경되면 그 공지를 근거로 한 답변과, 새 청크가 검색 결과에 들어올 수 있는 답변을 무효화합니다.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.95, ttl_seconds: float = 600.0, max_entries: int = 512):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: List[AnswerCacheEntry] = []
+
+        # 무효화가 일어날 때마다 증가. 검색 도중 공지사항이 바뀐 답변이 저장되는 것을 막는 데 사용
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, query_embedding: List[float], campus_filter: Optional[Campus]) -> Optional[Dict[str, Any]]:
+        scope = campus_scope(campus_filter)
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        with self._lock:
+            self._expire()
+            candidates = [entry for entry in self._entries if entry.campus_scope == scope]
+            if candidates:
+                indices, scores = top_k_similar(query, np.stack([entry.embedding for entry in candidates]), 1)
+                if scores[0] >= self.similarity_threshold:
+                    self.hits += 1
+                    return copy.deepcopy(candidates[int(indices[0])].response)
+
+            self.misses += 1
+            return None
+
+    def store(
+            self,
+            query_embedding: List[float],
+            campus_filter: Optional[Campus],
+            response: Dict[str, Any],
+            notice_ids: Set[str],
+            min_similarity: float,
+            generation: Optional[int] = None
+    ) -> bool:
+        """답변을 저장합니다. generation이 주어졌고 그 사이 무효화가 있었다면 저장하지 않습니다."""
+        entry = AnswerCacheEntry(
+            embedding=np.asarray(query_embedding, dtype=np.float32),
+            campus_scope=campus_scope(campus_filter),
+            response=copy.deepcopy(response),
+            notice_ids=set(notice_ids),
+            min_similarity=min_similarity
+        )
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._expire()
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                # 가장 오래된 항목부터 제거
+                del self._entries[:len(self._entries) - self.max_entries]
+        return True
+
+    def invalidate(
+            self,
+            notice_ids: Set[str],
+            campuses: Set[str],
+            chunk_embeddings: Optional[List[List[float]]] = None
+    ) -> int:
+        """변경된 공지사항의 영향을 받을 수 있는 항목을 제거하고 제거한 개수를 반환합니다.
+
+        chunk_embeddings가 없으면(삭제 등) notice_id로 참조하는 항목만 제거합니다.
+        """
+        with self._lock:
+            self.generation += 1
+
+            # 모든 항목과 새 청크의 유사도를 행렬 곱 한 번으로 계산
+            best_scores = None
+            if chunk_embeddings and self._entries:
+                best_scores = cosine_matrix(
+                    np.stack([entry.embedding for entry in self._entries]), chunk_embeddings
+                ).max(axis=1)
+
+            def affected(i: int, entry: AnswerCacheEntry) -> bool:
+                if entry.notice_ids & notice_ids:
+                    return True
+                if best_scores is None:
+                    return False
+                # 캠퍼스 필터가 걸린 답변은 ALL 공지와 같은 캠퍼스 공지에만 영향을 받음
+                if entry.campus_scope != Campus.ALL.value and not campuses & {Campus.ALL.value, entry.campus_scope}:
+                    return False
+                return float(best_scores[i]) >= entry.min_similarity
+
+            remaining = [entry for i, entry in enumerate(self._entries) if not affected(i, entry)]
+            removed = len(self._entries) - len(remaining)
+            self._entries = remaining
+            self.invalidations += removed
+
+        return removed
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        self._entries = [entry for entry in self._entries if entry.created_at >= cutoff]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+
+def create_answer_cache_from_env() -> Optional[SemanticAnswerCache]:
+    """환경 변수 설정에 따라 답변 캐시를 생성합니다. ANSWER_CACHE=off 이면 비활성화합니다."""
+    load_env()
+    if os.getenv("ANSWER_CACHE", "on").lower() in ("off", "false", "0"):
+        return None
+
+    return SemanticAnswerCache(
+        similarity_threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95")),
+        ttl_seconds=float(os.getenv("ANSWER_CACHE_TTL", "600")),
+        max_entries=int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "512"))
+    )
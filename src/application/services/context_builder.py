@@ -0,0 +1,186 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+
+class _CharEncoding:
+    """tiktoken 인코딩을 불러올 수 없을 때 쓰는 대체 인코딩. 한 글자를 한 토큰으로 보수적으로 셉니다."""
+
+    name = "char"
+
+    def encode(self, text: str) -> List[str]:
+        return list(text)
+
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+
+def load_encoding(model_name: str):
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # 오프라인 등으로 BPE 파일을 받을 수 없는 경우
+        logger.warning(f"tiktoken 인코딩을 불러오지 못해 글자 수로 토큰을 셉니다: {e}")
+        return _CharEncoding()
+
+
+@dataclass
+class NoticeSection:
+    """한 공지사항에서 검색된 청크들을 이어 붙인 컨텍스트 조각."""
+    notice_id: Optional[str]
+    metadata: Dict[str, Any]
+    score: float
+    content: str
+    chunk_count: int
+
+
+@dataclass
+class PackedContext:
+    context: str
+    sections: List[NoticeSection]
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+class ContextBuilder:
+    """검색 결과를 토큰 예산 안에 맞춰 프롬프트 컨텍스트로 만듭니다.
+
+    같은 notice_id의 청크는 chunk_index 순서로 합치면서 인접 청크의 겹치는 부분을 제거하고,
+    공지사항은 검색기가 돌려준 순서(가장 앞선 청크 기준)를 그대로 따릅니다.
+    하이브리드(RRF)/MMR 검색의 순서는 벡터 거리와 다르므로 거리로 다시 정렬하지 않습니다.
+    """
+
+    def __init__(
+            self,
+            max_tokens: int = 3000,
+            model_name: str = "gpt-4o-mini",
+            max_overlap_chars: int = 200,
+            min_overlap_chars: int = 8,
+            min_section_tokens: int = 50
+    ):
+        self.max_tokens = max_tokens
+        self.max_overlap_chars = max_overlap_chars
+        self.min_overlap_chars = min_overlap_chars
+        self.min_section_tokens = min_section_tokens
+        self.encoding = load_encoding(model_name)
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+
+    def build(self, results: List[Tuple[Document, float]]) -> PackedContext:
+        sections = self._merge_by_notice(results)
+
+        parts = []
+        packed_sections = []
+        used_tokens = 0
+        truncated = False
+
+        for section in sections:
+            text = format_section(len(packed_sections) + 1, section.metadata, section.content)
+            tokens = self.count_tokens(text)
+            remaining = self.max_tokens - used_tokens - (self.count_tokens("\n\n") if parts else 0)
+
+            if tokens > remaining:
+                # 남은 예산이 충분하면 내용을 잘라서라도 넣고, 이후 공지사항은 버림
+                if remaining < self.min_section_tokens:
+                    break
+                text = self._truncate(text, remaining)
+                tokens = self.count_tokens(text)
+                truncated = True
+
+            parts.append(text)
+            packed_sections.append(section)
+            used_tokens = self.count_tokens("\n\n".join(parts))
+            if truncated:
+                break
+
+        context = "\n\n".join(parts)
+        original_tokens = self.count_tokens(naive_context([doc for doc, _ in results]))
+        context_tokens = self.count_tokens(context)
+
+        return PackedContext(
+            context=context,
+            sections=packed_sections,
+            stats={
+                "original_tokens": original_tokens,
+                "context_tokens": context_tokens,
+                "saved_tokens": original_tokens - context_tokens,
+                "max_tokens": self.max_tokens,
+                "retrieved_chunks": len(results),
+                "notices": len(packed_sections),
+                "dropped_notices": len(sections) - len(packed_sections),
+                "truncated": truncated,
+                "tokenizer": self.encoding.name
+            }
+        )
+
+    def _merge_by_notice(self, results: List[Tuple[Document, float]]) -> List[NoticeSection]:
+        # dict는 삽입 순서를 유지하므로 공지사항은 처음 나온 순위 순으로 남음
+        groups: Dict[str, List[Tuple[int, Document, float]]] = {}
+        for rank, (doc, score) in enumerate(results):
+            # notice_id가 없는 문서는 합치지 않고 그대로 둠
+            key = doc.metadata.get("notice_id") or f"__rank_{rank}"
+            groups.setdefault(key, []).append((rank, doc, score))
+
+        sections = []
+        for key, items in groups.items():
+            items.sort(key=lambda item: (item[1].metadata.get("chunk_index", item[0]), item[0]))
+
+            content = ""
+            previous_index = None
+            seen = set()
+            for rank, doc, _ in items:
+                chunk_index = doc.metadata.get("chunk_index")
+                if doc.page_content in seen:
+                    continue
+                seen.add(doc.page_content)
+
+                if not content:
+                    content = doc.page_content
+                elif chunk_index is not None and previous_index is not None and chunk_index == previous_index + 1:
+                    content = self._join_adjacent(content, doc.page_content)
+                else:
+                    content = f"{content}\n...\n{doc.page_content}"
+                previous_index = chunk_index
+
+            first_doc = min(items, key=lambda item: item[0])[1]
+            sections.append(NoticeSection(
+                notice_id=first_doc.metadata.get("notice_id"),
+                metadata=first_doc.metadata,
+                score=min(score for _, _, score in items),
+                content=content,
+                chunk_count=len(items)
+            ))
+
+        return sections
+
+    def _join_adjacent(self, previous: str, following: str) -> str:
+        """앞 청크의 끝과 뒤 청크의 시작이 겹치는 가장 긴 부분을 찾아 한 번만 남깁니다."""
+        limit = min(len(previous), len(following), self.max_overlap_chars)
+        for size in range(limit, self.min_overlap_chars - 1, -1):
+            if previous.endswith(following[:size]):
+                return previous + following[size:]
+        return f"{previous}\n{following}"
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode(text)
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+def format_section(number: int, metadata: Dict[str, Any], content: str) -> str:
+    return f"문서 {number}:\n제목: {metadata.get('title', 'N/A')}\n내용: {content}"
+
+
+def naive_context(documents: List[Document]) -> str:
+    """청크를 합치지 않고 그대로 이어 붙인 기존 방식의 컨텍스트 (절감량 비교용)."""
+    return "\n\n".join(
+        format_section(i + 1, doc.metadata, doc.page_content)
+        for i, doc in enumerate(documents)
+    )
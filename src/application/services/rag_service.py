@@ -1,19 +1,106 @@
-from typing import List, Optional, Dict, Any
-from langchain.schema import Document
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema.runnable import RunnablePassthrough
-from langchain.schema.output_parser import StrOutputParser
-
-from ...infrastructure.vector_store.chroma_store import NoticeVectorStore
+import asyncio
+import contextlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from langchain_core.documents import Document
+
+from .context_builder import ContextBuilder
+from .answer_cache import SemanticAnswerCache, create_answer_cache_from_env
+from ...infrastructure.vector_store.chroma_store import NoticeChange, NoticeVectorStore, distance_to_similarity
+from ...infrastructure.vector_store.metadata_index import MetadataFilter
 from ...domain.models import Campus
+from ...shared.utils.env import load_env
+
+
+@dataclass
+class PendingAnswer:
+    """검색이 끝나고 LLM 답변만 남은 요청."""
+    query: str
+    campus_filter: Optional[Campus]
+    k: int
+    results: List[Tuple[Document, float]]
+    context: str
+    sources: List[Dict[str, Any]]
+    generation: Optional[int] = None
+    context_stats: Dict[str, Any] = field(default_factory=dict)
+    retrieval: Dict[str, Any] = field(default_factory=dict)
 
 
 class NoticeRAGSystem:
 
-    def __init__(self, vector_store: NoticeVectorStore, model_name: str = "gpt-4o-mini", temperature: float = 0.1):
+    def __init__(
+            self,
+            vector_store: NoticeVectorStore,
+            model_name: str = "gpt-4o-mini",
+            temperature: float = 0.1,
+            answer_cache: Optional[SemanticAnswerCache] = None,
+            use_answer_cache: bool = True,
+            context_max_tokens: int = 3000,
+            relevance_threshold: Optional[float] = None,
+            relevance_margin: Optional[float] = None,
+            retrieval_mode: Optional[str] = None,
+            keyword_min_coverage: float = 0.5,
+            mmr_fetch_k: Optional[int] = None,
+            mmr_lambda: Optional[float] = None,
+            max_chunks_per_notice: Optional[int] = None,
+            llm: Optional[Any] = None
+    ):
+        load_env()
         self.vector_store = vector_store
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
+        # OpenAI 클라이언트(langchain_openai)는 import 비용이 커서 첫 답변 생성이나 warmup() 때 만듦
+        self.model_name = model_name
+        self.temperature = temperature
+        self._llm = llm
+        self._chain = None
+        self._llm_lock = threading.Lock()
+        # 비동기 경로의 LLM 동시 호출 제한 (API 서버가 이벤트 루프에서 asyncio.Semaphore를 넣어 줌). 캐시 적중/컷오프 응답은 제한 없이 바로 반환
+        self.llm_semaphore: Optional[asyncio.Semaphore] = None
+        # 검색된 청크를 공지사항 단위로 합치고 토큰 예산 안에서 컨텍스트를 구성
+        self.context_builder = ContextBuilder(max_tokens=context_max_tokens, model_name=model_name)
+
+        # 코사인 유사도 기준 컷오프. 통과한 문서가 없으면 LLM을 호출하지 않고 바로 "찾을 수 없음" 응답
+        # margin: 최고 점수 문서보다 이만큼 이상 떨어지는 문서는 k 안에 들어도 버림 (적응형 k)
+        self.relevance_threshold = relevance_threshold if relevance_threshold is not None else float(
+            os.getenv("RAG_RELEVANCE_THRESHOLD", "0.35")
+        )
+        self.relevance_margin = relevance_margin if relevance_margin is not None else float(
+            os.getenv("RAG_RELEVANCE_MARGIN", "0.2")
+        )
+        self.retrieval_stats = {"answered": 0, "short_circuited": 0}
+        # 배치 답변은 여러 스레드에서 통계를 올리므로 카운터 갱신/조회를 잠금으로 보호
+        self._stats_lock = threading.Lock()
+
+        # vector: 벡터 검색만 / hybrid: 벡터 + BM25 키워드 검색을 RRF로 결합
+        # mmr: 후보를 넓게 가져와 같은 공지사항의 겹치는 청크가 상위를 채우지 않도록 MMR로 다시 고름
+        self.retrieval_mode = (retrieval_mode or os.getenv("RAG_RETRIEVAL_MODE", "vector")).lower()
+        if self.retrieval_mode == "hybrid" and not hasattr(vector_store, "hybrid_search"):
+            print("⚠️  이 벡터 저장소는 하이브리드 검색을 지원하지 않아 벡터 검색만 사용합니다")
+            self.retrieval_mode = "vector"
+        if self.retrieval_mode == "mmr" and not hasattr(vector_store, "max_marginal_relevance_search_with_score"):
+            print("⚠️  이 벡터 저장소는 MMR 검색을 지원하지 않아 벡터 검색만 사용합니다")
+            self.retrieval_mode = "vector"
+        self.mmr_fetch_k = mmr_fetch_k if mmr_fetch_k is not None else int(os.getenv("RAG_MMR_FETCH_K", "20"))
+        self.mmr_lambda = mmr_lambda if mmr_lambda is not None else float(os.getenv("RAG_MMR_LAMBDA", "0.5"))
+        # 공지사항당 최대 청크 수 (0이면 제한 없음)
+        if max_chunks_per_notice is None:
+            max_chunks_per_notice = int(os.getenv("RAG_MAX_CHUNKS_PER_NOTICE", "2"))
+        self.max_chunks_per_notice = max_chunks_per_notice or None
+        # 하이브리드 모드에서 질의어를 이 비율 이상 포함한 키워드 검색 결과는 벡터 유사도가 낮아도 컷오프를 통과
+        self.keyword_min_coverage = keyword_min_coverage
+
+        # 비슷한 질문에는 LLM을 다시 호출하지 않고 이전 답변을 재사용. 공지사항이 바뀌면 저장소 알림으로 무효화
+        if answer_cache is None and use_answer_cache:
+            answer_cache = create_answer_cache_from_env()
+        self.answer_cache = answer_cache
+        if self.answer_cache is not None:
+            self.vector_store.add_change_listener(self._on_notices_changed)
+
+        # 프롬프트/러너블 모듈은 langsmith까지 불러와 import가 무거우므로 생성 시점에 import
+        from langchain_core.prompts import ChatPromptTemplate
 
         self.prompt_template = ChatPromptTemplate.from_messages([
             ("system", """당신은 공주대학교 학생들을 위한 AI 어시스턴트입니다.
@@ -31,72 +118,470 @@ class NoticeRAGSystem:
             ("human", "{question}")
         ])
 
+    @property
+    def llm(self):
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    from langchain_openai import ChatOpenAI
+                    self._llm = ChatOpenAI(model=self.model_name, temperature=self.temperature)
+        return self._llm
+
+    @property
+    def chain(self):
+        # 체인은 한 번만 구성해 재사용. 입력은 {"context": ..., "question": ...}
+        if self._chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            self._chain = self.prompt_template | self.llm | StrOutputParser()
+        return self._chain
+
+    def warmup(self) -> float:
+        """임베딩 모델과 LLM 클라이언트를 미리 준비합니다. 서빙 프로세스는 ready 전에 호출합니다. 걸린 시간(초)을 반환합니다."""
+        start = time.perf_counter()
+        if hasattr(self.vector_store, "warmup"):
+            self.vector_store.warmup()
+        # 키워드 인덱스(Kiwi 분석기)는 하이브리드 검색을 쓸 때만 준비
+        if self.retrieval_mode == "hybrid" and hasattr(self.vector_store, "prepare_keyword_index"):
+            self.vector_store.prepare_keyword_index()
+        _ = self.chain
+        return time.perf_counter() - start
+
     def search_documents(
             self,
             query: str,
             k: int = 5,
-            campus_filter: Optional[Campus] = None
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
     ) -> List[Document]:
-        return self.vector_store.similarity_search(
-            query, k=k, campus_filter=campus_filter
-        )
+        """metadata_filter로 카테고리/게시일 조건을 함께 걸면 저장소의 메타데이터 인덱스로 후보를 좁혀 벡터 검색합니다."""
+        return [doc for doc, _ in self.search_documents_with_scores(query, k, campus_filter, metadata_filter)]
 
-    def generate_answer(
+    def search_documents_with_scores(
             self,
             query: str,
+            k: int = 5,
             campus_filter: Optional[Campus] = None,
-            k: int = 5
-    ) -> Dict[str, Any]:
+            metadata_filter: Optional[MetadataFilter] = None
+    ) -> List[Tuple[Document, float]]:
+        """search_documents와 같지만 (문서, 벡터 거리)를 반환합니다. 유사도는 distance_to_similarity로 바꿉니다."""
+        if metadata_filter is not None:
+            return self.vector_store.similarity_search_with_score(
+                query, k=k, campus_filter=campus_filter, metadata_filter=metadata_filter
+            )
+        results, _ = self._retrieve(query, campus_filter, k)
+        return results
+
+    def _retrieve(
+            self,
+            query: str,
+            campus_filter: Optional[Campus],
+            k: int
+    ) -> Tuple[List[Tuple[Document, float]], Dict[str, float]]:
+        if self.retrieval_mode == "hybrid":
+            return self.vector_store.hybrid_search(query, k=k, campus_filter=campus_filter)
+
+        start = time.perf_counter()
+        if self.retrieval_mode == "mmr":
+            results = self.vector_store.max_marginal_relevance_search_with_score(
+                query,
+                k=k,
+                fetch_k=self.mmr_fetch_k,
+                lambda_mult=self.mmr_lambda,
+                campus_filter=campus_filter,
+                max_chunks_per_notice=self.max_chunks_per_notice
+            )
+        else:
+            results = self.vector_store.similarity_search_with_score(query, k=k, campus_filter=campus_filter)
+        return results, {"total_ms": (time.perf_counter() - start) * 1000}
+
+    def _on_notices_changed(self, change: NoticeChange):
+        if change.reset:
+            self.answer_cache.clear()
+            return
+        removed = self.answer_cache.invalidate(change.notice_ids, change.campuses, change.embeddings)
+        if removed:
+            print(f"🧹 답변 캐시 무효화: {removed}개")
+
+    def get_answer_cache_stats(self) -> Dict[str, float]:
+        if self.answer_cache is None:
+            return {}
+        return self.answer_cache.stats()
+
+    def _lookup_cached_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        if self.answer_cache is None:
+            return None, None
+
+        generation = self.answer_cache.generation
+        cached = self.answer_cache.lookup(self.vector_store.embed_query(query), campus_filter)
+        if cached is not None:
+            cached["cache_hit"] = True
+        return cached, generation
 
-        relevant_docs = self.search_documents(query, k=k, campus_filter=campus_filter)
+    def _prepare_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus],
+            k: int
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[PendingAnswer]]:
+        """캐시 조회와 검색까지 LLM 호출 전 단계를 수행합니다. 바로 돌려줄 응답이 있으면 첫 번째 값으로 반환합니다."""
+        cached, generation = self._lookup_cached_answer(query, campus_filter)
+        if cached is not None:
+            return cached, None
+
+        results, timings = self._retrieve(query, campus_filter, k)
+        return self._pending_from_results(query, campus_filter, k, results, generation, timings)
+
+    def _pending_from_results(
+            self,
+            query: str,
+            campus_filter: Optional[Campus],
+            k: int,
+            results: List[Tuple[Document, float]],
+            generation: Optional[int],
+            timings: Optional[Dict[str, float]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[PendingAnswer]]:
+        relevant, retrieval = self._apply_relevance_cutoff(results, k)
+        retrieval["mode"] = self.retrieval_mode
+        if timings:
+            retrieval["latency_ms"] = {stage: round(value, 2) for stage, value in timings.items()}
 
-        if not relevant_docs:
-            return {
+        if not relevant:
+            self._count_retrieval("short_circuited")
+            if results:
+                print(
+                    f"⏭️  관련 문서 없음 (최고 유사도 {retrieval['best_similarity']:.3f} < "
+                    f"{self.relevance_threshold}), LLM 호출 생략"
+                )
+            response = {
                 "answer": "죄송합니다. 관련된 정보를 찾을 수 없습니다.",
                 "sources": [],
-                "campus_filter": campus_filter.value if campus_filter else "ALL"
+                "campus_filter": campus_filter.value if campus_filter else "ALL",
+                "retrieval": retrieval
             }
+            self._store_answer(query, campus_filter, k, results, response, set(), generation)
+            response["cache_hit"] = False
+            return response, None
 
-        context = "\n\n".join([
-            f"문서 {i + 1}:\n제목: {doc.metadata.get('title', 'N/A')}\n내용: {doc.page_content}"
-            for i, doc in enumerate(relevant_docs)
-        ])
-
-        chain = (
-                {"context": RunnablePassthrough(), "question": RunnablePassthrough()}
-                | self.prompt_template
-                | self.llm
-                | StrOutputParser()
-        )
-
-        answer = chain.invoke({"context": context, "question": query})
+        self._count_retrieval("answered")
+        packed = self.context_builder.build(relevant)
 
+        # 출처는 실제로 컨텍스트에 들어간 공지사항 기준 (검색 순위 순)
         sources = [
             {
-                "title": doc.metadata.get("title", "N/A"),
-                "url": doc.metadata.get("url", "N/A"),
-                "campus": doc.metadata.get("campus", "N/A"),
-                "category": doc.metadata.get("category", "N/A"),
-                "date": doc.metadata.get("date", "N/A")
+                "notice_id": section.metadata.get("notice_id", "N/A"),
+                "title": section.metadata.get("title", "N/A"),
+                "url": section.metadata.get("url", "N/A"),
+                "campus": section.metadata.get("campus", "N/A"),
+                "category": section.metadata.get("category", "N/A"),
+                "date": section.metadata.get("date", "N/A")
             }
-            for doc in relevant_docs
+            for section in packed.sections
         ]
 
+        return None, PendingAnswer(
+            query=query,
+            campus_filter=campus_filter,
+            k=k,
+            results=results,
+            context=packed.context,
+            sources=sources,
+            generation=generation,
+            context_stats=packed.stats,
+            retrieval=retrieval
+        )
+
+    def _apply_relevance_cutoff(
+            self,
+            results: List[Tuple[Document, float]],
+            k: int
+    ) -> Tuple[List[Tuple[Document, float]], Dict[str, Any]]:
+        """임계값과 최고 점수 대비 margin을 통과한 문서만 남기고, 판단 근거를 함께 반환합니다."""
+        similarities = [distance_to_similarity(distance) for _, distance in results]
+        best = max(similarities) if similarities else None
+
+        cutoff = self.relevance_threshold
+        if best is not None and self.relevance_margin is not None:
+            cutoff = max(cutoff, best - self.relevance_margin)
+
+        relevant = [
+            (doc, distance) for (doc, distance), similarity in zip(results, similarities)
+            if similarity >= cutoff or doc.metadata.get("keyword_coverage", 0.0) >= self.keyword_min_coverage
+        ]
+        retrieval = {
+            "decision": "answer" if relevant else "no_relevant_documents",
+            "threshold": self.relevance_threshold,
+            "cutoff": round(cutoff, 4),
+            "best_similarity": round(best, 4) if best is not None else None,
+            "similarities": [round(similarity, 4) for similarity in similarities],
+            "requested_k": k,
+            "used_k": len(relevant)
+        }
+        return relevant, retrieval
+
+    def _store_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus],
+            k: int,
+            results: List[Tuple[Document, float]],
+            response: Dict[str, Any],
+            notice_ids: set,
+            generation: Optional[int]
+    ):
+        if self.answer_cache is None:
+            return
+
+        # 새 청크는 검색 결과(k개가 찼다면 가장 낮은 점수 이상)에 들고 임계값도 넘어야 답변을 바꿀 수 있음
+        min_similarity = self.relevance_threshold
+        if len(results) >= k:
+            min_similarity = max(min_similarity, min(distance_to_similarity(score) for _, score in results))
+        if self.retrieval_mode == "hybrid":
+            # 키워드 검색은 벡터 유사도와 무관하게 결과에 들어올 수 있으므로 같은 캠퍼스의 변경은 모두 반영
+            min_similarity = -1.0
+
+        self.answer_cache.store(
+            self.vector_store.embed_query(query),
+            campus_filter,
+            response,
+            notice_ids,
+            min_similarity,
+            generation=generation
+        )
+
+    def _count_retrieval(self, decision: str):
+        with self._stats_lock:
+            self.retrieval_stats[decision] += 1
+
+    def get_retrieval_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.retrieval_stats)
+        total = stats["answered"] + stats["short_circuited"]
         return {
+            **stats,
+            "short_circuit_rate": stats["short_circuited"] / total if total else 0.0,
+            "threshold": self.relevance_threshold,
+            "margin": self.relevance_margin
+        }
+
+    def _finish_answer(self, pending: PendingAnswer, answer: str) -> Dict[str, Any]:
+        response = {
             "answer": answer,
-            "sources": sources,
-            "campus_filter": campus_filter.value if campus_filter else "ALL"
+            "sources": pending.sources,
+            "campus_filter": pending.campus_filter.value if pending.campus_filter else "ALL",
+            "context_stats": pending.context_stats,
+            "retrieval": pending.retrieval
         }
 
-    def chat(self, query: str, campus: Optional[str] = None) -> Dict[str, Any]:
-        campus_filter = None
-        if campus:
+        self._store_answer(
+            pending.query,
+            pending.campus_filter,
+            pending.k,
+            pending.results,
+            response,
+            {doc.metadata["notice_id"] for doc, _ in pending.results if doc.metadata.get("notice_id")},
+            pending.generation
+        )
+
+        response["cache_hit"] = False
+        return response
+
+    def generate_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus] = None,
+            k: int = 5
+    ) -> Dict[str, Any]:
+
+        ready, pending = self._prepare_answer(query, campus_filter, k)
+        if ready is not None:
+            return ready
+
+        answer = self.chain.invoke({"context": pending.context, "question": query})
+        return self._finish_answer(pending, answer)
+
+    @contextlib.asynccontextmanager
+    async def _llm_slot(self):
+        if self.llm_semaphore is None:
+            yield
+            return
+        async with self.llm_semaphore:
+            yield
+
+    async def agenerate_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus] = None,
+            k: int = 5
+    ) -> Dict[str, Any]:
+        """generate_answer의 비동기 버전. 임베딩/검색은 스레드에서, LLM 호출은 ainvoke로 수행합니다."""
+        ready, pending = await asyncio.to_thread(self._prepare_answer, query, campus_filter, k)
+        if ready is not None:
+            return ready
+
+        async with self._llm_slot():
+            answer = await self.chain.ainvoke({"context": pending.context, "question": query})
+        return self._finish_answer(pending, answer)
+
+    async def astream_answer(
+            self,
+            query: str,
+            campus_filter: Optional[Campus] = None,
+            k: int = 5
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """답변을 토큰 단위로 스트리밍합니다.
+
+        이벤트 순서: sources(출처) → token(여러 번) → done(전체 응답). 캐시 적중 시 token은 한 번에 전체 답변입니다.
+        """
+        ready, pending = await asyncio.to_thread(self._prepare_answer, query, campus_filter, k)
+        if ready is not None:
+            yield {
+                "type": "sources",
+                "sources": ready["sources"],
+                "campus_filter": ready["campus_filter"],
+                "cache_hit": ready["cache_hit"]
+            }
+            yield {"type": "token", "content": ready["answer"]}
+            yield {"type": "done", "response": ready}
+            return
+
+        yield {
+            "type": "sources",
+            "sources": pending.sources,
+            "campus_filter": pending.campus_filter.value if pending.campus_filter else "ALL",
+            "cache_hit": False
+        }
+
+        tokens = []
+        async with self._llm_slot():
+            async for token in self.chain.astream({"context": pending.context, "question": query}):
+                tokens.append(token)
+                yield {"type": "token", "content": token}
+
+        # 스트림이 끝까지 완료된 경우에만 캐시에 저장됨
+        yield {"type": "done", "response": self._finish_answer(pending, "".join(tokens))}
+
+    def generate_answers_batch(
+            self,
+            queries: List[str],
+            campus_filters: Optional[List[Optional[Campus]]] = None,
+            max_concurrency: int = 4,
+            k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """여러 질문에 한꺼번에 답변합니다 (FAQ 사전 생성, 평가 등).
+
+        질의 임베딩과 벡터 검색은 배치로, 하이브리드/MMR 검색과 LLM 호출은 최대 max_concurrency개씩 동시에 수행합니다.
+        결과는 입력 순서와 같고, 실패한 항목은 예외 대신 error 키를 담은 응답으로 돌려줍니다.
+        """
+        if campus_filters is None:
+            campus_filters = [None] * len(queries)
+        if len(campus_filters) != len(queries):
+            raise ValueError("queries와 campus_filters의 길이가 다릅니다")
+
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        # 질의 임베딩을 한 번에 계산해 두면 아래 캐시 조회와 검색은 캐시된 임베딩을 사용
+        try:
+            self.vector_store.embed_queries(queries)
+        except Exception as e:
+            print(f"⚠️  배치 질의 임베딩 실패, 개별 처리로 진행: {e}")
+
+        generations: Dict[int, Optional[int]] = {}
+        for i, (query, campus_filter) in enumerate(zip(queries, campus_filters)):
             try:
-                campus_filter = Campus(campus.upper())
-            except ValueError:
-                pass
+                cached, generations[i] = self._lookup_cached_answer(query, campus_filter)
+            except Exception as e:
+                responses[i] = self._error_response(campus_filter, e)
+                continue
+            if cached is not None:
+                responses[i] = cached
+
+        to_search = [i for i in range(len(queries)) if responses[i] is None]
+        searched: Dict[int, Tuple[List[Tuple[Document, float]], Dict[str, float]]] = {}
+        if self.retrieval_mode != "vector":
+            # 하이브리드/MMR 검색은 질의마다 키워드 검색과 후처리가 달라 한 번의 쿼리로 묶지 않고,
+            # 배치로 계산해 둔 질의 임베딩을 쓰면서 max_concurrency개씩 동시에 실행
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="batch-retrieve") as pool:
+                futures = {i: pool.submit(self._retrieve, queries[i], campus_filters[i], k) for i in to_search}
+            for i, future in futures.items():
+                try:
+                    searched[i] = future.result()
+                except Exception as e:
+                    responses[i] = self._error_response(campus_filters[i], e)
+        else:
+            try:
+                search_results = self.vector_store.similarity_search_with_score_batch(
+                    [queries[i] for i in to_search], k=k, campus_filters=[campus_filters[i] for i in to_search]
+                )
+                searched = {i: (results, {}) for i, results in zip(to_search, search_results)}
+            except Exception as e:
+                for i in to_search:
+                    responses[i] = self._error_response(campus_filters[i], e)
+
+        pending: Dict[int, PendingAnswer] = {}
+        for i, (results, timings) in searched.items():
+            try:
+                ready, pending_answer = self._pending_from_results(
+                    queries[i], campus_filters[i], k, results, generations.get(i), timings
+                )
+            except Exception as e:
+                responses[i] = self._error_response(campus_filters[i], e)
+                continue
+            if ready is not None:
+                responses[i] = ready
+            else:
+                pending[i] = pending_answer
+
+        if pending:
+            answers = self.chain.batch(
+                [{"context": item.context, "question": item.query} for item in pending.values()],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            for (i, item), answer in zip(pending.items(), answers):
+                if isinstance(answer, Exception):
+                    responses[i] = self._error_response(item.campus_filter, answer)
+                    continue
+                try:
+                    responses[i] = self._finish_answer(item, answer)
+                except Exception as e:
+                    responses[i] = self._error_response(item.campus_filter, e)
+
+        errors = sum(1 for response in responses if response.get("error"))
+        cache_hits = sum(1 for response in responses if response.get("cache_hit"))
+        print(f"📦 배치 답변: {len(queries)}개 (LLM 호출 {len(pending)}개, 캐시 {cache_hits}개, 오류 {errors}개)")
+        return responses
+
+    def _error_response(self, campus_filter: Optional[Campus], error: Exception) -> Dict[str, Any]:
+        return {
+            "answer": None,
+            "sources": [],
+            "campus_filter": campus_filter.value if campus_filter else "ALL",
+            "cache_hit": False,
+            "error": str(error)
+        }
+
+    def chat(self, query: str, campus: Optional[str] = None) -> Dict[str, Any]:
+        return self.generate_answer(query, campus_filter=parse_campus(campus))
+
+    async def achat(self, query: str, campus: Optional[str] = None) -> Dict[str, Any]:
+        return await self.agenerate_answer(query, campus_filter=parse_campus(campus))
+
+    def astream_chat(self, query: str, campus: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        return self.astream_answer(query, campus_filter=parse_campus(campus))
+
 
-        return self.generate_answer(query, campus_filter=campus_filter)
+def parse_campus(campus: Optional[str]) -> Optional[Campus]:
+    """캠퍼스 문자열을 Campus로 바꿉니다. 비어 있거나 알 수 없는 값이면 필터 없이 검색합니다."""
+    if not campus:
+        return None
+    try:
+        return Campus(campus.upper())
+    except ValueError:
+        return None
 
 
 def create_rag_system_with_sample_data() -> NoticeRAGSystem:
@@ -1,12 +1,13 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from dataclasses import dataclass
 
-from langchain.schema import Document
-
 from .campus import Campus
 from .common import NoticeCategory, Category
 
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
 
 @dataclass
 class Notice:
@@ -36,7 +37,10 @@ class NoticeDocument:
     category: Category
     notice_id: Optional[str] = None
 
-    def to_langchain_document(self) -> Document:
+    def to_langchain_document(self) -> "Document":
+        # 도메인 모델만 쓰는 프로세스(브로커 등)가 langchain을 불러오지 않도록 변환할 때 import
+        from langchain_core.documents import Document
+
         page_content = f"제목: {self.title}\n\n{self.content}"
 
         metadata = {
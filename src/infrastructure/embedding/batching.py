@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmbeddingBatcher:
+    """동시에 들어온 질의 임베딩 요청을 모아 embed_many_fn 한 번으로 처리하는 디스패처.
+
+    첫 요청이 도착하면 max_wait_ms 동안(또는 max_batch_size개가 찰 때까지) 다른 요청을 더 모은 뒤
+    한 배치로 임베딩하고, 각 호출자에게 자기 벡터를 돌려줍니다. max_wait_ms=0이면 기다리지 않고
+    모델이 도는 동안 쌓인 요청만 다음 배치로 묶습니다.
+    동기 호출자는 embed(), asyncio 호출자는 await aembed()를 사용합니다.
+    """
+
+    def __init__(
+            self,
+            embed_many_fn: Callable[[List[str]], List[List[float]]],
+            max_batch_size: int = 32,
+            max_wait_ms: float = 2.0
+    ):
+        self.embed_many_fn = embed_many_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.batches = 0
+        self.items = 0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EmbeddingBatcher is closed")
+            if self._thread is None:
+                # 첫 요청 때 워커 시작 (임포트/생성만 한 프로세스에는 스레드를 만들지 않음)
+                self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._thread.start()
+            self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> List[float]:
+        return self.submit(text).result()
+
+    async def aembed(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _collect(self, first: Tuple[str, Future]) -> Tuple[List[Tuple[str, Future]], bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch, stop = self._collect(item)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[str, Future]]) -> None:
+        # asyncio 쪽에서 취소된 요청은 건너뜀
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        # 같은 배치 안의 동일 질의는 한 번만 임베딩
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            embeddings = self.embed_many_fn(texts)
+        except Exception as e:
+            logger.warning("배치 임베딩 실패 (%d건): %s", len(texts), e)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        by_text = dict(zip(texts, embeddings))
+        for text, future in batch:
+            future.set_result(by_text[text])
+
+    def after_fork(self) -> None:
+        """fork된 자식에서 호출합니다. 워커 스레드는 fork되지 않으므로 큐와 스레드를 새로 만듭니다 (첫 요청 때 시작)."""
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+
+    def close(self) -> None:
+        """대기 중인 요청을 모두 처리한 뒤 워커를 종료합니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000
+        }
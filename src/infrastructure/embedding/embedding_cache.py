@@ -0,0 +1,227 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ...shared.utils.env import load_env
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산을 위해 유니코드 정규화 및 공백 정리를 수행합니다."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """(모델명, 정규화 텍스트 해시) 기반의 디스크 임베딩 캐시 (LRU 방출).
+
+    행 수는 저장할 때마다 세지 않고 추정치로 관리합니다. 추정치가 max_entries를 넘거나 recount_interval개를 저장할
+    때마다 실제로 세고, 넘친 만큼에 evict_batch개를 더 지워 가득 찬 상태에서도 매번 COUNT(*)를 하지 않게 합니다.
+    조회 시의 last_used 갱신은 메모리에 모아 두었다가 put_many, touch_flush_size개 누적, touch_flush_interval초 경과 시
+    한 번에 기록하므로 캐시 적중만 있는 조회 경로에서는 SQLite 쓰기가 일어나지 않습니다.
+    """
+
+    def __init__(
+            self,
+            path: str = "./data/embedding_cache/embeddings.sqlite3",
+            max_entries: int = 200_000,
+            recount_interval: int = 1000,
+            touch_flush_size: int = 1000,
+            touch_flush_interval: float = 60.0
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.recount_interval = recount_interval
+        self.touch_flush_size = touch_flush_size
+        self.touch_flush_interval = touch_flush_interval
+        self.evict_batch = max(1, max_entries // 100)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = self._connect()
+        self._inherited_conns: List[sqlite3.Connection] = []
+        self._count = self._row_count()
+        self._since_count = 0
+        # 아직 기록하지 않은 last_used 갱신 (key → 마지막 조회 시각)
+        self._pending_touches: Dict[str, float] = {}
+        self._last_touch_flush = time.time()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)")
+        conn.commit()
+        return conn
+
+    def reopen_after_fork(self) -> None:
+        """fork된 자식 프로세스에서 호출해 새 SQLite 연결을 엽니다.
+
+        부모에게서 물려받은 연결은 자식에서 쓰거나 닫으면 안 되므로(닫을 때 WAL 정리로 파일이 손상될 수 있음) 참조만 남겨 둡니다.
+        """
+        self._inherited_conns.append(self._conn)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._count = self._row_count()
+        self._since_count = 0
+        self._pending_touches = {}
+        self._last_touch_flush = time.time()
+
+    def _row_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """키 목록에 대해 캐시된 임베딩을 한 번에 조회합니다."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+            if found:
+                now = time.time()
+                for key in found:
+                    self._pending_touches[key] = now
+                if (len(self._pending_touches) >= self.touch_flush_size
+                        or now - self._last_touch_flush >= self.touch_flush_interval):
+                    self._flush_touches()
+                    self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        """임베딩을 일괄 저장하고 최대 크기를 넘으면 오래된 항목을 제거합니다."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items.items()
+        ]
+
+        with self._lock:
+            # 방출 순서가 최근 조회를 반영하도록 모아 둔 last_used를 먼저 기록
+            self._flush_touches()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                rows
+            )
+            self._evict(len(rows))
+            self._conn.commit()
+
+    def _flush_touches(self) -> None:
+        """모아 둔 last_used 갱신을 기록합니다. lock을 잡은 상태에서 호출하며, commit은 호출자가 합니다."""
+        if self._pending_touches:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = max(last_used, ?) WHERE key = ?",
+                [(last_used, key) for key, last_used in self._pending_touches.items()]
+            )
+            self._pending_touches = {}
+        self._last_touch_flush = time.time()
+
+    def flush(self) -> None:
+        """모아 둔 last_used 갱신을 디스크에 기록합니다."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+
+    def _evict(self, inserted: int) -> None:
+        # 덮어쓴 키도 새 행으로 세므로 추정치는 실제보다 크거나 같음 (다른 프로세스가 쓴 행은 주기적으로 다시 세어 반영)
+        self._count += inserted
+        self._since_count += inserted
+        if self._count <= self.max_entries and self._since_count < self.recount_interval:
+            return
+
+        self._count = self._row_count()
+        self._since_count = 0
+        if self._count <= self.max_entries:
+            return
+        removed = min(self._count, self._count - self.max_entries + self.evict_batch)
+        self._conn.execute(
+            """
+            DELETE FROM embeddings WHERE key IN (
+                SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?
+            )
+            """,
+            (removed,)
+        )
+        self._count -= removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._pending_touches = {}
+            self._count = 0
+            self._since_count = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            size = self._row_count()
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+
+def create_embedding_cache_from_env() -> Optional[EmbeddingCache]:
+    """환경 변수 설정에 따라 임베딩 캐시를 생성합니다. EMBEDDING_CACHE=off 이면 비활성화합니다."""
+    load_env()
+    if os.getenv("EMBEDDING_CACHE", "on").lower() in ("off", "false", "0"):
+        return None
+
+    return EmbeddingCache(
+        path=os.getenv("EMBEDDING_CACHE_PATH", "./data/embedding_cache/embeddings.sqlite3"),
+        max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+    )
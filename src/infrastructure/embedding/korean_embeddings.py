@@ -1,40 +1,211 @@
+import asyncio
 import os
-from typing import List, Optional
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.schema import Document
-import numpy as np
-from dotenv import load_dotenv
+import threading
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-load_dotenv()
+from .batching import EmbeddingBatcher
+from .embedding_cache import EmbeddingCache, create_embedding_cache_from_env, make_cache_key
+from .similarity import cosine_similarity
+from ...shared.utils.env import load_env
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
 
 
 class KoreanEmbeddings:
+    """KoSimCSE 임베딩. 모델은 생성 시점이 아니라 첫 임베딩(또는 warmup()) 때 불러옵니다.
+
+    캐시만으로 답할 수 있는 요청은 모델을 올리지 않으므로, 브로커/통계용 프로세스는 모델 메모리를 쓰지 않습니다.
+    """
 
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(
+            self,
+            model_name: Optional[str] = None,
+            cache: Optional[EmbeddingCache] = None,
+            use_cache: bool = True,
+            backend: Optional[str] = None,
+            batch_size: Optional[int] = None,
+            num_threads: Optional[int] = None,
+            quantize: Optional[bool] = None,
+            query_batching: Optional[bool] = None
+    ):
+        load_env()
         self.model_name = model_name or os.getenv(
             "EMBEDDING_MODEL",
             "BM-K/KoSimCSE-roberta-multitask"
         )
+        self.backend = (backend or os.getenv("EMBEDDING_BACKEND", "huggingface")).lower()
+        if self.backend not in ("huggingface", "onnx"):
+            print(f"⚠️ 지원하지 않는 임베딩 백엔드 '{self.backend}', huggingface 사용")
+            self.backend = "huggingface"
+        self.batch_size = batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+        if num_threads is None and os.getenv("EMBEDDING_THREADS"):
+            num_threads = int(os.getenv("EMBEDDING_THREADS"))
+        self.num_threads = num_threads
+        if quantize is None:
+            quantize = os.getenv("EMBEDDING_ONNX_QUANTIZE", "off").lower() in ("on", "true", "1")
+        self.quantize = quantize and self.backend == "onnx"
+
+        # int8 벡터는 fp32와 미세하게 다르므로 캐시 키를 분리
+        if self.backend == "onnx":
+            self.cache_namespace = f"{self.model_name}@onnx{'-int8' if self.quantize else ''}"
+        else:
+            self.cache_namespace = self.model_name
+
+        self._model: Any = None
+        self._model_lock = threading.Lock()
+        self._dimension: Optional[int] = None
+
+        if cache is None and use_cache:
+            cache = create_embedding_cache_from_env()
+        self.cache = cache
+
+        # 동시에 들어온 질의를 모아 한 번의 forward로 처리 (여러 학생이 동시에 질문할 때 호출당 오버헤드 절감)
+        if query_batching is None:
+            query_batching = os.getenv("EMBEDDING_QUERY_BATCHING", "off").lower() in ("on", "true", "1")
+        self.batcher: Optional[EmbeddingBatcher] = None
+        if query_batching:
+            self.batcher = EmbeddingBatcher(
+                lambda texts: self.embeddings.embed_documents(texts),
+                max_batch_size=int(os.getenv("EMBEDDING_QUERY_MAX_BATCH", "32")),
+                max_wait_ms=float(os.getenv("EMBEDDING_QUERY_MAX_WAIT_MS", "2"))
+            )
+
+    @property
+    def embeddings(self) -> Any:
+        """백엔드 모델. 처음 접근할 때 한 번만 불러옵니다."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
 
-        self.embeddings = HuggingFaceEmbeddings(
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    def _load_model(self) -> Any:
+        if self.backend == "onnx":
+            from .onnx_encoder import OnnxSentenceEncoder
+
+            return OnnxSentenceEncoder(
+                model_name=self.model_name,
+                quantize=self.quantize,
+                batch_size=self.batch_size,
+                num_threads=self.num_threads,
+                cache_dir=os.getenv("EMBEDDING_ONNX_DIR", "./data/onnx_models")
+            )
+
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+
+        if self.num_threads:
+            import torch
+            torch.set_num_threads(self.num_threads)
+        return HuggingFaceEmbeddings(
             model_name=self.model_name,
             model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
+            encode_kwargs={'normalize_embeddings': True, 'batch_size': self.batch_size}
         )
 
+    def load(self) -> None:
+        """추론 없이 모델만 불러옵니다. pre-fork 서빙에서 부모가 가중치를 올려 두고 워커와 copy-on-write로 공유할 때 사용합니다.
+
+        부모에서 추론을 하면 OpenMP 스레드 풀이 만들어져 fork된 자식에서 멈출 수 있으므로 warmup()은 워커에서 호출합니다.
+        ONNX Runtime 세션은 스레드 풀을 세션과 함께 만들어 fork 후에는 쓸 수 없으므로, onnx 백엔드는 각 워커가 직접 불러옵니다.
+        """
+        if self.backend == "onnx":
+            return
+        _ = self.embeddings
+
+    def after_fork(self, num_threads: Optional[int] = None) -> None:
+        """fork된 워커에서 호출합니다. 디스크 캐시 연결과 배칭 스레드를 새로 만들고 워커별 추론 스레드 수를 맞춥니다."""
+        if self.cache is not None:
+            self.cache.reopen_after_fork()
+        if self.batcher is not None:
+            self.batcher.after_fork()
+        if num_threads and self.backend == "huggingface":
+            import torch
+            torch.set_num_threads(num_threads)
+
+    def warmup(self) -> float:
+        """모델을 불러오고 한 번 추론해 첫 요청 지연을 없앱니다. 서빙 프로세스는 ready 전에 호출합니다. 걸린 시간(초)을 반환합니다."""
+        start = time.perf_counter()
+        vector = self.embeddings.embed_query("공주대학교 공지사항")
+        self._dimension = len(vector)
+        elapsed = time.perf_counter() - start
+        print(f"🔥 임베딩 모델 준비 완료: {self.model_name} ({self.backend}, {elapsed:.1f}s)")
+        return elapsed
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        return self.embeddings.embed_documents(texts)
+        # 캐시 키만 정규화 텍스트로 만들고, 모델에는 줄바꿈/문단 구분이 살아 있는 원문을 넣음
+        if self.cache is None:
+            return self.embeddings.embed_documents(texts)
+
+        keys = [make_cache_key(self.cache_namespace, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # 캐시에 없는 텍스트만 중복 없이 모아서 한 번에 임베딩
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            computed = self.embeddings.embed_documents(list(missing.values()))
+            new_entries = dict(zip(missing.keys(), computed))
+            self.cache.put_many(new_entries)
+            cached.update(new_entries)
+
+        return [cached[key] for key in keys]
+
+    def _lookup_query(self, text: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        if self.cache is None:
+            return None, None
+        key = make_cache_key(self.cache_namespace, text)
+        return key, self.cache.get_many([key]).get(key)
+
+    def _store_query(self, key: Optional[str], embedding: List[float]) -> None:
+        if key is not None:
+            self.cache.put_many({key: embedding})
 
     def embed_query(self, text: str) -> List[float]:
-        return self.embeddings.embed_query(text)
+        key, embedding = self._lookup_query(text)
+        if embedding is not None:
+            return embedding
+
+        if self.batcher is not None:
+            embedding = self.batcher.embed(text)
+        else:
+            embedding = self.embeddings.embed_query(text)
+        self._store_query(key, embedding)
+        return embedding
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """asyncio 호출자용 embed_query. 배칭이 꺼져 있으면 기본 executor 스레드에서 실행합니다."""
+        if self.batcher is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self.embed_query, text)
+
+        key, embedding = self._lookup_query(text)
+        if embedding is not None:
+            return embedding
+        embedding = await self.batcher.aembed(text)
+        self._store_query(key, embedding)
+        return embedding
+
+    def close(self) -> None:
+        if self.batcher is not None:
+            self.batcher.close()
 
     def get_embedding_dimension(self) -> int:
-        test_embedding = self.embed_query("테스트")
-        return len(test_embedding)
+        """차원은 한 번만 계산해 저장합니다. 캐시에 있는 질의면 모델을 불러오지 않습니다."""
+        if self._dimension is None:
+            self._dimension = len(self.embed_query("테스트"))
+        return self._dimension
 
 
 def embed_langchain_documents(
-        documents: List[Document],
+        documents: List["Document"],
         embeddings_model: KoreanEmbeddings
 ) -> tuple[List[List[float]], List[str]]:
     texts = [doc.page_content for doc in documents]
@@ -43,11 +214,5 @@ def embed_langchain_documents(
 
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
-    embedding1 = np.array(embedding1)
-    embedding2 = np.array(embedding2)
-
-    dot_product = np.dot(embedding1, embedding2)
-    norm1 = np.linalg.norm(embedding1)
-    norm2 = np.linalg.norm(embedding2)
-
-    return dot_product / (norm1 * norm2)
+    """기존 호환용 단건 코사인 유사도. 여러 벡터는 similarity 모듈의 배치 함수를 사용합니다."""
+    return cosine_similarity(embedding1, embedding2)
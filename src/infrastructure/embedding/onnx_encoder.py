@@ -0,0 +1,179 @@
+import json
+import logging
+import os
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from .similarity import normalize
+
+logger = logging.getLogger(__name__)
+
+
+def _import_onnxruntime():
+    try:
+        import onnxruntime
+        return onnxruntime
+    except ImportError:
+        print("❌ onnxruntime 패키지가 설치되지 않았습니다: pip install onnxruntime")
+        raise
+
+
+def onnx_model_path(model_name: str, cache_dir: str, quantize: bool = False) -> str:
+    directory = os.path.join(cache_dir, model_name.replace("/", "__"))
+    return os.path.join(directory, "model.int8.onnx" if quantize else "model.onnx")
+
+
+def export_onnx_model(model_name: str, output_path: str, opset: int = 14) -> str:
+    """transformers 모델을 동적 배치/길이 축을 가진 ONNX 파일로 내보냅니다 (torch 필요, 최초 1회)."""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(["공지사항 임베딩 모델 변환용 문장입니다."], return_tensors="pt")
+    axes = {0: "batch", 1: "sequence"}
+    temp_path = f"{output_path}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            temp_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state", "pooler_output"],
+            dynamic_axes={"input_ids": axes, "attention_mask": axes, "last_hidden_state": axes},
+            opset_version=opset
+        )
+    os.replace(temp_path, output_path)
+    print(f"📦 ONNX 모델 생성: {output_path}")
+    return output_path
+
+
+def quantize_onnx_model(input_path: str, output_path: str) -> str:
+    """가중치를 int8로 동적 양자화합니다. 활성값은 실행 시 양자화되므로 보정 데이터가 필요 없습니다."""
+    _import_onnxruntime()
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    temp_path = f"{output_path}.tmp"
+    quantize_dynamic(input_path, temp_path, weight_type=QuantType.QInt8)
+    os.replace(temp_path, output_path)
+    print(f"📦 int8 양자화 모델 생성: {output_path}")
+    return output_path
+
+
+def ensure_onnx_model(model_name: str, cache_dir: str, quantize: bool = False) -> str:
+    """캐시 디렉터리에 ONNX 모델이 없으면 export(및 양자화)해서 경로를 반환합니다."""
+    path = onnx_model_path(model_name, cache_dir)
+    if not os.path.exists(path):
+        export_onnx_model(model_name, path)
+    if not quantize:
+        return path
+
+    quantized_path = onnx_model_path(model_name, cache_dir, quantize=True)
+    if not os.path.exists(quantized_path):
+        quantize_onnx_model(path, quantized_path)
+    return quantized_path
+
+
+def load_pooling_mode(model_name: str) -> str:
+    """sentence-transformers 설정(1_Pooling/config.json)의 pooling 방식을 따릅니다. 설정이 없으면 mean (ST 기본값)."""
+    try:
+        from huggingface_hub import hf_hub_download
+
+        with open(hf_hub_download(model_name, "1_Pooling/config.json")) as config_file:
+            config = json.load(config_file)
+        if config.get("pooling_mode_cls_token"):
+            return "cls"
+    except Exception:
+        pass
+    return "mean"
+
+
+class OnnxSentenceEncoder:
+    """ONNX Runtime으로 문장 임베딩을 계산합니다. HuggingFaceEmbeddings(sentence-transformers)와 같은 pooling/정규화를 사용합니다.
+
+    입력을 토큰 길이순으로 정렬해 비슷한 길이끼리 배치를 만들고 배치마다 가장 긴 입력에 맞춰 패딩하므로,
+    짧은 제목과 긴 본문이 섞인 공지사항에서 패딩 연산이 크게 줄어듭니다.
+    """
+
+    def __init__(
+            self,
+            model_name: str,
+            quantize: bool = False,
+            batch_size: int = 32,
+            num_threads: Optional[int] = None,
+            max_length: Optional[int] = None,
+            cache_dir: str = "./data/onnx_models",
+            pooling: Optional[str] = None,
+            tokenizer: Any = None,
+            session: Any = None
+    ):
+        self.model_name = model_name
+        self.quantize = quantize
+        self.batch_size = batch_size
+
+        if tokenizer is None:
+            from transformers import AutoTokenizer
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.tokenizer = tokenizer
+        # sentence-transformers와 같이 토크나이저 최대 길이를 따르되 512를 넘지 않게 함
+        self.max_length = max_length or min(getattr(tokenizer, "model_max_length", 512), 512)
+        self.pad_token_id = getattr(tokenizer, "pad_token_id", None) or 0
+        self.pooling = pooling or load_pooling_mode(model_name)
+
+        if session is None:
+            session = self._create_session(ensure_onnx_model(model_name, cache_dir, quantize), num_threads)
+        self.session = session
+        self._input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @staticmethod
+    def _create_session(path: str, num_threads: Optional[int]):
+        ort = _import_onnxruntime()
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.inter_op_num_threads = 1
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        return ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+
+    def _pool(self, hidden: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        if self.pooling == "cls":
+            return hidden[:, 0]
+        weights = mask[:, :, None].astype(np.float32)
+        return (hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """정규화된 임베딩을 (len(texts), 차원) float32 배열로 반환합니다. 결과 순서는 입력 순서와 같습니다."""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        input_ids = self.tokenizer(list(texts), truncation=True, max_length=self.max_length)["input_ids"]
+        order = np.argsort([len(ids) for ids in input_ids], kind="stable")
+
+        pooled: List[Optional[np.ndarray]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            length = max(len(input_ids[i]) for i in batch)
+            ids = np.full((len(batch), length), self.pad_token_id, dtype=np.int64)
+            mask = np.zeros((len(batch), length), dtype=np.int64)
+            for row, i in enumerate(batch):
+                ids[row, :len(input_ids[i])] = input_ids[i]
+                mask[row, :len(input_ids[i])] = 1
+
+            feeds = {"input_ids": ids, "attention_mask": mask}
+            if "token_type_ids" in self._input_names:
+                feeds["token_type_ids"] = np.zeros_like(ids)
+            hidden = self.session.run(None, feeds)[0]
+            for row, vector in zip(batch, self._pool(hidden, mask)):
+                pooled[row] = vector
+
+        return normalize(np.vstack(pooled))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.encode(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.encode([text])[0].tolist()
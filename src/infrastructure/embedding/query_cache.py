@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from .embedding_cache import normalize_text
+
+
+class QueryEmbeddingCache:
+    """정규화된 질의 → 임베딩 LRU 캐시.
+
+    같은 질의가 동시에 들어오면 첫 요청만 모델을 실행하고 나머지는 그 결과를 기다립니다 (single-flight).
+    """
+
+    def __init__(
+            self,
+            embed_fn: Callable[[str], List[float]],
+            max_entries: int = 1024,
+            embed_many_fn: Optional[Callable[[List[str]], List[List[float]]]] = None
+    ):
+        self.embed_fn = embed_fn
+        self.embed_many_fn = embed_many_fn
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+
+    def get(self, query: str) -> List[float]:
+        key = normalize_text(query)
+
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            embedding = self.embed_fn(query)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._store(key, embedding)
+            del self._in_flight[key]
+        future.set_result(embedding)
+        return embedding
+
+    def get_many(self, queries: List[str]) -> List[List[float]]:
+        """여러 질의를 한 번에 조회합니다. 캐시에 없는 질의는 embed_many_fn 한 번으로 함께 임베딩합니다."""
+        if self.embed_many_fn is None:
+            return [self.get(query) for query in queries]
+
+        keys = [normalize_text(query) for query in queries]
+        found: Dict[str, List[float]] = {}
+        waiting: Dict[str, Future] = {}
+        leading: Dict[str, str] = {}
+
+        with self._lock:
+            for key, query in zip(keys, queries):
+                if key in found or key in waiting or key in leading:
+                    continue
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    found[key] = embedding
+                elif key in self._in_flight:
+                    self.coalesced += 1
+                    waiting[key] = self._in_flight[key]
+                else:
+                    self.misses += 1
+                    self._in_flight[key] = Future()
+                    leading[key] = query
+
+        if leading:
+            try:
+                embeddings = self.embed_many_fn(list(leading.values()))
+            except BaseException as e:
+                with self._lock:
+                    futures = [self._in_flight.pop(key) for key in leading]
+                for future in futures:
+                    future.set_exception(e)
+                raise
+
+            with self._lock:
+                futures = []
+                for key, embedding in zip(leading, embeddings):
+                    self._store(key, embedding)
+                    futures.append(self._in_flight.pop(key))
+                    found[key] = embedding
+            for future, embedding in zip(futures, embeddings):
+                future.set_result(embedding)
+
+        for key, future in waiting.items():
+            found[key] = future.result()
+
+        return [found[key] for key in keys]
+
+    def _store(self, key: str, embedding: List[float]) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses + self.coalesced
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / total if total else 0.0
+        }
@@ -0,0 +1,170 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# KoreanEmbeddings는 normalize_embeddings=True로 임베딩하므로 기본값은 정규화된 입력으로 가정하고 노름 계산을 생략합니다.
+# 임의의 벡터를 다룰 때만 normalized=False를 넘깁니다.
+
+
+def as_matrix(vectors: Any) -> np.ndarray:
+    """벡터 목록을 float32 2차원 배열로 바꿉니다. 이미 float32 배열이면 복사하지 않습니다."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    return matrix
+
+
+def as_vector(vector: Any) -> np.ndarray:
+    return np.asarray(vector, dtype=np.float32).ravel()
+
+
+def normalize(vectors: Any) -> np.ndarray:
+    """각 행을 단위 벡터로 정규화합니다. 영벡터는 그대로 둡니다."""
+    matrix = as_matrix(vectors)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_scores(query: Any, matrix: Any, normalized: bool = True) -> np.ndarray:
+    """질의 벡터 하나와 행렬의 각 행 사이 코사인 유사도를 한 번의 행렬 곱으로 계산합니다."""
+    query = as_vector(query)
+    matrix = as_matrix(matrix)
+    if not normalized:
+        query = normalize(query)[0]
+        matrix = normalize(matrix)
+    return matrix @ query
+
+
+def cosine_matrix(left: Any, right: Any, normalized: bool = True) -> np.ndarray:
+    """두 벡터 집합 사이의 (len(left), len(right)) 코사인 유사도 행렬."""
+    left = as_matrix(left)
+    right = as_matrix(right)
+    if not normalized:
+        left = normalize(left)
+        right = normalize(right)
+    return left @ right.T
+
+
+def squared_l2_distances(queries: Any, matrix: Any) -> np.ndarray:
+    """(질의 수, 행 수) 제곱 L2 거리. Chroma/FAISS와 같은 거리 척도이며 |q|² - 2q·m + |m|²로 계산합니다."""
+    queries = as_matrix(queries)
+    matrix = as_matrix(matrix)
+    distances = (
+        np.einsum("ij,ij->i", queries, queries)[:, None]
+        - 2 * (queries @ matrix.T)
+        + np.einsum("ij,ij->i", matrix, matrix)[None, :]
+    )
+    # 부동소수점 오차로 생기는 작은 음수 제거
+    return np.maximum(distances, 0.0, out=distances)
+
+
+def top_k(scores: np.ndarray, k: int, largest: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """argpartition으로 상위 k개를 고른 뒤 그 k개만 정렬해 (인덱스, 점수)를 반환합니다.
+
+    scores가 2차원이면 행마다 상위 k개를 구합니다. largest=False이면 작은 값(거리) 순입니다.
+    """
+    scores = np.asarray(scores)
+    single = scores.ndim == 1
+    if single:
+        scores = scores[None, :]
+
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        empty = np.empty((scores.shape[0], 0), dtype=np.int64)
+        return (empty[0], scores[0, :0]) if single else (empty, scores[:, :0])
+
+    keyed = -scores if largest else scores
+    if k < scores.shape[1]:
+        indices = np.argpartition(keyed, k - 1, axis=1)[:, :k]
+    else:
+        indices = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(np.take_along_axis(keyed, indices, axis=1), axis=1, kind="stable")
+    indices = np.take_along_axis(indices, order, axis=1)
+    values = np.take_along_axis(scores, indices, axis=1)
+    return (indices[0], values[0]) if single else (indices, values)
+
+
+def top_k_similar(query: Any, matrix: Any, k: int, normalized: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """질의와 가장 비슷한 k개 행의 (인덱스, 코사인 유사도)."""
+    return top_k(cosine_scores(query, matrix, normalized), k)
+
+
+def near_duplicate_pairs(
+        vectors: Any,
+        threshold: float = 0.95,
+        normalized: bool = True,
+        block_size: int = 2048
+) -> List[Tuple[int, int, float]]:
+    """코사인 유사도가 threshold 이상인 (i, j, 유사도) 쌍을 i < j로 반환합니다.
+
+    전체 유사도 행렬을 한꺼번에 만들지 않도록 block_size 행씩 나눠 계산합니다.
+    """
+    matrix = as_matrix(vectors)
+    if not normalized:
+        matrix = normalize(matrix)
+
+    pairs = []
+    for start in range(0, len(matrix), block_size):
+        block = matrix[start:start + block_size] @ matrix[start:].T
+        rows, cols = np.nonzero(block >= threshold)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            i, j = start + row, start + col
+            if i < j:
+                pairs.append((i, j, float(block[row, col])))
+    return pairs
+
+
+def cosine_similarity(left: Any, right: Any, normalized: bool = False) -> float:
+    """벡터 두 개의 코사인 유사도. 여러 벡터를 비교할 때는 cosine_scores/cosine_matrix를 사용합니다."""
+    return float(cosine_scores(left, as_vector(right)[None, :], normalized)[0])
+
+
+def mmr_select(
+        query: Any,
+        candidates: Any,
+        k: int,
+        lambda_mult: float = 0.5,
+        groups: Optional[Sequence[Any]] = None,
+        max_per_group: Optional[int] = None,
+        normalized: bool = True
+) -> List[int]:
+    """Maximal Marginal Relevance로 candidates 중 k개를 골라 선택 순서대로 인덱스를 반환합니다.
+
+    점수는 lambda_mult * 질의 유사도 - (1 - lambda_mult) * 이미 고른 것과의 최대 유사도입니다.
+    후보 간 유사도 행렬을 한 번에 계산하고, 매 단계는 길이 n 벡터 연산만 합니다.
+    groups(예: notice_id)와 max_per_group을 주면 같은 그룹에서 그 개수를 넘겨 고르지 않습니다.
+    """
+    matrix = as_matrix(candidates)
+    if not normalized:
+        matrix = normalize(matrix)
+    count = len(matrix)
+    if count == 0 or k <= 0:
+        return []
+
+    relevance = cosine_scores(query, matrix, normalized)
+    pairwise = matrix @ matrix.T
+    redundancy = np.zeros(count, dtype=np.float32)
+    available = np.ones(count, dtype=bool)
+
+    group_codes = None
+    if groups is not None and max_per_group is not None:
+        _, group_codes = np.unique(np.asarray([str(group) for group in groups]), return_inverse=True)
+        group_counts = np.zeros(group_codes.max() + 1, dtype=np.int64)
+
+    selected: List[int] = []
+    while len(selected) < k and available.any():
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(redundancy, pairwise[best], out=redundancy)
+
+        if group_codes is not None:
+            code = group_codes[best]
+            group_counts[code] += 1
+            if group_counts[code] >= max_per_group:
+                available[group_codes == code] = False
+
+    return selected
@@ -1,17 +1,22 @@
 import asyncio
-import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 
-from .events import BaseEvent, EventType
+from ..codecs import EventCodec, create_event_codec, decode_event
+from ..dispatcher import ConcurrentDispatcher
+from ..events import BaseEvent
 
 logger = logging.getLogger(__name__)
 
 
 class MessageBroker(ABC):
 
+    def __init__(self):
+        # subscribe_batch로 만든 배처 (stop 시 남은 이벤트를 처리하기 위해 보관)
+        self._batchers: List[Any] = []
+
     @abstractmethod
     async def publish(self, topic: str, event: BaseEvent) -> None:
         pass
@@ -20,6 +25,45 @@ class MessageBroker(ABC):
     async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
         pass
 
+    async def publish_many(self, topic: str, events: Sequence[BaseEvent], chunk_size: int = 500) -> Dict[str, Any]:
+        """여러 이벤트를 발행합니다. 기본 구현은 publish를 반복 호출하며, 구현체에서 파이프라이닝으로 대체합니다."""
+        latencies_ms = []
+        for start in range(0, len(events), chunk_size):
+            batch_start = time.perf_counter()
+            for event in events[start:start + chunk_size]:
+                await self.publish(topic, event)
+            latencies_ms.append((time.perf_counter() - batch_start) * 1000)
+        return _publish_stats(len(events), latencies_ms)
+
+    async def subscribe_batch(
+            self,
+            topic: str,
+            handler: Callable[[List[BaseEvent]], Awaitable[None]],
+            max_batch_size: int = 64,
+            max_batch_delay: float = 0.5,
+            max_concurrent_batches: int = 1,
+            on_batch_error: Optional[Callable[[List[BaseEvent], Exception], Any]] = None
+    ) -> None:
+        """핸들러가 이벤트 목록을 받도록 구독합니다. 기본 구현은 수신한 이벤트를 EventBatcher로 모아서 전달합니다.
+
+        재시도 후에도 실패한 배치는 on_batch_error(batch, error)로 넘어갑니다.
+        """
+        from ..handlers.event_batcher import EventBatcher
+
+        batcher = EventBatcher(
+            handler,
+            max_batch_size=max_batch_size,
+            max_batch_delay=max_batch_delay,
+            max_concurrent_flushes=max_concurrent_batches,
+            error_handler=on_batch_error
+        )
+        self._batchers.append(batcher)
+        await self.subscribe(topic, batcher.add)
+
+    async def _close_batchers(self) -> None:
+        for batcher in self._batchers:
+            await batcher.close()
+
     @abstractmethod
     async def start(self) -> None:
         pass
@@ -29,21 +73,29 @@ class MessageBroker(ABC):
         pass
 
 
-def _create_event_from_data(event_type: EventType, data: dict) -> BaseEvent:
-    from .events import NoticeEvent
-
-    event_classes = {
-        EventType.NOTICE_CREATED: NoticeEvent,
+def _publish_stats(published: int, latencies_ms: List[float]) -> Dict[str, Any]:
+    return {
+        "published": published,
+        "batches": len(latencies_ms),
+        "batch_latencies_ms": latencies_ms,
+        "max_batch_latency_ms": max(latencies_ms) if latencies_ms else 0.0,
+        "avg_batch_latency_ms": sum(latencies_ms) / len(latencies_ms) if latencies_ms else 0.0
     }
 
-    event_class = event_classes.get(event_type, BaseEvent)
-    return event_class(**data)
-
 
 class RedisMessageBroker(MessageBroker):
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+            self,
+            redis_url: str = "redis://localhost:6379",
+            max_in_flight: int = 16,
+            codec: Optional[EventCodec] = None
+    ):
+        super().__init__()
         self.redis_url = redis_url
+        # 발행 형식만 코덱을 따르고, 수신 측은 헤더로 JSON/바이너리를 자동 판별
+        self.codec = codec or create_event_codec()
+        self.dispatcher = ConcurrentDispatcher(max_in_flight)
         self.subscribers: Dict[str, Callable] = {}
         self.publisher_client = None
         self.subscriber_client = None
@@ -67,6 +119,8 @@ class RedisMessageBroker(MessageBroker):
         self.running = False
         if self.listener_task:
             self.listener_task.cancel()
+        await self.dispatcher.drain()
+        await self._close_batchers()
         if self.pubsub:
             await self.pubsub.close()
         if self.subscriber_client:
@@ -79,14 +133,27 @@ class RedisMessageBroker(MessageBroker):
         if not self.publisher_client:
             raise RuntimeError("Redis 발행 클라이언트가 초기화되지 않았습니다")
 
-        message = {
-            "event_data": event.model_dump(mode='json'),
-            "published_at": datetime.now().isoformat()
-        }
-
-        await self.publisher_client.publish(topic, json.dumps(message))
+        await self.publisher_client.publish(topic, self.codec.encode(event))
         logger.info(f"메시지 발행: {topic} - {event.event_type}")
 
+    async def publish_many(self, topic: str, events: Sequence[BaseEvent], chunk_size: int = 500) -> Dict[str, Any]:
+        """이벤트를 한 번에 직렬화하고 chunk_size 단위로 Redis 파이프라인에 실어 보냅니다."""
+        if not self.publisher_client:
+            raise RuntimeError("Redis 발행 클라이언트가 초기화되지 않았습니다")
+
+        messages = self.codec.encode_many(events)
+        latencies_ms = []
+        for start in range(0, len(messages), chunk_size):
+            batch_start = time.perf_counter()
+            pipe = self.publisher_client.pipeline(transaction=False)
+            for message in messages[start:start + chunk_size]:
+                pipe.publish(topic, message)
+            await pipe.execute()
+            latencies_ms.append((time.perf_counter() - batch_start) * 1000)
+            logger.info(f"배치 발행: {topic} - {len(messages[start:start + chunk_size])}건, {latencies_ms[-1]:.1f}ms")
+
+        return _publish_stats(len(messages), latencies_ms)
+
     async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]):
         if not self.pubsub:
             raise RuntimeError("PubSub이 초기화되지 않았습니다")
@@ -107,19 +174,10 @@ class RedisMessageBroker(MessageBroker):
                 if message["type"] == "message":
                     try:
                         topic = message["channel"].decode()
-                        data = json.loads(message["data"].decode())
 
                         if topic in self.subscribers:
-                            event_data = data["event_data"]
-                            event_type = EventType(event_data["event_type"])
-
-                            event = _create_event_from_data(event_type, event_data)
-
-                            handler = self.subscribers[topic]
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(event)
-                            else:
-                                handler(event)
+                            event = decode_event(message["data"])
+                            await self.dispatcher.dispatch(self.subscribers[topic], event)
 
                     except Exception as e:
                         logger.error(f"메시지 처리 중 오류: {e}")
@@ -129,5 +187,9 @@ class RedisMessageBroker(MessageBroker):
             logger.error(f"메시지 리스닝 중 오류: {e}")
 
 
-def create_message_broker(redis_url: str = "redis://localhost:6379") -> MessageBroker:
-    return RedisMessageBroker(redis_url)
+def create_message_broker(
+        redis_url: str = "redis://localhost:6379",
+        max_in_flight: int = 16,
+        codec: Optional[EventCodec] = None
+) -> MessageBroker:
+    return RedisMessageBroker(redis_url, max_in_flight=max_in_flight, codec=codec)
@@ -0,0 +1,411 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .redis_broker import MessageBroker, _publish_stats
+from ..codecs import EventCodec, create_event_codec, decode_event
+from ..dispatcher import ConcurrentDispatcher
+from ..events import BaseEvent
+from ....shared.utils.env import load_env
+
+logger = logging.getLogger(__name__)
+
+
+def _default_consumer_name() -> str:
+    load_env()
+    return os.getenv("RAG_CONSUMER_NAME") or f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass
+class _BatchSubscription:
+    """subscribe_batch로 등록한 토픽의 배치 설정."""
+    max_batch_size: int
+    max_batch_delay: float
+    max_concurrent_batches: int
+    on_batch_error: Optional[Callable[[List[BaseEvent], Exception], Any]]
+
+
+class RedisStreamsMessageBroker(MessageBroker):
+    """Redis Streams 컨슈머 그룹 기반 메시지 브로커.
+
+    같은 그룹의 여러 워커가 메시지를 나눠 처리하고, 처리에 성공한 메시지만 XACK 합니다.
+    구독자가 없을 때 발행된 메시지도 스트림에 남아 재시작 후 이어서 처리할 수 있으며,
+    오래 처리되지 않은 pending 메시지는 다른 컨슈머가 XCLAIM으로 가져와 재처리합니다.
+    """
+
+    def __init__(
+            self,
+            redis_url: str = "redis://localhost:6379",
+            group_name: str = "rag-ingestion",
+            consumer_name: Optional[str] = None,
+            batch_size: int = 32,
+            block_ms: int = 1000,
+            claim_idle_ms: int = 60_000,
+            max_deliveries: int = 5,
+            max_stream_length: Optional[int] = 100_000,
+            max_in_flight: int = 16,
+            codec: Optional[EventCodec] = None,
+            client=None
+    ):
+        super().__init__()
+        self.redis_url = redis_url
+        self.group_name = group_name
+        self.consumer_name = consumer_name or _default_consumer_name()
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+        self.max_stream_length = max_stream_length
+        self.dispatcher = ConcurrentDispatcher(max_in_flight)
+        self.codec = codec or create_event_codec()
+
+        self.client = client
+        self._owns_client = client is None
+        self.subscribers: Dict[str, Callable] = {}
+        self.batch_subscriptions: Dict[str, _BatchSubscription] = {}
+        # 배치 토픽에서 마지막으로 실패한 핸들러 오류 (dead-letter 시 on_batch_error에 전달)
+        self._last_batch_errors: Dict[str, Exception] = {}
+        self.running = False
+        self.consumer_task = None
+
+    async def start(self):
+        if self.client is None:
+            try:
+                import redis.asyncio as redis
+                self.client = redis.from_url(self.redis_url)
+            except ImportError:
+                logger.error("redis 패키지가 설치되지 않았습니다: pip install redis")
+                raise
+        self.running = True
+        logger.info(f"Redis Streams 메시지 브로커 시작: {self.redis_url} ({self.group_name}/{self.consumer_name})")
+
+    async def stop(self):
+        self.running = False
+        if self.consumer_task:
+            self.consumer_task.cancel()
+            try:
+                await self.consumer_task
+            except asyncio.CancelledError:
+                pass
+        await self.dispatcher.drain()
+        if self.client and self._owns_client:
+            await self.client.close()
+        logger.info("Redis Streams 메시지 브로커 종료")
+
+    async def publish(self, topic: str, event: BaseEvent):
+        if not self.client:
+            raise RuntimeError("Redis 클라이언트가 초기화되지 않았습니다")
+
+        await self.client.xadd(
+            topic,
+            {"message": self.codec.encode(event)},
+            maxlen=self.max_stream_length,
+            approximate=True
+        )
+        logger.info(f"메시지 발행: {topic} - {event.event_type}")
+
+    async def publish_many(self, topic: str, events: Sequence[BaseEvent], chunk_size: int = 500) -> Dict[str, Any]:
+        """이벤트를 한 번에 직렬화하고 chunk_size 단위로 파이프라인 XADD 합니다."""
+        if not self.client:
+            raise RuntimeError("Redis 클라이언트가 초기화되지 않았습니다")
+
+        messages = self.codec.encode_many(events)
+        latencies_ms = []
+        for start in range(0, len(messages), chunk_size):
+            batch_start = time.perf_counter()
+            pipe = self.client.pipeline(transaction=False)
+            for message in messages[start:start + chunk_size]:
+                pipe.xadd(topic, {"message": message}, maxlen=self.max_stream_length, approximate=True)
+            await pipe.execute()
+            latencies_ms.append((time.perf_counter() - batch_start) * 1000)
+            logger.info(f"배치 발행: {topic} - {len(messages[start:start + chunk_size])}건, {latencies_ms[-1]:.1f}ms")
+
+        return _publish_stats(len(messages), latencies_ms)
+
+    async def subscribe_batch(
+            self,
+            topic: str,
+            handler: Callable[[List[BaseEvent]], Awaitable[None]],
+            max_batch_size: int = 64,
+            max_batch_delay: float = 0.5,
+            max_concurrent_batches: int = 1,
+            on_batch_error: Optional[Callable[[List[BaseEvent], Exception], Any]] = None
+    ):
+        """XREADGROUP으로 읽은 메시지들을 목록으로 전달하고, 핸들러가 성공하면 한 번에 XACK 합니다.
+
+        max_batch_size는 이 토픽의 읽기 개수이며, 덜 찬 배치는 max_batch_delay까지 더 읽어 채웁니다.
+        max_concurrent_batches > 1이면 notice_id 기준으로 나눈 레인별로 동시에 처리하되 같은 공지사항은 순서대로 처리됩니다.
+        실패한 배치는 ACK 되지 않아 reclaim_pending으로 다시 전달되고, max_deliveries를 넘겨 dead-letter로 보낼 때
+        해당 이벤트와 마지막 오류를 on_batch_error(batch, error)로 넘깁니다.
+        """
+        self.batch_subscriptions[topic] = _BatchSubscription(
+            max_batch_size=max_batch_size,
+            max_batch_delay=max_batch_delay,
+            max_concurrent_batches=max(1, max_concurrent_batches),
+            on_batch_error=on_batch_error
+        )
+        await self.subscribe(topic, handler)
+
+    def _read_count(self, topic: str) -> int:
+        subscription = self.batch_subscriptions.get(topic)
+        return subscription.max_batch_size if subscription else self.batch_size
+
+    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]):
+        if not self.client:
+            raise RuntimeError("Redis 클라이언트가 초기화되지 않았습니다")
+
+        await self._ensure_group(topic)
+        self.subscribers[topic] = handler
+        logger.info(f"토픽 구독: {topic} (group={self.group_name})")
+
+        if not self.consumer_task:
+            self.consumer_task = asyncio.create_task(self._consume())
+
+    async def _ensure_group(self, topic: str):
+        try:
+            await self.client.xgroup_create(topic, self.group_name, id="0", mkstream=True)
+        except Exception as e:
+            # 이미 그룹이 있으면 BUSYGROUP 오류가 발생하므로 무시
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _consume(self):
+        try:
+            # 재시작 시 이 컨슈머에게 할당된 채 ACK 되지 않은 메시지부터 처리
+            for topic in list(self.subscribers):
+                await self._recover_own_pending(topic)
+
+            while self.running:
+                try:
+                    await self.reclaim_pending()
+                    await self._read_new()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"스트림 소비 중 오류: {e}")
+                    await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            logger.info("스트림 컨슈머 태스크 취소됨")
+
+    async def _recover_own_pending(self, topic: str):
+        last_id = "0"
+        while True:
+            response = await self.client.xreadgroup(
+                self.group_name,
+                self.consumer_name,
+                {topic: last_id},
+                count=self._read_count(topic)
+            )
+            entries = response[0][1] if response else []
+            if not entries:
+                return
+            last_id = entries[-1][0]
+            await self._dispatch_entries(topic, entries)
+
+    async def _read_new(self):
+        if not self.subscribers:
+            await asyncio.sleep(self.block_ms / 1000)
+            return
+
+        # XREADGROUP의 count는 스트림마다 같은 값이 적용되므로 읽기 개수가 같은 토픽끼리 묶어서 읽음
+        groups: Dict[int, Dict[str, str]] = {}
+        for topic in self.subscribers:
+            groups.setdefault(self._read_count(topic), {})[topic] = ">"
+
+        received: Dict[str, list] = {}
+        for index, (count, streams) in enumerate(groups.items()):
+            # 앞선 읽기에서 받은 메시지가 없을 때 마지막 읽기에서만 블로킹
+            block = self.block_ms if not received and index == len(groups) - 1 else None
+            response = await self.client.xreadgroup(
+                self.group_name,
+                self.consumer_name,
+                streams,
+                count=count,
+                block=block
+            )
+            for stream, entries in response or []:
+                topic = stream.decode() if isinstance(stream, bytes) else stream
+                received.setdefault(topic, []).extend(entries)
+
+        if not received:
+            # 블로킹을 지원하지 않는 클라이언트(테스트용 fake 등)에서도 다른 태스크가 실행되도록 양보
+            await asyncio.sleep(0)
+            return
+
+        for topic, entries in received.items():
+            if topic in self.batch_subscriptions:
+                entries = await self._fill_batch(topic, entries)
+            await self._dispatch_entries(topic, entries)
+
+    async def _fill_batch(self, topic: str, entries: list) -> list:
+        """덜 찬 배치는 max_batch_delay 안에서 새 메시지를 더 읽어 채웁니다."""
+        subscription = self.batch_subscriptions[topic]
+        deadline = time.monotonic() + subscription.max_batch_delay
+        while len(entries) < subscription.max_batch_size:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            response = await self.client.xreadgroup(
+                self.group_name,
+                self.consumer_name,
+                {topic: ">"},
+                count=subscription.max_batch_size - len(entries),
+                block=remaining_ms
+            )
+            if not response or not response[0][1]:
+                # 블로킹하지 않는 클라이언트에서 바쁜 대기를 하지 않도록 잠깐 쉼
+                await asyncio.sleep(min(remaining_ms, 20) / 1000)
+                continue
+            entries = entries + list(response[0][1])
+        return entries
+
+    async def reclaim_pending(self) -> int:
+        """claim_idle_ms 이상 처리되지 않은 다른 컨슈머의 pending 메시지를 가져와 재처리합니다."""
+        reclaimed = 0
+        for topic in list(self.subscribers):
+            pending = await self.client.xpending_range(
+                topic,
+                self.group_name,
+                min="-",
+                max="+",
+                count=self._read_count(topic),
+                idle=self.claim_idle_ms
+            )
+            if not pending:
+                continue
+
+            retry_ids = []
+            dead_events = []
+            for entry in pending:
+                if entry["times_delivered"] >= self.max_deliveries:
+                    event = await self._dead_letter(topic, entry["message_id"])
+                    if event is not None:
+                        dead_events.append(event)
+                else:
+                    retry_ids.append(entry["message_id"])
+            if dead_events:
+                await self._report_batch_error(topic, dead_events)
+
+            if not retry_ids:
+                continue
+
+            claimed = await self.client.xclaim(
+                topic,
+                self.group_name,
+                self.consumer_name,
+                min_idle_time=self.claim_idle_ms,
+                message_ids=retry_ids
+            )
+            reclaimed += sum(1 for _, fields in claimed if fields)
+            await self._dispatch_entries(topic, claimed)
+
+        if reclaimed:
+            logger.info(f"pending 메시지 {reclaimed}건 재처리")
+        return reclaimed
+
+    async def _dead_letter(self, topic: str, message_id) -> Optional[BaseEvent]:
+        """메시지를 dead-letter 스트림으로 옮기고 ACK 합니다. 해석할 수 있는 메시지면 이벤트를 반환합니다."""
+        event = None
+        entries = await self.client.xrange(topic, min=message_id, max=message_id)
+        if entries:
+            _, fields = entries[0]
+            await self.client.xadd(f"{topic}.dead", fields)
+            try:
+                event = decode_event(fields.get(b"message", fields.get("message")))
+            except Exception:
+                event = None
+        await self.client.xack(topic, self.group_name, message_id)
+        logger.error(f"최대 재시도 초과로 dead-letter 처리: {topic} {message_id}")
+        return event
+
+    async def _report_batch_error(self, topic: str, events: List[BaseEvent]):
+        """배치 토픽에서 끝내 처리하지 못한 이벤트를 on_batch_error에 넘깁니다."""
+        subscription = self.batch_subscriptions.get(topic)
+        if subscription is None or subscription.on_batch_error is None:
+            return
+        error = self._last_batch_errors.get(topic) or RuntimeError(f"최대 재시도({self.max_deliveries}회) 초과")
+        try:
+            result = subscription.on_batch_error(events, error)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"배치 오류 핸들러 실행 중 오류: {e}")
+
+    async def _decode(self, topic: str, message_id, fields: dict) -> Optional[BaseEvent]:
+        try:
+            return decode_event(fields.get(b"message", fields.get("message")))
+        except Exception as e:
+            # 해석할 수 없는 메시지는 재시도해도 실패하므로 바로 dead-letter로 보냄
+            logger.error(f"메시지 해석 실패: {e}")
+            await self._dead_letter(topic, message_id)
+            return None
+
+    async def _dispatch_entries(self, topic: str, entries: list):
+        decoded = []
+        for message_id, fields in entries:
+            if not fields:
+                continue
+            event = await self._decode(topic, message_id, fields)
+            if event is not None:
+                decoded.append((message_id, event))
+
+        if not decoded:
+            return
+
+        handler = self.subscribers[topic]
+
+        async def call_handler(payload):
+            if asyncio.iscoroutinefunction(handler):
+                await handler(payload)
+            else:
+                await asyncio.to_thread(handler, payload)
+
+        subscription = self.batch_subscriptions.get(topic)
+        if subscription is not None:
+            # 같은 공지사항은 항상 같은 레인으로 보내고, 레인 안의 배치는 순서대로 처리
+            lanes: Dict[int, list] = {}
+            for message_id, event in decoded:
+                key = getattr(event, "notice_id", None) or event.event_id
+                lane = zlib.crc32(str(key).encode("utf-8")) % subscription.max_concurrent_batches
+                lanes.setdefault(lane, []).append((message_id, event))
+
+            for lane, items in lanes.items():
+                async def handle_batch_and_ack(events: List[BaseEvent], message_ids=[message_id for message_id, _ in items]):
+                    try:
+                        await call_handler(events)
+                    except Exception as e:
+                        self._last_batch_errors[topic] = e
+                        raise
+                    await self.client.xack(topic, self.group_name, *message_ids)
+
+                await self.dispatcher.dispatch(
+                    handle_batch_and_ack,
+                    [event for _, event in items],
+                    key=f"batch:{topic}:{lane}"
+                )
+            return
+
+        for message_id, event in decoded:
+            async def handle_and_ack(received_event: BaseEvent, message_id=message_id):
+                await call_handler(received_event)
+                # 핸들러가 성공한 경우에만 ACK, 실패하면 pending으로 남아 reclaim 대상이 됨
+                await self.client.xack(topic, self.group_name, message_id)
+
+            await self.dispatcher.dispatch(handle_and_ack, event)
+
+    async def get_pending_count(self, topic: str) -> int:
+        summary = await self.client.xpending(topic, self.group_name)
+        return summary["pending"] if summary else 0
+
+
+def create_streams_message_broker(
+        redis_url: str = "redis://localhost:6379",
+        group_name: str = "rag-ingestion",
+        **kwargs
+) -> MessageBroker:
+    return RedisStreamsMessageBroker(redis_url, group_name=group_name, **kwargs)
@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import struct
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .events import BaseEvent, EventType
+from ...shared.utils.env import load_env
+
+logger = logging.getLogger(__name__)
+
+# 바이너리 메시지 헤더: MAGIC(2) + 스키마 버전(1) + 직렬화 방식(1) + 압축 방식(1)
+# 기존 JSON 메시지는 항상 '{'로 시작하므로 헤더 유무로 두 형식을 구분할 수 있음
+MAGIC = b"KE"
+SCHEMA_VERSION = 1
+HEADER = struct.Struct("!2sBBB")
+
+SERIALIZER_MSGPACK = 1
+SERIALIZER_ORJSON = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+COMPRESSION_ZLIB = 2
+
+
+def create_event_from_data(event_type: EventType, data: dict) -> BaseEvent:
+    from .events import NoticeEvent
+
+    event_classes = {
+        EventType.NOTICE_CREATED: NoticeEvent,
+    }
+
+    event_class = event_classes.get(event_type, BaseEvent)
+    return event_class(**data)
+
+
+def _message_from_event(event: BaseEvent, published_at: str) -> Dict[str, Any]:
+    return {
+        "event_data": event.model_dump(mode='json'),
+        "published_at": published_at
+    }
+
+
+def _event_from_message(message: Dict[str, Any]) -> BaseEvent:
+    event_data = message["event_data"]
+    return create_event_from_data(EventType(event_data["event_type"]), event_data)
+
+
+class EventCodec(ABC):
+    """이벤트를 전송용 바이트로 변환하고 다시 이벤트로 복원하는 코덱."""
+
+    name = "codec"
+
+    @abstractmethod
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        pass
+
+    def encode(self, event: BaseEvent, published_at: Optional[str] = None) -> bytes:
+        return self.encode_message(_message_from_event(event, published_at or datetime.now().isoformat()))
+
+    def encode_many(self, events: Sequence[BaseEvent]) -> List[bytes]:
+        published_at = datetime.now().isoformat()
+        return [self.encode(event, published_at) for event in events]
+
+    def decode(self, raw: Union[bytes, str]) -> BaseEvent:
+        """형식을 자동으로 판별하므로 어떤 코덱으로든 기존 JSON과 바이너리 메시지를 모두 읽을 수 있습니다."""
+        return decode_event(raw)
+
+
+class JsonEventCodec(EventCodec):
+    """기존 JSON 형식 (헤더 없음)."""
+
+    name = "json"
+
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+
+class BinaryEventCodec(EventCodec):
+    """msgpack/orjson 직렬화와 선택적 압축을 사용하는 버전 헤더 포함 바이너리 형식.
+
+    압축은 본문 전체에 적용되며, 긴 공지사항에서는 content가 대부분을 차지합니다.
+    """
+
+    def __init__(self, serializer: str = "msgpack", compression: Optional[str] = "zstd", compression_level: int = 3):
+        self.serializer_id = {"msgpack": SERIALIZER_MSGPACK, "orjson": SERIALIZER_ORJSON}[serializer]
+        self.compression_id = {
+            None: COMPRESSION_NONE,
+            "none": COMPRESSION_NONE,
+            "zstd": COMPRESSION_ZSTD,
+            "zlib": COMPRESSION_ZLIB
+        }[compression]
+        self.compression_level = compression_level
+        self.name = f"{serializer}+{compression or 'none'}"
+
+        # 선택 의존성이 없으면 생성 시점에 바로 알 수 있도록 미리 확인
+        _serializer_module(self.serializer_id)
+        self._compressor = _make_compressor(self.compression_id, compression_level)
+
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        body = _serialize(self.serializer_id, message)
+        if self._compressor is not None:
+            body = self._compressor(body)
+        return HEADER.pack(MAGIC, SCHEMA_VERSION, self.serializer_id, self.compression_id) + body
+
+
+def _serializer_module(serializer_id: int):
+    try:
+        if serializer_id == SERIALIZER_MSGPACK:
+            import msgpack
+            return msgpack
+        import orjson
+        return orjson
+    except ImportError:
+        logger.error("바이너리 코덱 의존성이 설치되지 않았습니다: pip install msgpack orjson")
+        raise
+
+
+def _serialize(serializer_id: int, message: Dict[str, Any]) -> bytes:
+    module = _serializer_module(serializer_id)
+    if serializer_id == SERIALIZER_MSGPACK:
+        return module.packb(message, use_bin_type=True)
+    return module.dumps(message)
+
+
+def _deserialize(serializer_id: int, body: bytes) -> Dict[str, Any]:
+    module = _serializer_module(serializer_id)
+    if serializer_id == SERIALIZER_MSGPACK:
+        return module.unpackb(body, raw=False)
+    return module.loads(body)
+
+
+def _make_compressor(compression_id: int, level: int):
+    if compression_id == COMPRESSION_ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            logger.error("zstandard 패키지가 설치되지 않았습니다: pip install zstandard")
+            raise
+        return zstandard.ZstdCompressor(level=level).compress
+    if compression_id == COMPRESSION_ZLIB:
+        import zlib
+        return lambda body: zlib.compress(body, level)
+    return None
+
+
+_local = threading.local()
+
+
+def _decompress(compression_id: int, body: bytes) -> bytes:
+    if compression_id == COMPRESSION_ZSTD:
+        # ZstdDecompressor는 스레드 간 공유가 안전하지 않으므로 스레드별로 재사용
+        decompressor = getattr(_local, "zstd_decompressor", None)
+        if decompressor is None:
+            import zstandard
+            decompressor = _local.zstd_decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(body)
+    if compression_id == COMPRESSION_ZLIB:
+        import zlib
+        return zlib.decompress(body)
+    if compression_id == COMPRESSION_NONE:
+        return body
+    raise ValueError(f"지원하지 않는 압축 방식: {compression_id}")
+
+
+def decode_message(raw: Union[bytes, str]) -> Dict[str, Any]:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+
+    if raw[:2] != MAGIC:
+        return json.loads(raw)
+
+    _, version, serializer_id, compression_id = HEADER.unpack_from(raw)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 메시지 스키마 버전: {version}")
+
+    body = _decompress(compression_id, raw[HEADER.size:])
+    return _deserialize(serializer_id, body)
+
+
+def decode_event(raw: Union[bytes, str]) -> BaseEvent:
+    return _event_from_message(decode_message(raw))
+
+
+def create_event_codec(name: Optional[str] = None) -> EventCodec:
+    """EVENT_CODEC 환경 변수(json | msgpack | orjson)와 EVENT_COMPRESSION(none | zstd | zlib)으로 코덱을 고릅니다.
+
+    롤아웃 중에는 구독자를 먼저 배포하고(모든 코덱이 두 형식을 읽음) 발행자의 EVENT_CODEC을 나중에 바꿉니다.
+    """
+    load_env()
+    name = (name or os.getenv("EVENT_CODEC", "json")).lower()
+    if name == "json":
+        return JsonEventCodec()
+
+    compression = os.getenv("EVENT_COMPRESSION", "zstd").lower()
+    return BinaryEventCodec(serializer=name, compression=compression)
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from .events import BaseEvent
+
+logger = logging.getLogger(__name__)
+
+
+def _ordering_key(event: BaseEvent) -> str:
+    """같은 공지사항에 대한 이벤트는 도착 순서대로 처리되도록 순서 키를 정합니다."""
+    return getattr(event, "notice_id", None) or event.event_id
+
+
+class ConcurrentDispatcher:
+    """핸들러를 동시에 실행하되 전체 동시 실행 수를 제한하고 같은 키의 이벤트는 순서대로 실행합니다."""
+
+    def __init__(self, max_in_flight: int = 16):
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._key_tails: Dict[str, asyncio.Task] = {}
+        self._tasks: set = set()
+
+    async def dispatch(self, handler: Callable, event: Any, key: Optional[str] = None) -> None:
+        """핸들러 실행을 예약합니다. event가 이벤트 목록(배치)이면 key를 직접 지정해야 합니다."""
+        # 동시 실행 한도에 도달하면 여기서 대기하여 메시지 수신 속도를 조절
+        await self._semaphore.acquire()
+
+        key = key or _ordering_key(event)
+        previous = self._key_tails.get(key)
+        task = asyncio.create_task(self._run(handler, event, previous))
+        self._key_tails[key] = task
+        self._tasks.add(task)
+
+        def _on_done(done_task: asyncio.Task):
+            self._tasks.discard(done_task)
+            if self._key_tails.get(key) is done_task:
+                del self._key_tails[key]
+
+        task.add_done_callback(_on_done)
+
+    async def _run(self, handler: Callable, event: Any, previous: Optional[asyncio.Task]) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            if asyncio.iscoroutinefunction(handler):
+                await handler(event)
+            else:
+                # 동기 핸들러는 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(handler, event)
+        except Exception as e:
+            logger.error(f"메시지 처리 중 오류: {e}")
+        finally:
+            self._semaphore.release()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def drain(self) -> None:
+        """실행 중인 핸들러가 모두 끝날 때까지 기다립니다."""
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ..events import BaseEvent
+
+logger = logging.getLogger(__name__)
+
+
+class ThroughputStats:
+    """배치 처리 건수와 소요 시간을 누적하여 처리량(notices/s)을 계산합니다."""
+
+    def __init__(self):
+        self.total_events = 0
+        self.total_batches = 0
+        self.total_seconds = 0.0
+        self.last_batch_size = 0
+        self.last_throughput = 0.0
+
+    def record(self, batch_size: int, elapsed: float) -> None:
+        self.total_events += batch_size
+        self.total_batches += 1
+        self.total_seconds += elapsed
+        self.last_batch_size = batch_size
+        self.last_throughput = batch_size / elapsed if elapsed > 0 else 0.0
+        logger.info(f"배치 처리: {batch_size}건, {elapsed:.3f}초 ({self.last_throughput:.1f} notices/s)")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_events": self.total_events,
+            "total_batches": self.total_batches,
+            "avg_batch_size": self.total_events / self.total_batches if self.total_batches else 0.0,
+            "last_batch_size": self.last_batch_size,
+            "last_throughput": self.last_throughput,
+            "avg_throughput": self.total_events / self.total_seconds if self.total_seconds else 0.0
+        }
+
+
+class EventBatcher:
+    """이벤트를 모아 두었다가 최대 배치 크기 또는 최대 대기 시간에 도달하면 한 번에 넘겨줍니다.
+
+    처리에 실패한 배치는 처리 슬롯을 쥔 채 retry_delay부터 두 배씩 늘려 max_retries번 다시 시도하고,
+    그래도 실패하면 error_handler(batch, error)에 넘깁니다 (없으면 오류 로그를 남기고 예외를 다시 던짐).
+    max_concurrent_flushes > 1이면 배치가 동시에 처리되지만, 같은 키(기본: notice_id)를 가진 이벤트가 든 배치는
+    앞선 배치가 끝난 뒤에 처리되어 같은 공지사항의 생성/수정/삭제 순서가 뒤바뀌지 않습니다.
+    """
+
+    def __init__(
+            self,
+            flush_handler: Callable[[List[BaseEvent]], Any],
+            max_batch_size: int = 64,
+            max_batch_delay: float = 0.5,
+            max_concurrent_flushes: int = 1,
+            max_retries: int = 2,
+            retry_delay: Optional[float] = None,
+            error_handler: Optional[Callable[[List[BaseEvent], Exception], Any]] = None,
+            key_fn: Optional[Callable[[BaseEvent], Optional[Hashable]]] = None
+    ):
+        self.flush_handler = flush_handler
+        # async def __call__을 가진 객체도 코루틴 핸들러로 취급
+        self._handler_is_async = asyncio.iscoroutinefunction(flush_handler) or asyncio.iscoroutinefunction(
+            getattr(flush_handler, "__call__", None)
+        )
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.max_concurrent_flushes = max_concurrent_flushes
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay if retry_delay is not None else max_batch_delay
+        self.error_handler = error_handler
+        self.key_fn = key_fn or (lambda event: getattr(event, "notice_id", None))
+
+        self._buffer: List[BaseEvent] = []
+        self._flush_slots = asyncio.Semaphore(max_concurrent_flushes)
+        self._timer_task: Optional[asyncio.Task] = None
+        # 키별로 가장 최근에 만들어진 배치의 완료 신호
+        self._key_tails: Dict[Hashable, asyncio.Event] = {}
+
+        self.stats = ThroughputStats()
+        self.retried_batches = 0
+        self.failed_events = 0
+
+    async def add(self, event: BaseEvent) -> None:
+        self._buffer.append(event)
+
+        if len(self._buffer) >= self.max_batch_size:
+            # 배치가 가득 차면 바로 처리하여 리스너에 역압(backpressure)을 전달
+            await self.flush()
+        elif self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        try:
+            await asyncio.sleep(self.max_batch_delay)
+        except asyncio.CancelledError:
+            return
+
+        # 대기가 끝난 뒤에는 취소 대상에서 빼서 처리 중인 배치가 중간에 끊기지 않도록 함
+        self._timer_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"지연 배치 처리 중 오류: {e}")
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+
+        # 버퍼를 먼저 떼어내고 처리 슬롯을 기다리는 동안 새 이벤트는 다음 배치에 쌓임
+        batch = self._buffer
+        self._buffer = []
+
+        # 떼어낸 순서대로 키를 등록해, 같은 키를 가진 앞선 배치가 끝날 때까지 기다림
+        keys = {key for key in map(self.key_fn, batch) if key is not None}
+        waits = {self._key_tails[key] for key in keys if key in self._key_tails}
+        done = asyncio.Event()
+        for key in keys:
+            self._key_tails[key] = done
+
+        try:
+            # 슬롯을 잡기 전에 기다려야 선행 배치가 슬롯을 얻지 못해 멈추는 일이 없음
+            for previous in waits:
+                await previous.wait()
+            async with self._flush_slots:
+                await self._process(batch)
+        finally:
+            done.set()
+            for key in keys:
+                if self._key_tails.get(key) is done:
+                    del self._key_tails[key]
+
+    async def _process(self, batch: List[BaseEvent]) -> None:
+        start = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    if self._handler_is_async:
+                        await self.flush_handler(batch)
+                    else:
+                        await asyncio.to_thread(self.flush_handler, batch)
+                    return
+                except Exception as e:
+                    if attempt < self.max_retries:
+                        self.retried_batches += 1
+                        logger.warning(f"배치 처리 실패 ({len(batch)}건, 재시도 {attempt + 1}/{self.max_retries}): {e}")
+                        await asyncio.sleep(self.retry_delay * 2 ** attempt)
+                        continue
+
+                    self.failed_events += len(batch)
+                    if self.error_handler is None:
+                        logger.error(f"배치 처리 최종 실패, {len(batch)}건 처리하지 못함: {e}")
+                        raise
+                    result = self.error_handler(batch, e)
+                    if asyncio.iscoroutine(result):
+                        await result
+        finally:
+            self.stats.record(len(batch), time.perf_counter() - start)
+
+    async def close(self) -> None:
+        """대기 중인 타이머를 정리하고 남은 이벤트를 모두 처리합니다."""
+        if self._timer_task and not self._timer_task.done():
+            self._timer_task.cancel()
+        await self.flush()
+        # 앞선 배치를 기다리느라 아직 슬롯을 잡지 않은 배치까지 끝나기를 기다림
+        while self._key_tails:
+            await next(iter(self._key_tails.values())).wait()
+
+        # 다른 태스크에서 진행 중인 배치가 끝날 때까지 모든 처리 슬롯을 회수했다가 돌려줌
+        for _ in range(self.max_concurrent_flushes):
+            await self._flush_slots.acquire()
+        for _ in range(self.max_concurrent_flushes):
+            self._flush_slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._buffer),
+            "retried_batches": self.retried_batches,
+            "failed_events": self.failed_events,
+            **self.stats.as_dict()
+        }
@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from ....application.processors.document_processor import DocumentProcessor
 from ..events import BaseEvent, NoticeEvent, EventType
-from ....domain.models import Notice
+from .event_batcher import ThroughputStats
+from ....domain.models import Notice, Campus, NoticeCategory
 from ...vector_store.chroma_store import NoticeVectorStore
 
 logger = logging.getLogger(__name__)
@@ -12,16 +16,32 @@ logger = logging.getLogger(__name__)
 
 class RAGEventHandler:
 
-    def __init__(self, vector_store: NoticeVectorStore):
+    def __init__(
+            self,
+            vector_store: NoticeVectorStore,
+            executor: Optional[Executor] = None,
+            max_workers: int = 2
+    ):
         self.vector_store = vector_store
         self.document_processor = DocumentProcessor()
+        # 청킹/임베딩/Chroma 쓰기는 블로킹 작업이므로 이벤트 루프 밖의 제한된 스레드 풀에서 실행
+        # (PyTorch 추론과 SQLite I/O는 GIL을 놓기 때문에 코어 수에 따라 처리량이 늘어남)
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="rag-ingest"
+        )
+
+    def close(self):
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
 
     async def handle_notice_event(self, event: NoticeEvent):
         logger.info(f"공지사항 이벤트 처리 시작: {event.event_type} - {event.title}")
         print(f"🔄 이벤트 핸들러에서 처리 중: {event.event_type} - {event.title}")
 
         try:
-            if event.event_type == EventType.NOTICE_CREATED:
+            if EventType(event.event_type) == EventType.NOTICE_CREATED:
                 await self._create_notice(event)
 
             print(f"✅ 이벤트 처리 완료: {event.event_type}")
@@ -31,48 +51,98 @@ class RAGEventHandler:
             print(f"❌ 이벤트 처리 실패: {e}")
             raise
 
-    async def _create_notice(self, event: NoticeEvent):
-        print(f"📝 새 공지사항 생성 처리: {event.title}")
-
-        notice = Notice(
-            id=event.notice_id,
-            title=event.title,
-            content=event.content,
-            url=event.url,
-            campus=event.campus,
-            category=event.category,
-            published_date=event.published_date,
-            author=event.author,
-            department=event.department,
-            attachments=event.attachments
-        )
+    async def handle_notice_events(self, events: List[NoticeEvent]):
+        """여러 공지사항 이벤트를 한 번의 중복 검사, 임베딩 호출, 벌크 쓰기로 처리합니다."""
+        logger.info(f"공지사항 이벤트 배치 처리 시작: {len(events)}건")
 
-        documents = self.document_processor.process_notice(notice)
-        print(f"📄 생성된 문서 청크 수: {len(documents)}")
+        try:
+            created_events = [
+                event for event in events
+                if EventType(event.event_type) == EventType.NOTICE_CREATED
+            ]
+            if created_events:
+                await self._create_notices(created_events)
 
-        existing_docs = self.vector_store.get_documents_by_id(event.notice_id)
-        if existing_docs:
-            logger.warning(f"이미 존재하는 공지사항: {event.notice_id}, 건너뜀")
-            print(f"⚠️ 이미 존재하는 공지사항, 건너뜀")
+        except Exception as e:
+            logger.error(f"공지사항 이벤트 배치 처리 실패: {e}")
+            print(f"❌ 배치 처리 실패: {e}")
+            raise
+
+    async def _create_notice(self, event: NoticeEvent):
+        await self._create_notices([event])
+
+    async def _create_notices(self, events: List[NoticeEvent]):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self._create_notices_sync, events)
+
+    def _create_notices_sync(self, events: List[NoticeEvent]):
+        print(f"📝 새 공지사항 생성 처리: {len(events)}건")
+
+        documents = []
+        seen_notice_ids = set()
+        for event in events:
+            if event.notice_id in seen_notice_ids or self.vector_store.has_notice(event.notice_id):
+                logger.warning(f"이미 존재하는 공지사항: {event.notice_id}, 건너뜀")
+                print(f"⚠️ 이미 존재하는 공지사항, 건너뜀: {event.title}")
+                continue
+            seen_notice_ids.add(event.notice_id)
+
+            notice = Notice(
+                id=event.notice_id,
+                title=event.title,
+                content=event.content,
+                url=event.url,
+                campus=Campus(event.campus),
+                category=NoticeCategory(event.category),
+                published_date=event.published_date,
+                author=event.author,
+                department=event.department,
+                attachments=event.attachments
+            )
+            documents.extend(self.document_processor.process_notice(notice))
+
+        if not documents:
             return
 
+        print(f"📄 생성된 문서 청크 수: {len(documents)}")
         self.vector_store.add_documents(documents)
-        print(f"✅ 새 공지사항 추가 완료: {event.title} ({len(documents)}개 문서)")
-        logger.info(f"새 공지사항 추가 완료: {event.title} ({len(documents)}개 문서)")
+        print(f"✅ 새 공지사항 추가 완료: {len(seen_notice_ids)}건 ({len(documents)}개 문서)")
+        logger.info(f"새 공지사항 추가 완료: {len(seen_notice_ids)}건 ({len(documents)}개 문서)")
 
 
 class DataSyncManager:
 
-    def __init__(self, vector_store: NoticeVectorStore, message_broker):
+    def __init__(
+            self,
+            vector_store: NoticeVectorStore,
+            message_broker,
+            max_batch_size: int = 64,
+            max_batch_delay: float = 0.5,
+            ingest_workers: int = 2
+    ):
         self.vector_store = vector_store
         self.message_broker = message_broker
-        self.event_handler = RAGEventHandler(vector_store)
+        self.event_handler = RAGEventHandler(vector_store, max_workers=ingest_workers)
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.ingest_workers = ingest_workers
+        self.ingestion_stats = ThroughputStats()
+        # 재시도 후에도 반영하지 못한 공지사항 (최근 1000건, 재동기화 대상)
+        self.failed_notice_ids: List[str] = []
         self.running = False
 
     async def start(self):
         await self.message_broker.start()
 
-        await self.message_broker.subscribe("university.notices", self._handle_notice_events)
+        # 이벤트를 배치로 받아 한 번의 임베딩 호출과 벌크 쓰기로 처리
+        await self.message_broker.subscribe_batch(
+            "university.notices",
+            self._handle_notice_events,
+            max_batch_size=self.max_batch_size,
+            max_batch_delay=self.max_batch_delay,
+            max_concurrent_batches=self.ingest_workers,
+            on_batch_error=self._on_batch_error
+        )
 
         self.running = True
         logger.info("데이터 동기화 관리자 시작")
@@ -80,15 +150,29 @@ class DataSyncManager:
     async def stop(self):
         self.running = False
         await self.message_broker.stop()
+        self.event_handler.close()
         logger.info("데이터 동기화 관리자 종료")
 
-    async def _handle_notice_events(self, event: BaseEvent):
-        if isinstance(event, NoticeEvent):
-            await self.event_handler.handle_notice_event(event)
+    async def _handle_notice_events(self, events: List[BaseEvent]):
+        notice_events = [event for event in events if isinstance(event, NoticeEvent)]
+        if not notice_events:
+            return
+
+        start = time.perf_counter()
+        await self.event_handler.handle_notice_events(notice_events)
+        self.ingestion_stats.record(len(notice_events), time.perf_counter() - start)
+
+    def _on_batch_error(self, events: List[BaseEvent], error: Exception):
+        notice_ids = [event.notice_id for event in events if isinstance(event, NoticeEvent)]
+        logger.error(f"공지사항 배치 반영 실패 ({len(notice_ids)}건): {error} - {notice_ids}")
+        print(f"❌ 공지사항 {len(notice_ids)}건 반영 실패, 재동기화 필요: {error}")
+        self.failed_notice_ids = (self.failed_notice_ids + notice_ids)[-1000:]
 
     def get_sync_status(self) -> Dict[str, Any]:
         return {
             "running": self.running,
             "vector_store_count": self.vector_store.get_collection_info()["count"],
+            "ingestion": self.ingestion_stats.as_dict(),
+            "failed_notice_ids": list(self.failed_notice_ids),
             "last_sync": datetime.now().isoformat()
         }
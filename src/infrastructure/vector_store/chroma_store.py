@@ -1,41 +1,320 @@
+import hashlib
 import os
-import chromadb
-from typing import List, Dict, Any, Optional
-from langchain.schema import Document
-from langchain_community.vectorstores import Chroma
-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
+from langchain_core.documents import Document
+
+from .keyword_index import KeywordIndex
+from .metadata_index import MetadataFilter, MetadataIndex, combine_filters
+from .notice_index import NoticeIdIndex
 from ..embedding.korean_embeddings import KoreanEmbeddings
+from ..embedding.query_cache import QueryEmbeddingCache
+from ..embedding.similarity import mmr_select, squared_l2_distances, top_k
 from ...domain.models import Campus
+from ...shared.utils.concurrency import ReadWriteLock
+
+
+@dataclass
+class NoticeChange:
+    """저장소에 반영된 공지사항 변경 내역. 답변 캐시 등 파생 데이터 무효화에 사용합니다."""
+    notice_ids: Set[str]
+    campuses: Set[str] = field(default_factory=set)
+    # 새로 쓰인 청크 임베딩 (삭제만 있었으면 None)
+    embeddings: Optional[List[List[float]]] = None
+    # 컬렉션 전체가 지워졌는지 여부
+    reset: bool = False
 
 
 class NoticeVectorStore:
 
-    def __init__(self, persist_directory: str = "./data/chroma_db"):
+    def __init__(
+            self,
+            persist_directory: str = "./data/chroma_db",
+            query_cache_size: int = 1024,
+            embeddings: Optional[KoreanEmbeddings] = None,
+            exact_scan_limit: int = 2048
+    ):
         self.persist_directory = persist_directory
-        self.embeddings = KoreanEmbeddings()
+        self.embeddings = embeddings or KoreanEmbeddings()
         self.collection_name = "notice_collection"
+        # 반복되는 학생 질문은 모델을 다시 돌리지 않도록 질의 임베딩을 메모리에 캐시
+        # 질의와 문서는 같은 방식으로 임베딩되므로 여러 질의는 embed_documents 한 번으로 처리
+        self.query_cache = QueryEmbeddingCache(
+            self.embeddings.embed_query,
+            max_entries=query_cache_size,
+            embed_many_fn=self.embeddings.embed_documents
+        )
+        self._change_listeners: List[Callable[[NoticeChange], None]] = []
 
         os.makedirs(persist_directory, exist_ok=True)
 
+        # 클라이언트와 컬렉션 핸들은 인스턴스 수명 동안 하나만 유지하고 LangChain 래퍼와 공유
+        # 일반 읽기/쓰기는 read lock으로 동시에 진행하고, 컬렉션 교체(삭제/재생성)만 write lock으로 보호
+        self._handle_lock = ReadWriteLock()
+        # chromadb는 import만으로 1초 가까이 걸리므로 저장소를 실제로 열 때 불러옴
+        import chromadb
+        self.client = chromadb.PersistentClient(path=persist_directory)
+        self._open_collection()
+
+        # notice_id → 청크 ID 인덱스 (중복 검사와 삭제 시 컬렉션 전체 스캔을 피하기 위함)
+        self.notice_index = NoticeIdIndex(os.path.join(persist_directory, "notice_index.sqlite3"))
+        self._sync_notice_index()
+
+        # 학과명, 전화번호처럼 정확한 용어가 중요한 질의를 위한 형태소 BM25 역색인
+        # Kiwi 분석기 생성만 1초 가까이 걸리므로 첫 하이브리드 검색(또는 prepare_keyword_index) 때 만들고,
+        # 그 전까지는 쓰기 시 색인을 건너뛴 뒤 만들 때 컬렉션과 비교해 밀린 청크를 색인
+        self.keyword_index_path = os.path.join(persist_directory, "keyword_index.sqlite3")
+        self._keyword_index: Optional[KeywordIndex] = None
+        self._keyword_lock = threading.Lock()
+        self._search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid-search")
+
+        # campus/category/게시일 필터용 메모리 인덱스. 첫 필터 검색 때 컬렉션 메타데이터로 한 번 만들고 이후 증분 갱신
+        # Chroma 청크 ID는 문자열이므로 인덱스용 정수 위치를 따로 부여
+        self.exact_scan_limit = exact_scan_limit
+        self.metadata_index = MetadataIndex()
+        self._metadata_lock = threading.Lock()
+        self._metadata_ready = False
+        self._chunk_positions: Dict[str, int] = {}
+        self._position_chunks: List[Optional[str]] = []
+        # 삭제된 청크의 위치는 빈 자리(None)로 남으므로, 빈 자리가 이 개수와 비율을 모두 넘으면 위치를 다시 매김
+        self.metadata_compact_min = 1024
+        self.metadata_compact_ratio = 0.25
+
+    def _open_collection(self):
+        from langchain_community.vectorstores import Chroma
+
         self.vectorstore = Chroma(
+            client=self.client,
             collection_name=self.collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=persist_directory
+            embedding_function=self.embeddings
+        )
+        self.collection = self.client.get_or_create_collection(
+            name=self.collection_name,
+            embedding_function=None
         )
 
+    def warmup(self) -> float:
+        """임베딩 모델과 메타데이터 인덱스를 미리 준비해 첫 검색 지연을 없앱니다. 걸린 시간(초)을 반환합니다."""
+        start = time.perf_counter()
+        if hasattr(self.embeddings, "warmup"):
+            self.embeddings.warmup()
+        with self._handle_lock.read_lock():
+            self._ensure_metadata_index()
+        return time.perf_counter() - start
+
+    def add_change_listener(self, listener: Callable[[NoticeChange], None]):
+        """공지사항 청크가 추가/변경/삭제될 때 호출될 리스너를 등록합니다."""
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, change: NoticeChange):
+        for listener in self._change_listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                print(f"⚠️  변경 리스너 오류: {e}")
+
+    def _sync_notice_index(self):
+        """인덱스의 청크 ID를 컬렉션의 청크 ID와 비교해 어긋난 부분만 고칩니다 (기존 DB, 인덱스 파일 유실/불일치 등).
+
+        컬렉션에서는 ID만 읽고, 인덱스에 없는 청크만 메타데이터를 읽어 notice_id를 확인합니다.
+        notice_id가 없는 청크는 인덱스에 들어가지 않으므로 시작할 때마다 그 청크의 메타데이터만 다시 읽습니다.
+        """
+        try:
+            with self._handle_lock.read_lock():
+                collection_ids = set(self.collection.get(include=[])['ids'])
+                indexed_ids = self.notice_index.chunk_ids()
+                missing = sorted(collection_ids - indexed_ids)
+                pairs = []
+                # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+                for start in range(0, len(missing), 5000):
+                    results = self.collection.get(ids=missing[start:start + 5000], include=['metadatas'])
+                    pairs.extend(
+                        (metadata['notice_id'], chunk_id)
+                        for chunk_id, metadata in zip(results['ids'], results['metadatas'])
+                        if metadata and metadata.get('notice_id')
+                    )
+        except Exception:
+            return
+
+        stale = indexed_ids - collection_ids
+        if stale:
+            self.notice_index.remove_chunks(stale)
+        if pairs:
+            print(f"🗂️ notice_id 인덱스 보정: {len(pairs)}개 추가, {len(stale)}개 삭제")
+            self.notice_index.add_many(pairs)
+
+    @property
+    def keyword_index(self) -> KeywordIndex:
+        """BM25 키워드 인덱스. 처음 접근할 때 만들고 컬렉션과 맞춥니다. read lock을 잡은 상태에서 접근하면 안 됩니다."""
+        if self._keyword_index is None:
+            with self._keyword_lock:
+                if self._keyword_index is None:
+                    index = KeywordIndex(self.keyword_index_path)
+                    # 동기화 중에 들어온 쓰기가 빠지지 않도록 쓰기를 막고 맞춘 뒤 공개
+                    with self._handle_lock.write_lock():
+                        self._sync_keyword_index(index)
+                        self._keyword_index = index
+        return self._keyword_index
+
+    def prepare_keyword_index(self) -> None:
+        """하이브리드 검색을 쓰는 서빙 프로세스가 warm-up 때 호출해 첫 검색 지연을 없앱니다."""
+        _ = self.keyword_index
+
+    def _sync_keyword_index(self, index: KeywordIndex):
+        """키워드 인덱스를 컬렉션과 청크 ID/content_hash 단위로 비교해, 없거나 본문이 바뀐 청크만 다시 형태소 분석합니다.
+
+        청크 수만 비교하면 다른 프로세스의 삭제+추가나 본문 수정이 있어도 같은 수로 보여 BM25 색인이 낡은 채 남습니다.
+        write lock을 잡은 상태에서 호출해야 합니다.
+        """
+        results = self.collection.get(include=['metadatas'])
+        collection_hashes = {
+            chunk_id: (metadata or {}).get('content_hash')
+            for chunk_id, metadata in zip(results['ids'], results['metadatas'])
+        }
+        indexed_hashes = index.chunk_hashes()
+        # content_hash가 없는 예전 청크는 색인 여부만 확인 (매번 다시 분석하지 않도록)
+        outdated = sorted(
+            chunk_id for chunk_id, content_hash in collection_hashes.items()
+            if chunk_id not in indexed_hashes
+            or (content_hash is not None and indexed_hashes[chunk_id] != content_hash)
+        )
+        chunks = []
+        # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+        for start in range(0, len(outdated), 5000):
+            batch = self.collection.get(ids=outdated[start:start + 5000], include=['documents', 'metadatas'])
+            chunks.extend(zip(batch['ids'], batch['documents'], batch['metadatas']))
+
+        stale = set(indexed_hashes) - set(collection_hashes)
+        if stale:
+            index.remove_chunks(stale)
+        if chunks:
+            print(f"🔤 키워드 인덱스 보정 중... ({len(chunks)}개 청크 색인, {len(stale)}개 삭제)")
+            index.add_many(
+                ((chunk_id, text, (metadata or {}).get('campus')) for chunk_id, text, metadata in chunks),
+                content_hashes={chunk_id: (metadata or {}).get('content_hash') for chunk_id, _, metadata in chunks}
+            )
+
+    def _chunk_position(self, chunk_id: str) -> int:
+        position = self._chunk_positions.get(chunk_id)
+        if position is None:
+            position = len(self._position_chunks)
+            self._chunk_positions[chunk_id] = position
+            self._position_chunks.append(chunk_id)
+        return position
+
+    def _index_metadata(self, ids: List[str], metadatas: List[Dict[str, Any]]):
+        with self._metadata_lock:
+            if self._metadata_ready:
+                self.metadata_index.add_many(
+                    (self._chunk_position(chunk_id), metadata) for chunk_id, metadata in zip(ids, metadatas)
+                )
+
+    def _unindex_metadata(self, chunk_ids: List[str]):
+        with self._metadata_lock:
+            if not self._metadata_ready:
+                return
+            positions = []
+            for chunk_id in chunk_ids:
+                position = self._chunk_positions.pop(chunk_id, None)
+                if position is not None:
+                    self._position_chunks[position] = None
+                    positions.append(position)
+            self.metadata_index.remove_many(positions)
+
+            tombstones = len(self._position_chunks) - len(self._chunk_positions)
+            if (tombstones >= self.metadata_compact_min
+                    and tombstones > len(self._position_chunks) * self.metadata_compact_ratio):
+                self._compact_metadata_positions()
+
+    def _compact_metadata_positions(self):
+        """살아 있는 청크에 0부터 위치를 다시 매기고 메타데이터 인덱스도 새 위치로 옮깁니다.
+
+        _metadata_lock을 잡은 상태에서 호출해야 합니다.
+        """
+        live = [chunk_id for chunk_id in self._position_chunks if chunk_id is not None]
+        self.metadata_index.remap({
+            self._chunk_positions[chunk_id]: position for position, chunk_id in enumerate(live)
+        })
+        self._position_chunks = live
+        self._chunk_positions = {chunk_id: position for position, chunk_id in enumerate(live)}
+
+    def _reset_metadata_index(self):
+        with self._metadata_lock:
+            self.metadata_index.clear()
+            self._chunk_positions.clear()
+            self._position_chunks.clear()
+            self._metadata_ready = False
+
+    def _ensure_metadata_index(self):
+        """메타데이터 인덱스를 처음 사용할 때 컬렉션 전체 메타데이터로 채웁니다. read lock을 잡은 상태에서 호출해야 합니다."""
+        if self._metadata_ready:
+            return
+        with self._metadata_lock:
+            if self._metadata_ready:
+                return
+            results = self.collection.get(include=['metadatas'])
+            self.metadata_index.add_many(
+                (self._chunk_position(chunk_id), metadata or {})
+                for chunk_id, metadata in zip(results['ids'], results['metadatas'])
+            )
+            self._metadata_ready = True
+
+    def _prepare_chunks(self, documents: List[Document]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        return prepare_chunks(documents)
+
+    def _write_chunks(
+            self,
+            ids: List[str],
+            texts: List[str],
+            metadatas: List[Dict[str, Any]],
+            embeddings: Optional[List[List[float]]] = None
+    ):
+        """embeddings를 주면 (메타데이터만 바뀐 청크) 다시 임베딩하지 않고 저장된 벡터를 그대로 씁니다."""
+        if not ids:
+            return
+        if embeddings is None:
+            embeddings = self.embeddings.embed_documents(texts)
+        self.collection.upsert(ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas)
+        self.notice_index.add_many(
+            (metadata.get('notice_id'), chunk_id)
+            for metadata, chunk_id in zip(metadatas, ids)
+        )
+        # 키워드 인덱스를 아직 만들지 않았으면(하이브리드 검색 미사용) 형태소 분석을 건너뜀. 만들 때 동기화로 따라잡음
+        if self._keyword_index is not None:
+            self._keyword_index.add_many(
+                ((chunk_id, text, metadata.get('campus')) for chunk_id, text, metadata in zip(ids, texts, metadatas)),
+                content_hashes={chunk_id: metadata.get('content_hash') for chunk_id, metadata in zip(ids, metadatas)}
+            )
+        self._index_metadata(ids, metadatas)
+        self._notify_change(NoticeChange(
+            notice_ids={metadata['notice_id'] for metadata in metadatas if metadata.get('notice_id')},
+            campuses={metadata['campus'] for metadata in metadatas if metadata.get('campus')},
+            embeddings=embeddings
+        ))
+
+    def _add_documents(self, documents: List[Document]) -> List[str]:
+        ids, metadatas = self._prepare_chunks(documents)
+        self._write_chunks(ids, [doc.page_content for doc in documents], metadatas)
+        return ids
+
     def add_documents(self, documents: List[Document]) -> List[str]:
-        return self.vectorstore.add_documents(documents)
+        with self._handle_lock.read_lock():
+            return self._add_documents(documents)
+
+    def has_notice(self, notice_id: str) -> bool:
+        """notice_id가 이미 저장되어 있는지 인덱스로 확인합니다."""
+        return self.notice_index.contains(notice_id)
 
     def add_documents_with_dedup(self, documents: List[Document]) -> List[str]:
         """notice_id 기반으로 중복을 방지하며 문서를 추가합니다."""
-        # 기존 notice_id 목록 가져오기
-        existing_notice_ids = self.get_existing_notice_ids()
-
         # 중복되지 않은 문서만 필터링
         new_documents = []
         for doc in documents:
             notice_id = doc.metadata.get('notice_id')
-            if notice_id and notice_id not in existing_notice_ids:
+            if notice_id and not self.has_notice(notice_id):
                 new_documents.append(doc)
                 print(f"📄 새 문서 추가: {doc.metadata.get('title', 'Unknown')} (ID: {notice_id})")
             elif notice_id:
@@ -43,47 +322,116 @@ class NoticeVectorStore:
 
         if new_documents:
             print(f"✅ {len(new_documents)}개 새 문서를 벡터 저장소에 추가")
-            return self.vectorstore.add_documents(new_documents)
+            return self.add_documents(new_documents)
         else:
             print("📚 추가할 새 문서가 없습니다")
             return []
 
     def get_existing_notice_ids(self) -> set:
         """기존에 저장된 notice_id 목록을 가져옵니다."""
-        try:
-            client = chromadb.PersistentClient(path=self.persist_directory)
-            collection = client.get_collection(name=self.collection_name)
-            results = collection.get(include=['metadatas'])
-
-            notice_ids = set()
-            for metadata in results['metadatas']:
-                if metadata and 'notice_id' in metadata:
-                    notice_ids.add(metadata['notice_id'])
+        return self.notice_index.notice_ids()
+
+    def _campus_filter_dict(self, campus_filter: Optional[Campus]) -> Optional[Dict[str, Any]]:
+        if not campus_filter:
+            return None
+        return {
+            "$or": [
+                {"campus": Campus.ALL.value},
+                {"campus": campus_filter.value}
+            ]
+        }
+
+    @staticmethod
+    def _metadata_where(metadata_filter: MetadataFilter) -> Optional[Dict[str, Any]]:
+        """campus/category 조건을 Chroma where 절로 바꿉니다. 게시일은 문자열로 저장되어 있어 후처리로 거릅니다."""
+        clauses = []
+        campuses = metadata_filter.campuses()
+        if campuses is not None:
+            clauses.append({"campus": {"$in": sorted(campuses)}})
+        if metadata_filter.categories is not None:
+            clauses.append({"category": {"$in": sorted(metadata_filter.categories)}})
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+    def _filtered_search(
+            self,
+            embedding: List[float],
+            k: int,
+            metadata_filter: MetadataFilter
+    ) -> List[tuple[Document, float]]:
+        """메타데이터 인덱스로 후보를 먼저 구한 뒤 검색합니다. read lock을 잡은 상태에서 호출해야 합니다.
+
+        후보가 exact_scan_limit 이하이면 후보 청크의 임베딩만 가져와 거리를 직접 계산하고,
+        그보다 많으면 where 절로 HNSW 검색을 하되 게시일 조건은 부족한 만큼 더 가져오며 후처리합니다.
+        """
+        self._ensure_metadata_index()
+        # 위치 압축과 겹치지 않도록 후보 위치를 청크 ID로 바꾸는 동안 _metadata_lock을 잡음
+        with self._metadata_lock:
+            candidates = self.metadata_index.candidates(metadata_filter)
+            if len(candidates) == 0:
+                return []
+            chunk_ids = (
+                [self._position_chunks[position] for position in candidates]
+                if len(candidates) <= self.exact_scan_limit else None
+            )
 
-            return notice_ids
-        except Exception:
-            # 컬렉션이 없거나 오류 시 빈 세트 반환
-            return set()
+        if chunk_ids is not None:
+            response = self.collection.get(
+                ids=[chunk_id for chunk_id in chunk_ids if chunk_id is not None],
+                include=['documents', 'metadatas', 'embeddings']
+            )
+            if not response['ids']:
+                return []
+            top, distances = top_k(squared_l2_distances(embedding, response['embeddings'])[0], k, largest=False)
+            return [
+                (Document(page_content=response['documents'][i], metadata=response['metadatas'][i] or {}),
+                 float(distance))
+                for i, distance in zip(top.tolist(), distances.tolist())
+            ]
+
+        where = self._metadata_where(metadata_filter)
+        needs_post_filter = metadata_filter.since is not None or metadata_filter.until is not None
+        n_results = k * 4 if needs_post_filter else k
+        while True:
+            response = self.collection.query(
+                query_embeddings=[embedding],
+                n_results=n_results,
+                where=where,
+                include=['documents', 'metadatas', 'distances']
+            )
+            results = [
+                (Document(page_content=text, metadata=metadata or {}), distance)
+                for text, metadata, distance in zip(
+                    response['documents'][0], response['metadatas'][0], response['distances'][0]
+                )
+                if not needs_post_filter or metadata_filter.matches(metadata or {})
+            ]
+            if len(results) >= k or len(response['ids'][0]) < n_results or n_results >= len(self.metadata_index):
+                return results[:k]
+            n_results *= 4
+
+    def embed_query(self, query: str) -> List[float]:
+        """질의 임베딩을 캐시에서 가져오거나 계산합니다."""
+        return self.query_cache.get(query)
 
     def similarity_search(
             self,
             query: str,
             k: int = 5,
-            campus_filter: Optional[Campus] = None
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
     ) -> List[Document]:
-
-        if campus_filter:
-            filter_dict = {
-                "$or": [
-                    {"campus": Campus.ALL.value},
-                    {"campus": campus_filter.value}
-                ]
-            }
-            results = self.vectorstore.similarity_search(
-                query, k=k, filter=filter_dict
+        if metadata_filter is not None:
+            return [
+                doc for doc, _ in self.similarity_search_with_score(query, k, campus_filter, metadata_filter)
+            ]
+
+        embedding = self.embed_query(query)
+        with self._handle_lock.read_lock():
+            results = self.vectorstore.similarity_search_by_vector(
+                embedding, k=k, filter=self._campus_filter_dict(campus_filter)
             )
-        else:
-            results = self.vectorstore.similarity_search(query, k=k)
 
         return results
 
@@ -91,53 +439,246 @@ class NoticeVectorStore:
             self,
             query: str,
             k: int = 5,
-            campus_filter: Optional[Campus] = None
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
     ) -> List[tuple[Document, float]]:
+        """metadata_filter(카테고리, 게시일 등)를 주면 메타데이터 인덱스로 후보를 좁혀 검색합니다."""
+        embedding = self.embed_query(query)
+        if metadata_filter is not None:
+            metadata_filter = combine_filters(campus_filter, metadata_filter)
+        if metadata_filter is not None:
+            with self._handle_lock.read_lock():
+                return self._filtered_search(embedding, k, metadata_filter)
+
+        with self._handle_lock.read_lock():
+            results = self.vectorstore.similarity_search_by_vector_with_relevance_scores(
+                embedding, k=k, filter=self._campus_filter_dict(campus_filter)
+            )
 
-        if campus_filter:
-            filter_dict = {
-                "$or": [
-                    {"campus": Campus.ALL.value},
-                    {"campus": campus_filter.value}
-                ]
-            }
-            results = self.vectorstore.similarity_search_with_score(
-                query, k=k, filter=filter_dict
+        return results
+
+    def max_marginal_relevance_search_with_score(
+            self,
+            query: str,
+            k: int = 5,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            campus_filter: Optional[Campus] = None,
+            max_chunks_per_notice: Optional[int] = None
+    ) -> List[tuple[Document, float]]:
+        """후보 fetch_k개를 임베딩과 함께 가져와 MMR로 k개를 다시 고릅니다.
+
+        같은 공지사항의 겹치는 청크가 상위를 채우지 않도록 하며, max_chunks_per_notice로 공지사항당 청크 수를 제한합니다.
+        점수는 다른 검색과 같은 벡터 거리이고 결과는 MMR 선택 순서입니다.
+        """
+        embedding = self.embed_query(query)
+        with self._handle_lock.read_lock():
+            response = self.collection.query(
+                query_embeddings=[embedding],
+                n_results=max(fetch_k, k),
+                where=self._campus_filter_dict(campus_filter),
+                include=['documents', 'metadatas', 'distances', 'embeddings']
             )
-        else:
-            results = self.vectorstore.similarity_search_with_score(query, k=k)
+        if not response['ids'][0]:
+            return []
+
+        metadatas = [metadata or {} for metadata in response['metadatas'][0]]
+        selected = mmr_select(
+            embedding,
+            response['embeddings'][0],
+            k,
+            lambda_mult=lambda_mult,
+            groups=[metadata.get('notice_id') or chunk_id for metadata, chunk_id in zip(metadatas, response['ids'][0])],
+            max_per_group=max_chunks_per_notice
+        )
+        return [
+            (Document(page_content=response['documents'][0][i], metadata=metadatas[i]), response['distances'][0][i])
+            for i in selected
+        ]
+
+    def max_marginal_relevance_search(
+            self,
+            query: str,
+            k: int = 5,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            campus_filter: Optional[Campus] = None,
+            max_chunks_per_notice: Optional[int] = None
+    ) -> List[Document]:
+        return [
+            doc for doc, _ in self.max_marginal_relevance_search_with_score(
+                query, k, fetch_k, lambda_mult, campus_filter, max_chunks_per_notice
+            )
+        ]
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """여러 질의 임베딩을 캐시에서 가져오고, 없는 것은 한 번의 배치로 계산합니다."""
+        return self.query_cache.get_many(queries)
+
+    def similarity_search_with_score_batch(
+            self,
+            queries: List[str],
+            k: int = 5,
+            campus_filters: Optional[List[Optional[Campus]]] = None
+    ) -> List[List[tuple[Document, float]]]:
+        """여러 질의를 한꺼번에 검색합니다. 임베딩은 한 번에 계산하고, 같은 캠퍼스 필터끼리 묶어 컬렉션을 한 번씩 조회합니다."""
+        if campus_filters is None:
+            campus_filters = [None] * len(queries)
+
+        embeddings = self.embed_queries(queries)
+        groups: Dict[Optional[Campus], List[int]] = {}
+        for i, campus_filter in enumerate(campus_filters):
+            groups.setdefault(campus_filter, []).append(i)
+
+        results: List[List[tuple[Document, float]]] = [[] for _ in queries]
+        with self._handle_lock.read_lock():
+            for campus_filter, indices in groups.items():
+                response = self.collection.query(
+                    query_embeddings=[embeddings[i] for i in indices],
+                    n_results=k,
+                    where=self._campus_filter_dict(campus_filter),
+                    include=['documents', 'metadatas', 'distances']
+                )
+                for row, i in enumerate(indices):
+                    results[i] = [
+                        (Document(page_content=text, metadata=metadata or {}), distance)
+                        for text, metadata, distance in zip(
+                            response['documents'][row], response['metadatas'][row], response['distances'][row]
+                        )
+                    ]
 
         return results
 
+    def hybrid_search(
+            self,
+            query: str,
+            k: int = 5,
+            campus_filter: Optional[Campus] = None,
+            fetch_k: Optional[int] = None,
+            rrf_k: int = 60
+    ) -> Tuple[List[tuple[Document, float]], Dict[str, float]]:
+        """벡터 검색과 BM25 키워드 검색을 동시에 실행하고 Reciprocal Rank Fusion으로 합칩니다.
+
+        결과는 RRF 순서이며 점수는 다른 검색과 같은 벡터 거리입니다 (키워드로만 찾은 청크도 저장된 임베딩으로 계산).
+        각 문서 메타데이터에 rrf_score, bm25_score, keyword_coverage를 붙이고, 두 번째 값으로 단계별 지연 시간(ms)을 반환합니다.
+        """
+        fetch_k = fetch_k or k * 2
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        def vector_branch():
+            began = time.perf_counter()
+            embedding = self.embed_query(query)
+            timings["embed_ms"] = (time.perf_counter() - began) * 1000
+
+            began = time.perf_counter()
+            with self._handle_lock.read_lock():
+                response = self.collection.query(
+                    query_embeddings=[embedding],
+                    n_results=fetch_k,
+                    where=self._campus_filter_dict(campus_filter),
+                    include=['documents', 'metadatas', 'distances']
+                )
+            timings["vector_ms"] = (time.perf_counter() - began) * 1000
+            return embedding, response
+
+        vector_future = self._search_executor.submit(vector_branch)
+
+        began = time.perf_counter()
+        campuses = {Campus.ALL.value, campus_filter.value} if campus_filter else None
+        keyword_hits = self.keyword_index.search(query, k=fetch_k, campuses=campuses)
+        timings["keyword_ms"] = (time.perf_counter() - began) * 1000
+
+        embedding, response = vector_future.result()
+
+        began = time.perf_counter()
+        found: Dict[str, tuple[str, Dict[str, Any], float]] = {
+            chunk_id: (text, metadata or {}, distance)
+            for chunk_id, text, metadata, distance in zip(
+                response['ids'][0], response['documents'][0], response['metadatas'][0], response['distances'][0]
+            )
+        }
+
+        fused: Dict[str, float] = {}
+        for rank, chunk_id in enumerate(response['ids'][0]):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+        keyword_scores = {}
+        for rank, (chunk_id, score, coverage) in enumerate(keyword_hits):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+            keyword_scores[chunk_id] = (score, coverage)
+
+        top_ids = sorted(fused, key=fused.get, reverse=True)[:k]
+
+        # 키워드로만 찾은 청크는 본문과 임베딩을 가져와 벡터 거리를 계산
+        missing = [chunk_id for chunk_id in top_ids if chunk_id not in found]
+        if missing:
+            with self._handle_lock.read_lock():
+                extra = self.collection.get(ids=missing, include=['documents', 'metadatas', 'embeddings'])
+            if extra['ids']:
+                distances = squared_l2_distances(embedding, extra['embeddings'])[0].tolist()
+                for chunk_id, text, metadata, distance in zip(
+                        extra['ids'], extra['documents'], extra['metadatas'], distances
+                ):
+                    found[chunk_id] = (text, metadata or {}, distance)
+
+        results = []
+        for chunk_id in top_ids:
+            if chunk_id not in found:
+                continue
+            text, metadata, distance = found[chunk_id]
+            bm25_score, coverage = keyword_scores.get(chunk_id, (0.0, 0.0))
+            metadata = {
+                **metadata,
+                "rrf_score": fused[chunk_id],
+                "bm25_score": bm25_score,
+                "keyword_coverage": coverage
+            }
+            results.append((Document(page_content=text, metadata=metadata), distance))
+
+        timings["fusion_ms"] = (time.perf_counter() - began) * 1000
+        timings["total_ms"] = (time.perf_counter() - start) * 1000
+        return results, timings
+
+    def get_query_cache_stats(self) -> Dict[str, float]:
+        return self.query_cache.stats()
+
     def delete_collection(self):
+        with self._handle_lock.write_lock():
+            self._delete_collection()
+
+    def _delete_collection(self):
+        """컬렉션을 삭제하고 빈 컬렉션으로 핸들을 다시 엽니다. write lock을 잡은 상태에서 호출해야 합니다."""
         try:
-            client = chromadb.PersistentClient(path=self.persist_directory)
-            client.delete_collection(name=self.collection_name)
+            self.client.delete_collection(name=self.collection_name)
         except Exception:
             pass
+        self.notice_index.clear()
+        if self._keyword_index is not None:
+            self._keyword_index.clear()
+        self._reset_metadata_index()
+        self._open_collection()
+        self._notify_change(NoticeChange(notice_ids=set(), reset=True))
 
     def get_collection_info(self) -> Dict[str, Any]:
         try:
-            client = chromadb.PersistentClient(path=self.persist_directory)
-            collection = client.get_collection(name=self.collection_name)
-            return {
-                "name": collection.name,
-                "count": collection.count(),
-                "metadata": collection.metadata
-            }
+            with self._handle_lock.read_lock():
+                collection = self.collection
+                return {
+                    "name": collection.name,
+                    "count": collection.count(),
+                    "metadata": collection.metadata
+                }
         except Exception:
             return {"name": self.collection_name, "count": 0, "metadata": {}}
 
     def get_documents_by_id(self, notice_id: str) -> List[Document]:
         """특정 notice_id로 문서들을 조회합니다."""
         try:
-            client = chromadb.PersistentClient(path=self.persist_directory)
-            collection = client.get_collection(name=self.collection_name)
-
-            results = collection.get(
-                where={"notice_id": notice_id},
-                include=['documents', 'metadatas']
-            )
+            with self._handle_lock.read_lock():
+                results = self.collection.get(
+                    where={"notice_id": notice_id},
+                    include=['documents', 'metadatas']
+                )
 
             documents = []
             for i, doc in enumerate(results['documents']):
@@ -151,33 +692,183 @@ class NoticeVectorStore:
     def delete_documents_by_id(self, notice_id: str) -> int:
         """특정 notice_id로 문서들을 삭제합니다."""
         try:
-            client = chromadb.PersistentClient(path=self.persist_directory)
-            collection = client.get_collection(name=self.collection_name)
-
-            # 먼저 해당 ID의 문서들을 찾기
-            results = collection.get(
-                where={"notice_id": notice_id},
-                include=['metadatas']
-            )
-
-            if results['ids']:
-                collection.delete(ids=results['ids'])
-                return len(results['ids'])
+            with self._handle_lock.read_lock():
+                chunk_ids = self.notice_index.get_chunk_ids(notice_id)
+                if chunk_ids:
+                    self.collection.delete(ids=chunk_ids)
+                    self.notice_index.remove(notice_id)
+                    if self._keyword_index is not None:
+                        self._keyword_index.remove_chunks(chunk_ids)
+                    self._unindex_metadata(chunk_ids)
+                    self._notify_change(NoticeChange(notice_ids={notice_id}))
+                    return len(chunk_ids)
 
             return 0
         except Exception:
             return 0
 
-    def update_documents(self, documents: List[Document]) -> List[str]:
-        self.delete_collection()
-
-        self.vectorstore = Chroma(
-            collection_name=self.collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=self.persist_directory
+    def upsert_documents(self, documents: List[Document]) -> List[str]:
+        """notice_id 단위로 기존 청크와 비교하여 바뀐 청크만 다시 임베딩/저장하고 남는 청크는 삭제합니다."""
+        ids, stats = self._upsert_documents(documents)
+        print(
+            f"🔄 문서 upsert: {stats['written']}개 갱신, {stats['relabeled']}개 메타데이터 갱신, "
+            f"{stats['unchanged']}개 유지, {stats['deleted']}개 삭제"
         )
+        return ids
+
+    def _upsert_documents(self, documents: List[Document]) -> Tuple[List[str], Dict[str, int]]:
+        ids, metadatas = self._prepare_chunks(documents)
+        texts = [doc.page_content for doc in documents]
+
+        with self._handle_lock.read_lock():
+            notice_ids = {metadata['notice_id'] for metadata in metadatas if metadata.get('notice_id')}
+            existing_ids = [
+                chunk_id
+                for notice_id in notice_ids
+                for chunk_id in self.notice_index.get_chunk_ids(notice_id)
+            ]
+            # notice_id가 없는 청크는 본문 해시로 만든 ID라 인덱스 대신 ID로 직접 조회
+            anonymous_ids = [
+                chunk_id for chunk_id, metadata in zip(ids, metadatas) if not metadata.get('notice_id')
+            ]
+
+            existing_metadatas = {}
+            lookup_ids = existing_ids + anonymous_ids
+            if lookup_ids:
+                results = self.collection.get(ids=lookup_ids, include=['metadatas'])
+                for chunk_id, metadata in zip(results['ids'], results['metadatas']):
+                    existing_metadatas[chunk_id] = metadata or {}
+
+            # 본문이 바뀐 청크만 다시 임베딩하고, 제목/캠퍼스/카테고리/날짜 등 메타데이터만 바뀐 청크는 저장된 벡터로 다시 씀
+            changed, relabeled = [], []
+            for i, (chunk_id, metadata) in enumerate(zip(ids, metadatas)):
+                existing = existing_metadatas.get(chunk_id)
+                if existing is None or existing.get('content_hash') != metadata['content_hash']:
+                    changed.append(i)
+                elif existing != metadata:
+                    relabeled.append(i)
+            stale_ids = sorted(set(existing_ids) - set(ids))
+
+            # 새 청크를 먼저 쓰고 남는 청크를 지워 조회 중에 공지사항이 비어 보이는 구간이 없도록 함
+            self._write_chunks(
+                [ids[i] for i in changed],
+                [texts[i] for i in changed],
+                [metadatas[i] for i in changed]
+            )
+            if relabeled:
+                relabeled_ids = [ids[i] for i in relabeled]
+                stored = self.collection.get(ids=relabeled_ids, include=['embeddings'])
+                vectors = dict(zip(stored['ids'], stored['embeddings']))
+                self._write_chunks(
+                    relabeled_ids,
+                    [texts[i] for i in relabeled],
+                    [metadatas[i] for i in relabeled],
+                    embeddings=[[float(value) for value in vectors[chunk_id]] for chunk_id in relabeled_ids]
+                )
+            if stale_ids:
+                self.collection.delete(ids=stale_ids)
+                self.notice_index.remove_chunks(stale_ids)
+                if self._keyword_index is not None:
+                    self._keyword_index.remove_chunks(stale_ids)
+                self._unindex_metadata(stale_ids)
+                self._notify_change(NoticeChange(notice_ids=notice_ids))
+
+        return ids, {
+            "written": len(changed),
+            "relabeled": len(relabeled),
+            "unchanged": len(ids) - len(changed) - len(relabeled),
+            "deleted": len(stale_ids)
+        }
+
+    def update_documents(self, documents: List[Document], rebuild: bool = False) -> List[str]:
+        """컬렉션 내용을 주어진 문서들로 맞춥니다.
+
+        기본은 diff 기반 upsert로, 바뀐 청크만 다시 임베딩하고 목록에 없는 공지사항은 삭제합니다.
+        rebuild=True이면 기존처럼 컬렉션을 지우고 전부 다시 추가합니다.
+        """
+        if rebuild:
+            with self._handle_lock.write_lock():
+                self._delete_collection()
+                return self._add_documents(documents)
+
+        ids, stats = self._upsert_documents(documents)
+
+        keep_notice_ids = {doc.metadata.get('notice_id') for doc in documents}
+        removed_notice_ids = self.notice_index.notice_ids() - keep_notice_ids
+        for notice_id in removed_notice_ids:
+            stats["deleted"] += self.delete_documents_by_id(notice_id)
+        stats["deleted"] += self._delete_orphan_chunks(set(ids))
+
+        print(
+            f"🔄 문서 업데이트: {stats['written']}개 갱신, {stats['relabeled']}개 메타데이터 갱신, "
+            f"{stats['unchanged']}개 유지, {stats['deleted']}개 삭제"
+        )
+        return ids
+
+    def _delete_orphan_chunks(self, keep_ids: Set[str]) -> int:
+        """notice_id가 없는 청크 중 이번 문서 목록에 없는 것(본문이 바뀌었거나 빠진 것, 예전 uuid ID 청크)을 지웁니다."""
+        with self._handle_lock.read_lock():
+            candidates = sorted(set(self.collection.get(include=[])['ids']) - keep_ids - self.notice_index.chunk_ids())
+            if not candidates:
+                return 0
+            # 동시에 쓰이는 중이라 아직 인덱스에 없는 공지사항 청크는 건드리지 않도록 메타데이터로 다시 확인
+            results = self.collection.get(ids=candidates, include=['metadatas'])
+            orphan_ids = [
+                chunk_id for chunk_id, metadata in zip(results['ids'], results['metadatas'])
+                if not (metadata or {}).get('notice_id')
+            ]
+            if not orphan_ids:
+                return 0
+            self.collection.delete(ids=orphan_ids)
+            if self._keyword_index is not None:
+                self._keyword_index.remove_chunks(orphan_ids)
+            self._unindex_metadata(orphan_ids)
+        # 어느 답변이 이 청크를 근거로 했는지 notice_id로 알 수 없으므로 파생 캐시를 모두 비움
+        self._notify_change(NoticeChange(notice_ids=set(), reset=True))
+        return len(orphan_ids)
+
+
+def distance_to_similarity(distance: float) -> float:
+    """Chroma 기본 거리(제곱 L2)를 코사인 유사도로 바꿉니다. 정규화된 임베딩에서는 d = 2 - 2cos 입니다."""
+    return 1.0 - distance / 2.0
+
+
+def compute_content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def make_chunk_id(notice_id: str, chunk_index: int) -> str:
+    return f"{notice_id}:{chunk_index}"
+
+
+def prepare_chunks(documents: List[Document]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """청크마다 결정적 ID(notice_id:chunk_index)와 content_hash 메타데이터를 부여합니다.
+
+    notice_id가 없는 청크는 본문 해시로 ID(anon-<content_hash>:n)를 만들어, 같은 문서를 다시 넣어도 중복되지 않게 합니다.
+    """
+    ids = []
+    metadatas = []
+    chunk_counters: Dict[str, int] = {}
+
+    for doc in documents:
+        metadata = {key: value for key, value in doc.metadata.items() if value is not None}
+        metadata["content_hash"] = compute_content_hash(doc.page_content)
+
+        notice_id = metadata.get("notice_id")
+        if notice_id:
+            chunk_index = chunk_counters.get(notice_id, 0)
+            chunk_counters[notice_id] = chunk_index + 1
+            metadata["chunk_index"] = chunk_index
+            ids.append(make_chunk_id(notice_id, chunk_index))
+        else:
+            anonymous_id = f"anon-{metadata['content_hash']}"
+            duplicate_index = chunk_counters.get(anonymous_id, 0)
+            chunk_counters[anonymous_id] = duplicate_index + 1
+            ids.append(make_chunk_id(anonymous_id, duplicate_index))
+
+        metadatas.append(metadata)
 
-        return self.add_documents(documents)
+    return ids, metadatas
 
 
 def create_vector_store_with_sample_data() -> NoticeVectorStore:
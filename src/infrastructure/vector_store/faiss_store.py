@@ -0,0 +1,725 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .chroma_store import NoticeChange, prepare_chunks
+from .metadata_index import MetadataFilter, MetadataIndex, combine_filters, parse_day
+from ..embedding.korean_embeddings import KoreanEmbeddings
+from ..embedding.query_cache import QueryEmbeddingCache
+from ..embedding.similarity import mmr_select, squared_l2_distances, top_k
+from ...domain.models import Campus
+from ...shared.utils.concurrency import ReadWriteLock
+
+INDEX_TYPES = ("flat", "hnsw", "ivf")
+
+
+def _import_faiss():
+    try:
+        import faiss
+        return faiss
+    except ImportError:
+        print("❌ faiss-cpu 패키지가 설치되지 않았습니다: pip install faiss-cpu")
+        raise
+
+
+class FaissNoticeVectorStore:
+    """NoticeVectorStore와 같은 API를 제공하는 FAISS 기반 저장소 (읽기 위주 서빙 노드용).
+
+    index_type: flat(소규모, 정확 검색) | hnsw(대규모, 빠른 근사 검색) | ivf(대규모, 메모리 매핑 로드).
+    벡터는 index.faiss에, 본문과 메타데이터는 docstore.sqlite3에 저장합니다.
+    read_only=True이면 인덱스를 mmap으로 열어 여러 프로세스가 페이지 캐시를 공유합니다 (faiss는 IVF 인덱스만 실제로 매핑).
+    거리 값은 Chroma와 같은 제곱 L2이므로 distance_to_similarity를 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(
+            self,
+            persist_directory: str = "./data/faiss_db",
+            index_type: str = "flat",
+            read_only: bool = False,
+            embeddings: Optional[KoreanEmbeddings] = None,
+            query_cache_size: int = 1024,
+            hnsw_m: int = 32,
+            ef_search: int = 64,
+            nlist: int = 1024,
+            nprobe: int = 16,
+            autosave: bool = True,
+            exact_scan_limit: int = 2048
+    ):
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"지원하지 않는 index_type: {index_type} (flat | hnsw | ivf)")
+
+        self.faiss = _import_faiss()
+        self.persist_directory = persist_directory
+        self.index_type = index_type
+        self.read_only = read_only
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.nlist = nlist
+        self.nprobe = nprobe
+        # 대량 적재 시에는 autosave=False로 두고 마지막에 save()를 한 번 호출
+        self.autosave = autosave
+        # 필터 후보가 이 개수 이하이면 근사 인덱스 대신 후보 벡터만 꺼내 정확히 계산 (HNSW는 선택적인 필터에서 recall이 떨어짐)
+        self.exact_scan_limit = exact_scan_limit
+
+        self.embeddings = embeddings or KoreanEmbeddings()
+        self.query_cache = QueryEmbeddingCache(
+            self.embeddings.embed_query,
+            max_entries=query_cache_size,
+            embed_many_fn=self.embeddings.embed_documents
+        )
+        self._change_listeners: List[Callable[[NoticeChange], None]] = []
+
+        os.makedirs(persist_directory, exist_ok=True)
+        self.index_path = os.path.join(persist_directory, "index.faiss")
+
+        # faiss 인덱스는 검색끼리는 동시에 실행해도 되지만 추가/삭제와는 겹치면 안 됨
+        self._index_lock = ReadWriteLock()
+        self._db_lock = threading.Lock()
+        self._docstore_path = os.path.join(persist_directory, "docstore.sqlite3")
+        self._inherited_conns: List[sqlite3.Connection] = []
+        self._conn = sqlite3.connect(self._docstore_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                faiss_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chunk_id TEXT UNIQUE NOT NULL,
+                notice_id TEXT,
+                campus TEXT,
+                document TEXT NOT NULL,
+                metadata TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_notice_id ON chunks(notice_id)")
+        self._conn.commit()
+
+        # campus/category/게시일 → faiss_id 인덱스. 살아 있는 벡터 ID 목록 역할도 겸함
+        self.metadata_index = MetadataIndex()
+        self.metadata_index.add_fields(
+            (faiss_id, (campus, category, parse_day(published)))
+            for faiss_id, campus, category, published in self._conn.execute(
+                """
+                SELECT faiss_id, campus, json_extract(metadata, '$.category'),
+                       coalesce(json_extract(metadata, '$.published_date'), json_extract(metadata, '$.date'))
+                FROM chunks
+                """
+            )
+        )
+        self._selectors: Dict[Optional[MetadataFilter], Any] = {}
+        self.index = self._load_index()
+
+    # ---- 인덱스 관리 ----
+
+    def _new_index(self, dimension: int, train_vectors: Optional[np.ndarray] = None):
+        faiss = self.faiss
+        if self.index_type == "flat":
+            return faiss.IndexIDMap2(faiss.IndexFlatL2(dimension))
+        if self.index_type == "hnsw":
+            base = faiss.IndexHNSWFlat(dimension, self.hnsw_m)
+            base.hnsw.efSearch = self.ef_search
+            return faiss.IndexIDMap2(base)
+
+        # IVF는 자체적으로 ID를 지원하므로 IDMap 없이 사용 (IDMap의 삭제는 IVF와 호환되지 않음)
+        # 학습 데이터가 적으면 클러스터당 최소 39개가 되도록 nlist를 줄임
+        nlist = max(1, min(self.nlist, len(train_vectors) // 39))
+        index = faiss.IndexIVFFlat(faiss.IndexFlatL2(dimension), dimension, nlist)
+        index.train(train_vectors)
+        index.set_direct_map_type(faiss.DirectMap.Hashtable)
+        index.nprobe = min(self.nprobe, nlist)
+        return index
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return None
+
+        flags = 0
+        if self.read_only:
+            flags = self.faiss.IO_FLAG_MMAP | self.faiss.IO_FLAG_READ_ONLY
+        index = self.faiss.read_index(self.index_path, flags)
+        print(f"📂 FAISS 인덱스 로드: {index.ntotal}개 벡터 ({self.index_type}{', mmap' if self.read_only else ''})")
+        return index
+
+    def save(self):
+        """인덱스를 디스크에 저장합니다. 임시 파일에 쓴 뒤 교체하므로 읽는 프로세스가 깨진 파일을 보지 않습니다."""
+        if self.read_only or self.index is None:
+            return
+        with self._index_lock.read_lock():
+            temp_path = f"{self.index_path}.tmp"
+            self.faiss.write_index(self.index, temp_path)
+            os.replace(temp_path, self.index_path)
+
+    def _autosave(self):
+        if self.autosave:
+            self.save()
+
+    def _check_writable(self):
+        if self.read_only:
+            raise RuntimeError("읽기 전용으로 연 FAISS 저장소에는 쓸 수 없습니다")
+
+    def _selector(self, metadata_filter: Optional[MetadataFilter], candidates: Optional[np.ndarray]):
+        """검색 대상 ID 선택자. 메타데이터 필터와 HNSW에서 지연 삭제된 벡터 제외를 함께 처리합니다."""
+        has_tombstones = self.index is not None and self.index.ntotal != len(self.metadata_index)
+        if metadata_filter is None and not has_tombstones:
+            return None
+
+        selector = self._selectors.get(metadata_filter)
+        if selector is None:
+            allowed = self.metadata_index.ids() if candidates is None else candidates
+            selector = self.faiss.IDSelectorBatch(allowed)
+            if len(self._selectors) >= 256:
+                self._selectors.clear()
+            self._selectors[metadata_filter] = selector
+        return selector
+
+    def _search_params(self, metadata_filter: Optional[MetadataFilter], candidates: Optional[np.ndarray]):
+        faiss = self.faiss
+        selector = self._selector(metadata_filter, candidates)
+        if self.index_type == "hnsw":
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=self.ef_search) if selector else None
+        if self.index_type == "ivf":
+            params = faiss.SearchParametersIVF(nprobe=self.index.nprobe)
+            if selector:
+                params.sel = selector
+            return params
+        return faiss.SearchParameters(sel=selector) if selector else None
+
+    def rebuild(self):
+        """살아 있는 벡터만으로 인덱스를 다시 만듭니다 (HNSW 지연 삭제 정리, IVF 재학습).
+
+        IVF는 첫 적재분으로 학습하므로, 처음에 적은 양으로 시작했다면 데이터가 쌓인 뒤 한 번 호출해 nlist를 키웁니다.
+        """
+        self._check_writable()
+        with self._index_lock.write_lock():
+            if self.index is None:
+                return
+            ids = self.metadata_index.ids()
+            if len(ids) == 0:
+                self.index = None
+            else:
+                vectors = np.vstack([self.index.reconstruct(int(faiss_id)) for faiss_id in ids]).astype(np.float32)
+                index = self._new_index(vectors.shape[1], vectors)
+                index.add_with_ids(vectors, ids)
+                self.index = index
+            self._selectors.clear()
+        if self.index is None:
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+        else:
+            self.save()
+
+    def warmup(self) -> float:
+        """임베딩 모델을 미리 불러와 첫 검색 지연을 없앱니다. 걸린 시간(초)을 반환합니다."""
+        start = time.perf_counter()
+        if hasattr(self.embeddings, "warmup"):
+            self.embeddings.warmup()
+        return time.perf_counter() - start
+
+    def reopen_after_fork(self):
+        """pre-fork 워커 프로세스에서 호출합니다.
+
+        인덱스와 메타데이터 인덱스는 부모와 copy-on-write로 공유하고, 프로세스 간에 공유하면 안 되는 SQLite 연결과 락만 새로 만듭니다.
+        물려받은 연결은 닫지 않고 참조만 남겨 둡니다 (자식에서 닫으면 WAL 정리로 부모의 파일이 손상될 수 있음).
+        """
+        self._inherited_conns.append(self._conn)
+        self._index_lock = ReadWriteLock()
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(self._docstore_path, check_same_thread=False)
+
+    # ---- 쓰기 ----
+
+    def add_change_listener(self, listener: Callable[[NoticeChange], None]):
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, change: NoticeChange):
+        for listener in self._change_listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                print(f"⚠️  변경 리스너 오류: {e}")
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        if not documents:
+            return []
+        embeddings = self.embeddings.embed_documents([doc.page_content for doc in documents])
+        return self.add_embeddings(documents, embeddings)
+
+    def add_embeddings(self, documents: List[Document], embeddings: List[List[float]]) -> List[str]:
+        """미리 계산된 임베딩으로 문서를 추가합니다 (Chroma에서 이전하거나 벤치마크할 때 사용)."""
+        self._check_writable()
+        ids, metadatas = prepare_chunks(documents)
+        if not ids:
+            return []
+        with self._index_lock.write_lock():
+            self._write_chunks(ids, [doc.page_content for doc in documents], metadatas, embeddings)
+
+        self._autosave()
+        self._notify_change(NoticeChange(
+            notice_ids={metadata['notice_id'] for metadata in metadatas if metadata.get('notice_id')},
+            campuses={metadata['campus'] for metadata in metadatas if metadata.get('campus')},
+            embeddings=np.asarray(embeddings, dtype=np.float32).tolist()
+        ))
+        return ids
+
+    def _write_chunks(
+            self,
+            ids: List[str],
+            texts: List[str],
+            metadatas: List[Dict[str, Any]],
+            embeddings: List[List[float]]
+    ):
+        """같은 청크 ID는 교체하며 청크를 씁니다. write lock을 잡은 상태에서 호출해야 합니다."""
+        if not ids:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        self._remove_chunk_ids(ids)
+        with self._db_lock:
+            faiss_ids = []
+            for chunk_id, text, metadata in zip(ids, texts, metadatas):
+                cursor = self._conn.execute(
+                    "INSERT INTO chunks (chunk_id, notice_id, campus, document, metadata) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        chunk_id,
+                        metadata.get("notice_id"),
+                        metadata.get("campus"),
+                        text,
+                        json.dumps(metadata, ensure_ascii=False)
+                    )
+                )
+                faiss_ids.append(cursor.lastrowid)
+            self._conn.commit()
+
+        if self.index is None:
+            self.index = self._new_index(vectors.shape[1], vectors)
+        self.index.add_with_ids(vectors, np.asarray(faiss_ids, dtype=np.int64))
+        self.metadata_index.add_many(zip(faiss_ids, metadatas))
+        self._selectors.clear()
+
+    def _relabel_chunks(self, ids: List[str], metadatas: List[Dict[str, Any]]):
+        """본문은 그대로이고 메타데이터만 바뀐 청크를 벡터는 두고 문서 저장소/메타데이터 인덱스만 갱신합니다.
+
+        write lock을 잡은 상태에서 호출해야 합니다.
+        """
+        if not ids:
+            return
+        with self._db_lock:
+            faiss_ids = []
+            for chunk_id, metadata in zip(ids, metadatas):
+                self._conn.execute(
+                    "UPDATE chunks SET notice_id = ?, campus = ?, metadata = ? WHERE chunk_id = ?",
+                    (
+                        metadata.get("notice_id"),
+                        metadata.get("campus"),
+                        json.dumps(metadata, ensure_ascii=False),
+                        chunk_id
+                    )
+                )
+                faiss_ids.append(self._conn.execute(
+                    "SELECT faiss_id FROM chunks WHERE chunk_id = ?", (chunk_id,)
+                ).fetchone()[0])
+            self._conn.commit()
+        self.metadata_index.add_many(zip(faiss_ids, metadatas))
+        self._selectors.clear()
+
+    def _remove_faiss_ids(self, faiss_ids: List[int]):
+        """write lock을 잡은 상태에서 호출해야 합니다."""
+        if not faiss_ids:
+            return
+        with self._db_lock:
+            self._conn.executemany("DELETE FROM chunks WHERE faiss_id = ?", [(faiss_id,) for faiss_id in faiss_ids])
+            self._conn.commit()
+        self.metadata_index.remove_many(faiss_ids)
+        self._selectors.clear()
+
+        if self.index is None:
+            return
+        ids = np.asarray(faiss_ids, dtype=np.int64)
+        if self.index_type == "flat":
+            self.index.remove_ids(self.faiss.IDSelectorBatch(ids))
+        elif self.index_type == "ivf":
+            self.index.remove_ids(self.faiss.IDSelectorArray(len(ids), self.faiss.swig_ptr(ids)))
+        # HNSW는 삭제를 지원하지 않으므로 검색 시 선택자로 제외하고 rebuild()에서 정리
+
+    def _remove_chunk_ids(self, chunk_ids: List[str]):
+        with self._db_lock:
+            placeholders = ",".join("?" * len(chunk_ids))
+            rows = self._conn.execute(
+                f"SELECT faiss_id FROM chunks WHERE chunk_id IN ({placeholders})", chunk_ids
+            ).fetchall()
+        self._remove_faiss_ids([row[0] for row in rows])
+
+    def has_notice(self, notice_id: str) -> bool:
+        with self._db_lock:
+            return self._conn.execute(
+                "SELECT 1 FROM chunks WHERE notice_id = ? LIMIT 1", (notice_id,)
+            ).fetchone() is not None
+
+    def add_documents_with_dedup(self, documents: List[Document]) -> List[str]:
+        """notice_id 기반으로 중복을 방지하며 문서를 추가합니다."""
+        new_documents = []
+        for doc in documents:
+            notice_id = doc.metadata.get('notice_id')
+            if notice_id and not self.has_notice(notice_id):
+                new_documents.append(doc)
+                print(f"📄 새 문서 추가: {doc.metadata.get('title', 'Unknown')} (ID: {notice_id})")
+            elif notice_id:
+                print(f"⚠️  중복 건너뜀: {doc.metadata.get('title', 'Unknown')} (ID: {notice_id})")
+
+        if new_documents:
+            print(f"✅ {len(new_documents)}개 새 문서를 벡터 저장소에 추가")
+            return self.add_documents(new_documents)
+        else:
+            print("📚 추가할 새 문서가 없습니다")
+            return []
+
+    def get_existing_notice_ids(self) -> set:
+        with self._db_lock:
+            return {
+                row[0] for row in self._conn.execute("SELECT DISTINCT notice_id FROM chunks WHERE notice_id IS NOT NULL")
+            }
+
+    def delete_documents_by_id(self, notice_id: str) -> int:
+        """특정 notice_id로 문서들을 삭제합니다."""
+        self._check_writable()
+        try:
+            with self._index_lock.write_lock():
+                with self._db_lock:
+                    rows = self._conn.execute(
+                        "SELECT faiss_id FROM chunks WHERE notice_id = ?", (notice_id,)
+                    ).fetchall()
+                self._remove_faiss_ids([row[0] for row in rows])
+            if rows:
+                self._autosave()
+                self._notify_change(NoticeChange(notice_ids={notice_id}))
+            return len(rows)
+        except Exception:
+            return 0
+
+    def upsert_documents(self, documents: List[Document]) -> List[str]:
+        """notice_id 단위로 기존 청크와 비교하여 바뀐 청크만 다시 임베딩/저장하고 남는 청크는 삭제합니다."""
+        ids, stats = self._upsert_documents(documents)
+        print(
+            f"🔄 문서 upsert: {stats['written']}개 갱신, {stats['relabeled']}개 메타데이터 갱신, "
+            f"{stats['unchanged']}개 유지, {stats['deleted']}개 삭제"
+        )
+        return ids
+
+    def _stored_metadatas(self, where: str, values: List[str]) -> Dict[str, Dict[str, Any]]:
+        """chunk_id → 저장된 메타데이터. SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회합니다."""
+        stored = {}
+        for start in range(0, len(values), 500):
+            batch = values[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            with self._db_lock:
+                rows = self._conn.execute(
+                    f"SELECT chunk_id, metadata FROM chunks WHERE {where} IN ({placeholders})", batch
+                ).fetchall()
+            stored.update((chunk_id, json.loads(metadata)) for chunk_id, metadata in rows)
+        return stored
+
+    def _upsert_documents(self, documents: List[Document]) -> Tuple[List[str], Dict[str, int]]:
+        self._check_writable()
+        ids, metadatas = prepare_chunks(documents)
+        texts = [doc.page_content for doc in documents]
+        notice_ids = {metadata['notice_id'] for metadata in metadatas if metadata.get('notice_id')}
+
+        # notice_id가 없는 청크는 본문 해시로 만든 ID라 공지사항 대신 ID로 직접 조회
+        existing = self._stored_metadatas("notice_id", sorted(notice_ids))
+        existing_ids = set(existing)
+        existing.update(self._stored_metadatas(
+            "chunk_id", [chunk_id for chunk_id, metadata in zip(ids, metadatas) if not metadata.get('notice_id')]
+        ))
+
+        # 본문이 바뀐 청크만 다시 임베딩하고, 메타데이터만 바뀐 청크는 저장된 벡터를 그대로 둠
+        changed, relabeled = [], []
+        for i, (chunk_id, metadata) in enumerate(zip(ids, metadatas)):
+            stored = existing.get(chunk_id)
+            if stored is None or stored.get('content_hash') != metadata['content_hash']:
+                changed.append(i)
+            elif stored != metadata:
+                relabeled.append(i)
+        # 다시 넣은 공지사항의 청크 수가 줄었으면 뒤쪽 notice_id:n 청크가 남지 않도록 삭제
+        stale_ids = sorted(existing_ids - set(ids))
+
+        embeddings = self.embeddings.embed_documents([texts[i] for i in changed]) if changed else []
+        with self._index_lock.write_lock():
+            # 새 청크를 먼저 쓰고 남는 청크를 지움
+            self._write_chunks(
+                [ids[i] for i in changed],
+                [texts[i] for i in changed],
+                [metadatas[i] for i in changed],
+                embeddings
+            )
+            self._relabel_chunks([ids[i] for i in relabeled], [metadatas[i] for i in relabeled])
+            if stale_ids:
+                self._remove_chunk_ids(stale_ids)
+
+        if changed or relabeled or stale_ids:
+            self._autosave()
+            written = [metadatas[i] for i in changed + relabeled]
+            self._notify_change(NoticeChange(
+                notice_ids=notice_ids,
+                campuses={metadata['campus'] for metadata in written if metadata.get('campus')},
+                embeddings=np.asarray(embeddings, dtype=np.float32).tolist() if changed else None
+            ))
+
+        return ids, {
+            "written": len(changed),
+            "relabeled": len(relabeled),
+            "unchanged": len(ids) - len(changed) - len(relabeled),
+            "deleted": len(stale_ids)
+        }
+
+    def update_documents(self, documents: List[Document], rebuild: bool = False) -> List[str]:
+        """저장소 내용을 주어진 문서들로 맞춥니다 (NoticeVectorStore.update_documents와 같은 동작).
+
+        기본은 diff 기반 upsert로, 바뀐 청크만 다시 임베딩하고 목록에 없는 공지사항과 notice_id 없는 청크는 삭제합니다.
+        rebuild=True이면 저장소를 지우고 전부 다시 추가합니다.
+        """
+        if rebuild:
+            self.delete_collection()
+            return self.add_documents(documents)
+
+        ids, stats = self._upsert_documents(documents)
+
+        keep_notice_ids = {doc.metadata.get('notice_id') for doc in documents}
+        for notice_id in self.get_existing_notice_ids() - keep_notice_ids:
+            stats["deleted"] += self.delete_documents_by_id(notice_id)
+        stats["deleted"] += self._delete_orphan_chunks(set(ids))
+
+        print(
+            f"🔄 문서 업데이트: {stats['written']}개 갱신, {stats['relabeled']}개 메타데이터 갱신, "
+            f"{stats['unchanged']}개 유지, {stats['deleted']}개 삭제"
+        )
+        return ids
+
+    def _delete_orphan_chunks(self, keep_ids: Set[str]) -> int:
+        """notice_id가 없는 청크 중 이번 문서 목록에 없는 것을 지웁니다."""
+        with self._index_lock.write_lock():
+            with self._db_lock:
+                rows = self._conn.execute("SELECT faiss_id, chunk_id FROM chunks WHERE notice_id IS NULL").fetchall()
+            orphan_ids = [faiss_id for faiss_id, chunk_id in rows if chunk_id not in keep_ids]
+            self._remove_faiss_ids(orphan_ids)
+        if orphan_ids:
+            self._autosave()
+            # 어느 답변이 이 청크를 근거로 했는지 notice_id로 알 수 없으므로 파생 캐시를 모두 비움
+            self._notify_change(NoticeChange(notice_ids=set(), reset=True))
+        return len(orphan_ids)
+
+    def delete_collection(self):
+        self._check_writable()
+        with self._index_lock.write_lock():
+            with self._db_lock:
+                self._conn.execute("DELETE FROM chunks")
+                self._conn.commit()
+            self.metadata_index.clear()
+            self._selectors.clear()
+            self.index = None
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+        self._notify_change(NoticeChange(notice_ids=set(), reset=True))
+
+    # ---- 조회/검색 ----
+
+    def _documents_for(self, faiss_ids: List[int]) -> Dict[int, Document]:
+        if not faiss_ids:
+            return {}
+        placeholders = ",".join("?" * len(faiss_ids))
+        with self._db_lock:
+            rows = self._conn.execute(
+                f"SELECT faiss_id, document, metadata FROM chunks WHERE faiss_id IN ({placeholders})",
+                faiss_ids
+            ).fetchall()
+        return {
+            faiss_id: Document(page_content=document, metadata=json.loads(metadata))
+            for faiss_id, document, metadata in rows
+        }
+
+    def _exact_search(self, vectors: np.ndarray, candidates: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """후보 벡터를 인덱스에서 꺼내 질의와의 제곱 L2 거리를 직접 계산합니다. read lock을 잡은 상태에서 호출해야 합니다."""
+        distances = squared_l2_distances(vectors, self.index.reconstruct_batch(candidates))
+        top, top_distances = top_k(distances, k, largest=False)
+        return top_distances, candidates[top]
+
+    def _search_ids(
+            self,
+            vectors: np.ndarray,
+            k: int,
+            metadata_filter: Optional[MetadataFilter]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(거리, faiss_id) 배열을 반환합니다. 결과가 없으면 id는 -1입니다. read lock을 잡은 상태에서 호출해야 합니다."""
+        empty = (np.zeros((len(vectors), 0), dtype=np.float32), np.zeros((len(vectors), 0), dtype=np.int64))
+        if self.index is None or self.index.ntotal == 0:
+            return empty
+        # 필터 조건은 메타데이터 인덱스로 후보 ID를 먼저 구해 벡터 검색 범위 자체를 좁힘
+        candidates = self.metadata_index.candidates(metadata_filter)
+        if candidates is not None and len(candidates) == 0:
+            return empty
+        if candidates is not None and len(candidates) <= self.exact_scan_limit:
+            return self._exact_search(vectors, candidates, k)
+        return self.index.search(vectors, k, params=self._search_params(metadata_filter, candidates))
+
+    def _search_vectors(
+            self,
+            vectors: np.ndarray,
+            k: int,
+            campus_filter: Optional[Campus],
+            metadata_filter: Optional[MetadataFilter] = None
+    ) -> List[List[Tuple[Document, float]]]:
+        metadata_filter = combine_filters(campus_filter, metadata_filter)
+        with self._index_lock.read_lock():
+            distances, ids = self._search_ids(vectors, k, metadata_filter)
+
+        documents = self._documents_for(sorted({int(faiss_id) for faiss_id in ids.ravel() if faiss_id >= 0}))
+        return [
+            [
+                (documents[int(faiss_id)], float(distance))
+                for faiss_id, distance in zip(row_ids, row_distances)
+                if faiss_id >= 0 and int(faiss_id) in documents
+            ]
+            for row_ids, row_distances in zip(ids, distances)
+        ]
+
+    def embed_query(self, query: str) -> List[float]:
+        return self.query_cache.get(query)
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        return self.query_cache.get_many(queries)
+
+    def similarity_search_by_vector_with_score(
+            self,
+            embedding: List[float],
+            k: int = 5,
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
+    ) -> List[tuple[Document, float]]:
+        return self._search_vectors(
+            np.asarray([embedding], dtype=np.float32), k, campus_filter, metadata_filter
+        )[0]
+
+    def similarity_search_with_score(
+            self,
+            query: str,
+            k: int = 5,
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
+    ) -> List[tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(self.embed_query(query), k, campus_filter, metadata_filter)
+
+    def similarity_search(
+            self,
+            query: str,
+            k: int = 5,
+            campus_filter: Optional[Campus] = None,
+            metadata_filter: Optional[MetadataFilter] = None
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, campus_filter, metadata_filter)]
+
+    def max_marginal_relevance_search_with_score(
+            self,
+            query: str,
+            k: int = 5,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            campus_filter: Optional[Campus] = None,
+            max_chunks_per_notice: Optional[int] = None
+    ) -> List[tuple[Document, float]]:
+        """후보 fetch_k개의 벡터를 인덱스에서 꺼내 MMR로 k개를 다시 고릅니다 (NoticeVectorStore와 같은 동작)."""
+        vector = np.asarray([self.embed_query(query)], dtype=np.float32)
+        with self._index_lock.read_lock():
+            distances, ids = self._search_ids(vector, max(fetch_k, k), combine_filters(campus_filter, None))
+            found = ids[0] >= 0
+            distances, ids = distances[0][found], ids[0][found]
+            candidates = self.index.reconstruct_batch(ids) if len(ids) else None
+        if candidates is None:
+            return []
+
+        documents = self._documents_for(ids.tolist())
+        selected = mmr_select(
+            vector[0],
+            candidates,
+            k,
+            lambda_mult=lambda_mult,
+            groups=[
+                documents[faiss_id].metadata.get("notice_id") or faiss_id if faiss_id in documents else faiss_id
+                for faiss_id in ids.tolist()
+            ],
+            max_per_group=max_chunks_per_notice
+        )
+        return [
+            (documents[int(ids[i])], float(distances[i]))
+            for i in selected
+            if int(ids[i]) in documents
+        ]
+
+    def max_marginal_relevance_search(
+            self,
+            query: str,
+            k: int = 5,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            campus_filter: Optional[Campus] = None,
+            max_chunks_per_notice: Optional[int] = None
+    ) -> List[Document]:
+        return [
+            doc for doc, _ in self.max_marginal_relevance_search_with_score(
+                query, k, fetch_k, lambda_mult, campus_filter, max_chunks_per_notice
+            )
+        ]
+
+    def similarity_search_with_score_batch(
+            self,
+            queries: List[str],
+            k: int = 5,
+            campus_filters: Optional[List[Optional[Campus]]] = None
+    ) -> List[List[tuple[Document, float]]]:
+        """여러 질의를 캠퍼스 필터별로 묶어 faiss 배치 검색 한 번씩으로 처리합니다."""
+        if campus_filters is None:
+            campus_filters = [None] * len(queries)
+
+        embeddings = self.embed_queries(queries)
+        groups: Dict[Optional[Campus], List[int]] = {}
+        for i, campus_filter in enumerate(campus_filters):
+            groups.setdefault(campus_filter, []).append(i)
+
+        results: List[List[tuple[Document, float]]] = [[] for _ in queries]
+        for campus_filter, indices in groups.items():
+            vectors = np.asarray([embeddings[i] for i in indices], dtype=np.float32)
+            for i, rows in zip(indices, self._search_vectors(vectors, k, campus_filter)):
+                results[i] = rows
+        return results
+
+    def get_query_cache_stats(self) -> Dict[str, float]:
+        return self.query_cache.stats()
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        return {
+            "name": f"faiss-{self.index_type}",
+            "count": len(self.metadata_index),
+            "metadata": {
+                "index_type": self.index_type,
+                "read_only": self.read_only,
+                "vectors": self.index.ntotal if self.index is not None else 0
+            }
+        }
+
+    def get_documents_by_id(self, notice_id: str) -> List[Document]:
+        """특정 notice_id로 문서들을 조회합니다."""
+        try:
+            with self._db_lock:
+                rows = self._conn.execute(
+                    "SELECT document, metadata FROM chunks WHERE notice_id = ? ORDER BY faiss_id", (notice_id,)
+                ).fetchall()
+            return [Document(page_content=document, metadata=json.loads(metadata)) for document, metadata in rows]
+        except Exception:
+            return []
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
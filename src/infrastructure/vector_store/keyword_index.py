@@ -0,0 +1,233 @@
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 검색어로 의미 있는 형태소만 색인 (체언, 용언 어간, 어근, 외국어/숫자/한자, 전화번호·URL 등 특수 토큰)
+KEEP_TAG_PREFIXES = ("NNG", "NNP", "NR", "SL", "SN", "SH", "XR", "VV", "VA", "W_")
+
+# '제2주차장', '041-850-8000'처럼 숫자가 섞인 표현은 형태소 분석과 별개로 원형 그대로도 색인해 정확 일치를 살림
+RAW_TOKEN = re.compile(r"[0-9A-Za-z가-힣][0-9A-Za-z가-힣\-./]*")
+FALLBACK_TOKEN = re.compile(r"[가-힣]+|[A-Za-z]+|[0-9]+")
+
+
+class KoreanTokenizer:
+    """Kiwi 형태소 분석 기반 토크나이저. kiwipiepy가 없으면 단어 + 한글 bigram으로 대체합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        try:
+            from kiwipiepy import Kiwi
+            self._kiwi = Kiwi()
+        except ImportError:
+            logger.warning("kiwipiepy가 설치되지 않아 단순 토크나이저를 사용합니다: pip install kiwipiepy")
+            self._kiwi = None
+
+    def tokenize(self, text: str) -> List[str]:
+        if self._kiwi is not None:
+            with self._lock:
+                tokens = self._kiwi.tokenize(text)
+            terms = [token.form.lower() for token in tokens if token.tag.startswith(KEEP_TAG_PREFIXES)]
+        else:
+            terms = []
+            for word in FALLBACK_TOKEN.findall(text):
+                terms.append(word.lower())
+                if len(word) > 2 and "가" <= word[0] <= "힣":
+                    terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+
+        terms.extend(
+            raw.lower().strip("-./") for raw in RAW_TOKEN.findall(text)
+            if any(char.isdigit() for char in raw)
+        )
+        return [term for term in terms if term]
+
+
+class KeywordIndex:
+    """청크 단위 BM25 역색인. 메모리에 posting을 유지하고 청크별 단어 빈도를 SQLite에 영속화합니다.
+
+    재시작 시에는 저장된 단어 빈도로 posting을 복원하므로 형태소 분석을 다시 하지 않습니다.
+    청크별 content_hash를 함께 저장해 두어 컬렉션과 비교할 때 ID뿐 아니라 본문이 바뀐 청크도 찾을 수 있습니다.
+    """
+
+    def __init__(self, path: str, tokenizer: Optional[KoreanTokenizer] = None, k1: float = 1.2, b: float = 0.75):
+        self.path = path
+        self.tokenizer = tokenizer or KoreanTokenizer()
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._terms: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._campus: Dict[str, str] = {}
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._total_length = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS keyword_chunks (
+                chunk_id TEXT PRIMARY KEY,
+                campus TEXT,
+                terms TEXT NOT NULL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(keyword_chunks)")}
+        if "content_hash" not in columns:
+            # 이전 형식의 인덱스: 해시가 없는 청크는 다음 동기화 때 다시 색인됨
+            self._conn.execute("ALTER TABLE keyword_chunks ADD COLUMN content_hash TEXT")
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        for chunk_id, campus, terms, content_hash in self._conn.execute(
+                "SELECT chunk_id, campus, terms, content_hash FROM keyword_chunks"
+        ):
+            self._insert(chunk_id, campus, json.loads(terms))
+            self._hashes[chunk_id] = content_hash
+
+    def chunk_count(self) -> int:
+        return len(self._terms)
+
+    def chunk_hashes(self) -> Dict[str, Optional[str]]:
+        """색인된 청크 ID → 색인할 때의 content_hash (모르면 None)."""
+        with self._lock:
+            return dict(self._hashes)
+
+    def _insert(self, chunk_id: str, campus: Optional[str], term_counts: Dict[str, int]) -> None:
+        self._terms[chunk_id] = term_counts
+        self._campus[chunk_id] = campus
+        length = sum(term_counts.values())
+        self._lengths[chunk_id] = length
+        self._total_length += length
+        for term, count in term_counts.items():
+            self._postings.setdefault(term, {})[chunk_id] = count
+
+    def _discard(self, chunk_id: str) -> None:
+        term_counts = self._terms.pop(chunk_id, None)
+        if term_counts is None:
+            return
+        self._campus.pop(chunk_id, None)
+        self._hashes.pop(chunk_id, None)
+        self._total_length -= self._lengths.pop(chunk_id, 0)
+        for term in term_counts:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(chunk_id, None)
+                if not posting:
+                    del self._postings[term]
+
+    def add_many(
+            self,
+            chunks: Iterable[Tuple[str, str, Optional[str]]],
+            content_hashes: Optional[Dict[str, str]] = None
+    ) -> None:
+        """(chunk_id, 본문, campus) 목록을 색인합니다. 같은 chunk_id가 있으면 교체합니다.
+
+        content_hashes(chunk_id → content_hash)를 주면 함께 저장해 이후 컬렉션과의 동기화에 씁니다.
+        """
+        content_hashes = content_hashes or {}
+        rows = []
+        tokenized = []
+        for chunk_id, text, campus in chunks:
+            term_counts = dict(Counter(self.tokenizer.tokenize(text)))
+            content_hash = content_hashes.get(chunk_id)
+            tokenized.append((chunk_id, campus, term_counts, content_hash))
+            rows.append((chunk_id, campus, json.dumps(term_counts, ensure_ascii=False), content_hash))
+        if not rows:
+            return
+
+        with self._lock:
+            for chunk_id, campus, term_counts, content_hash in tokenized:
+                self._discard(chunk_id)
+                self._insert(chunk_id, campus, term_counts)
+                self._hashes[chunk_id] = content_hash
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO keyword_chunks (chunk_id, campus, terms, content_hash) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> None:
+        chunk_ids = set(chunk_ids)
+        if not chunk_ids:
+            return
+
+        with self._lock:
+            for chunk_id in chunk_ids:
+                self._discard(chunk_id)
+            self._conn.executemany(
+                "DELETE FROM keyword_chunks WHERE chunk_id = ?",
+                [(chunk_id,) for chunk_id in chunk_ids]
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._terms.clear()
+            self._lengths.clear()
+            self._campus.clear()
+            self._hashes.clear()
+            self._total_length = 0
+            self._conn.execute("DELETE FROM keyword_chunks")
+            self._conn.commit()
+
+    def rebuild(self, chunks: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        self.clear()
+        self.add_many(chunks)
+
+    def search(
+            self,
+            query: str,
+            k: int = 5,
+            campuses: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float, float]]:
+        """BM25 상위 k개 청크를 (chunk_id, 점수, 질의어 포함 비율) 목록으로 반환합니다.
+
+        campuses가 주어지면 해당 캠퍼스 값을 가진 청크만 대상으로 합니다.
+        """
+        query_terms = set(self.tokenizer.tokenize(query))
+        if not query_terms:
+            return []
+
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+
+        with self._lock:
+            total = len(self._terms)
+            if total == 0:
+                return []
+            average_length = self._total_length / total
+
+            for term in query_terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+                for chunk_id, tf in posting.items():
+                    if campuses is not None and self._campus.get(chunk_id) not in campuses:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[chunk_id] / average_length)
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+                    matched[chunk_id] = matched.get(chunk_id, 0) + 1
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(chunk_id, score, matched[chunk_id] / len(query_terms)) for chunk_id, score in ranked]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,309 @@
+import bisect
+import threading
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ...domain.models import Campus
+
+EMPTY_IDS = np.empty(0, dtype=np.int64)
+
+
+def _value(item: Any) -> str:
+    return item.value if isinstance(item, Enum) else str(item)
+
+
+def parse_day(value: Any) -> Optional[int]:
+    """ISO 날짜 문자열/날짜 객체를 일 단위 정수(ordinal)로 바꿉니다. 해석할 수 없으면 None."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class MetadataFilter:
+    """캠퍼스/카테고리/게시일 조건. 지정한 조건끼리는 AND, 카테고리 여러 개는 OR로 결합합니다.
+
+    campus를 지정하면 전체(ALL) 공지사항도 함께 포함합니다. 게시일 조건은 since/until 양 끝을 포함합니다.
+    """
+    campus: Optional[Campus] = None
+    categories: Optional[FrozenSet[str]] = None
+    since: Optional[date] = None
+    until: Optional[date] = None
+
+    def __post_init__(self):
+        if self.categories is not None:
+            object.__setattr__(self, "categories", frozenset(_value(category) for category in self.categories))
+
+    @classmethod
+    def recent(
+            cls,
+            days: int,
+            campus: Optional[Campus] = None,
+            categories: Optional[Iterable[Any]] = None,
+            today: Optional[date] = None
+    ) -> "MetadataFilter":
+        """최근 days일 (오늘 포함) 공지사항 조건. 예: MetadataFilter.recent(30, Campus.CHEONAN, ["SCHOLARSHIP"])"""
+        today = today or date.today()
+        return cls(
+            campus=campus,
+            categories=frozenset(categories) if categories is not None else None,
+            since=today - timedelta(days=days - 1),
+            until=today
+        )
+
+    def is_empty(self) -> bool:
+        return self.campus is None and self.categories is None and self.since is None and self.until is None
+
+    def campuses(self) -> Optional[Set[str]]:
+        return {Campus.ALL.value, self.campus.value} if self.campus else None
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """인덱스 없이 메타데이터 하나를 직접 검사합니다 (후처리 필터용)."""
+        campuses = self.campuses()
+        if campuses is not None and metadata.get("campus") not in campuses:
+            return False
+        if self.categories is not None and metadata.get("category") not in self.categories:
+            return False
+        if self.since is not None or self.until is not None:
+            day = parse_day(metadata.get("published_date") or metadata.get("date"))
+            if day is None:
+                return False
+            if self.since is not None and day < self.since.toordinal():
+                return False
+            if self.until is not None and day > self.until.toordinal():
+                return False
+        return True
+
+
+def combine_filters(
+        campus_filter: Optional[Campus],
+        metadata_filter: Optional[MetadataFilter]
+) -> Optional[MetadataFilter]:
+    """기존 campus_filter 인자와 MetadataFilter를 하나로 합칩니다. 조건이 없으면 None."""
+    if metadata_filter is None:
+        return MetadataFilter(campus=campus_filter) if campus_filter else None
+    if campus_filter and metadata_filter.campus is None:
+        metadata_filter = replace(metadata_filter, campus=campus_filter)
+    return None if metadata_filter.is_empty() else metadata_filter
+
+
+class MetadataIndex:
+    """청크 정수 ID를 campus, category, 게시일(일 단위) 버킷별 정렬된 ID 배열로 묶어 두는 메모리 인덱스.
+
+    필터 검색 전에 후보 ID 집합을 구해 벡터 검색 범위를 미리 좁히는 데 사용합니다.
+    버킷은 쓰기 시 set으로 갱신하고, 조회 시 필요한 버킷만 정렬된 numpy 배열로 만들어 캐시합니다.
+    조건끼리의 교집합은 가장 작은 조건의 ID 배열을 나머지 조건의 비트맵으로 거르는 방식이라
+    코퍼스 크기가 아니라 가장 작은 후보 집합 크기에 비례합니다.
+    """
+
+    def __init__(self, max_cached_filters: int = 256):
+        self.max_cached_filters = max_cached_filters
+        self._lock = threading.Lock()
+        self._fields: Dict[int, Tuple[Optional[str], Optional[str], Optional[int]]] = {}
+        self._campus: Dict[Optional[str], Set[int]] = {}
+        self._category: Dict[Optional[str], Set[int]] = {}
+        self._day: Dict[int, Set[int]] = {}
+        self._days: List[int] = []
+        self._arrays: Dict[Tuple[str, Any], np.ndarray] = {}
+        # campus/category 조합별 합집합 배열과 비트맵 (쓰기마다 비움)
+        self._unions: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+        self._bitmaps: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+        self._results: Dict[MetadataFilter, np.ndarray] = {}
+        self._id_limit = 0
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return chunk_id in self._fields
+
+    @staticmethod
+    def fields_of(metadata: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        return (
+            metadata.get("campus"),
+            metadata.get("category"),
+            parse_day(metadata.get("published_date") or metadata.get("date"))
+        )
+
+    def add_many(self, items: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+        """(정수 ID, 메타데이터) 목록을 색인합니다. 같은 ID가 있으면 교체합니다."""
+        rows = [(int(chunk_id), self.fields_of(metadata or {})) for chunk_id, metadata in items]
+        self.add_fields(rows)
+
+    def add_fields(self, rows: Iterable[Tuple[int, Tuple[Optional[str], Optional[str], Optional[int]]]]) -> None:
+        """이미 (campus, category, 일 ordinal)로 뽑아 둔 값으로 색인합니다 (저장소 시작 시 일괄 적재용)."""
+        with self._lock:
+            for chunk_id, fields in rows:
+                self._discard(chunk_id)
+                self._insert(chunk_id, fields)
+            self._invalidate()
+
+    def remove_many(self, chunk_ids: Iterable[int]) -> None:
+        with self._lock:
+            for chunk_id in chunk_ids:
+                self._discard(int(chunk_id))
+            self._invalidate()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def remap(self, mapping: Dict[int, int]) -> None:
+        """ID를 mapping의 새 ID로 바꿔 다시 색인합니다. mapping에 없는 ID는 버립니다.
+
+        삭제가 쌓여 ID 공간에 빈 자리가 많아졌을 때 ID를 앞으로 당겨 비트맵 크기를 줄이는 데 사용합니다.
+        """
+        with self._lock:
+            rows = [(mapping[chunk_id], fields) for chunk_id, fields in self._fields.items() if chunk_id in mapping]
+            self._clear()
+            for chunk_id, fields in rows:
+                self._insert(int(chunk_id), fields)
+
+    def _clear(self) -> None:
+        self._fields.clear()
+        self._campus.clear()
+        self._category.clear()
+        self._day.clear()
+        self._days.clear()
+        self._arrays.clear()
+        self._invalidate()
+        self._id_limit = 0
+
+    def _invalidate(self) -> None:
+        self._unions.clear()
+        self._bitmaps.clear()
+        self._results.clear()
+
+    def _insert(self, chunk_id: int, fields: Tuple[Optional[str], Optional[str], Optional[int]]) -> None:
+        campus, category, day = fields
+        self._fields[chunk_id] = fields
+        self._id_limit = max(self._id_limit, chunk_id + 1)
+        self._campus.setdefault(campus, set()).add(chunk_id)
+        self._arrays.pop(("campus", campus), None)
+        self._category.setdefault(category, set()).add(chunk_id)
+        self._arrays.pop(("category", category), None)
+        if day is not None:
+            if day not in self._day:
+                self._day[day] = set()
+                bisect.insort(self._days, day)
+            self._day[day].add(chunk_id)
+            self._arrays.pop(("day", day), None)
+
+    def _discard(self, chunk_id: int) -> None:
+        fields = self._fields.pop(chunk_id, None)
+        if fields is None:
+            return
+        campus, category, day = fields
+        for name, buckets, key in (("campus", self._campus, campus), ("category", self._category, category)):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(chunk_id)
+                if not bucket:
+                    del buckets[key]
+            self._arrays.pop((name, key), None)
+        if day is not None:
+            bucket = self._day.get(day)
+            if bucket is not None:
+                bucket.discard(chunk_id)
+                if not bucket:
+                    del self._day[day]
+                    del self._days[bisect.bisect_left(self._days, day)]
+            self._arrays.pop(("day", day), None)
+
+    def _array(self, name: str, buckets: Dict[Any, Set[int]], key: Any) -> np.ndarray:
+        array = self._arrays.get((name, key))
+        if array is None:
+            bucket = buckets.get(key)
+            if not bucket:
+                return EMPTY_IDS
+            array = np.fromiter(bucket, dtype=np.int64, count=len(bucket))
+            array.sort()
+            self._arrays[(name, key)] = array
+        return array
+
+    @staticmethod
+    def _union(arrays: List[np.ndarray]) -> np.ndarray:
+        # 버킷끼리는 ID가 겹치지 않으므로 이어 붙여 정렬만 하면 합집합
+        arrays = [array for array in arrays if len(array)]
+        if not arrays:
+            return EMPTY_IDS
+        if len(arrays) == 1:
+            return arrays[0]
+        merged = np.concatenate(arrays)
+        merged.sort()
+        return merged
+
+    def _cached_union(self, name: str, buckets: Dict[Any, Set[int]], keys: Tuple[str, ...]) -> np.ndarray:
+        union = self._unions.get((name, keys))
+        if union is None:
+            union = self._union([self._array(name, buckets, key) for key in keys])
+            self._unions[(name, keys)] = union
+        return union
+
+    def _bitmap(self, name: str, keys: Tuple[Any, ...], arrays: List[np.ndarray], cache: bool) -> np.ndarray:
+        bitmap = self._bitmaps.get((name, keys)) if cache else None
+        if bitmap is None:
+            bitmap = np.zeros(self._id_limit, dtype=bool)
+            for array in arrays:
+                bitmap[array] = True
+            if cache:
+                self._bitmaps[(name, keys)] = bitmap
+        return bitmap
+
+    def candidates(self, metadata_filter: Optional[MetadataFilter]) -> Optional[np.ndarray]:
+        """조건을 만족하는 청크 ID를 정렬된 int64 배열로 반환합니다. 조건이 없으면 None (전체 대상)."""
+        if metadata_filter is None or metadata_filter.is_empty():
+            return None
+
+        with self._lock:
+            cached = self._results.get(metadata_filter)
+            if cached is not None:
+                return cached
+
+            # (이름, 버킷 키 목록, 버킷 dict, 조합 캐시 여부). 게시일 범위는 조합이 다양해 캐시하지 않음
+            parts = []
+            campuses = metadata_filter.campuses()
+            if campuses is not None:
+                parts.append(("campus", tuple(sorted(campuses)), self._campus, True))
+            if metadata_filter.categories is not None:
+                parts.append(("category", tuple(sorted(metadata_filter.categories)), self._category, True))
+            if metadata_filter.since is not None or metadata_filter.until is not None:
+                low = bisect.bisect_left(self._days, metadata_filter.since.toordinal()) if metadata_filter.since else 0
+                high = (
+                    bisect.bisect_right(self._days, metadata_filter.until.toordinal())
+                    if metadata_filter.until else len(self._days)
+                )
+                parts.append(("day", tuple(self._days[low:high]), self._day, False))
+
+            # 가장 작은 조건의 ID 배열을 기준으로 나머지 조건의 비트맵에 있는 ID만 남김
+            parts.sort(key=lambda part: sum(len(part[2].get(key, ())) for key in part[1]))
+            name, keys, buckets, cache = parts[0]
+            if cache:
+                result = self._cached_union(name, buckets, keys)
+            else:
+                result = self._union([self._array(name, buckets, key) for key in keys])
+            for name, keys, buckets, cache in parts[1:]:
+                if not len(result):
+                    break
+                arrays = [self._array(name, buckets, key) for key in keys]
+                result = result[self._bitmap(name, keys, arrays, cache)[result]]
+
+            if len(self._results) >= self.max_cached_filters:
+                self._results.clear()
+            self._results[metadata_filter] = result
+            return result
+
+    def ids(self) -> np.ndarray:
+        with self._lock:
+            return np.fromiter(sorted(self._fields), dtype=np.int64, count=len(self._fields))
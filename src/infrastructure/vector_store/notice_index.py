@@ -0,0 +1,122 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class NoticeIdIndex:
+    """notice_id → 청크 ID 목록을 메모리에 유지하고 SQLite 파일로 영속화하는 인덱스."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._chunks: Dict[str, Set[str]] = {}
+        self._notice_of: Dict[str, str] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notice_chunks (
+                notice_id TEXT NOT NULL,
+                chunk_id TEXT PRIMARY KEY
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_notice_chunks_notice_id ON notice_chunks(notice_id)")
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        for notice_id, chunk_id in self._conn.execute("SELECT notice_id, chunk_id FROM notice_chunks"):
+            self._chunks.setdefault(notice_id, set()).add(chunk_id)
+            self._notice_of[chunk_id] = notice_id
+
+    def contains(self, notice_id: str) -> bool:
+        return notice_id in self._chunks
+
+    def notice_ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._chunks)
+
+    def get_chunk_ids(self, notice_id: str) -> List[str]:
+        with self._lock:
+            return sorted(self._chunks.get(notice_id, ()))
+
+    def chunk_ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._notice_of)
+
+    def add_many(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """(notice_id, chunk_id) 쌍들을 인덱스에 추가합니다."""
+        rows = [(notice_id, chunk_id) for notice_id, chunk_id in pairs if notice_id]
+        if not rows:
+            return
+
+        with self._lock:
+            for notice_id, chunk_id in rows:
+                previous = self._notice_of.get(chunk_id)
+                if previous is not None and previous != notice_id:
+                    self._discard(previous, chunk_id)
+                self._chunks.setdefault(notice_id, set()).add(chunk_id)
+                self._notice_of[chunk_id] = notice_id
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notice_chunks (notice_id, chunk_id) VALUES (?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def remove(self, notice_id: str) -> List[str]:
+        """notice_id 항목을 제거하고 제거된 청크 ID 목록을 반환합니다."""
+        with self._lock:
+            chunk_ids = self._chunks.pop(notice_id, set())
+            for chunk_id in chunk_ids:
+                self._notice_of.pop(chunk_id, None)
+            if chunk_ids:
+                self._conn.execute("DELETE FROM notice_chunks WHERE notice_id = ?", (notice_id,))
+                self._conn.commit()
+            return sorted(chunk_ids)
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> None:
+        chunk_ids = set(chunk_ids)
+        if not chunk_ids:
+            return
+
+        with self._lock:
+            for chunk_id in chunk_ids:
+                notice_id = self._notice_of.pop(chunk_id, None)
+                if notice_id is not None:
+                    self._discard(notice_id, chunk_id)
+            self._conn.executemany(
+                "DELETE FROM notice_chunks WHERE chunk_id = ?",
+                [(chunk_id,) for chunk_id in chunk_ids]
+            )
+            self._conn.commit()
+
+    def _discard(self, notice_id: str, chunk_id: str) -> None:
+        chunk_ids = self._chunks.get(notice_id)
+        if chunk_ids is None:
+            return
+        chunk_ids.discard(chunk_id)
+        if not chunk_ids:
+            del self._chunks[notice_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self._notice_of.clear()
+            self._conn.execute("DELETE FROM notice_chunks")
+            self._conn.commit()
+
+    def rebuild(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """컬렉션 전체 스캔 결과로 인덱스를 다시 만듭니다."""
+        self.clear()
+        self.add_many(pairs)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
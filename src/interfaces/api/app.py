@@ -0,0 +1,222 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from .limits import RateLimiter, RequestCoalescer
+from ...application.services.rag_service import NoticeRAGSystem, parse_campus
+from ...infrastructure.embedding.embedding_cache import normalize_text
+from ...infrastructure.vector_store.chroma_store import distance_to_similarity
+from ...infrastructure.vector_store.metadata_index import MetadataFilter
+from ...shared.utils.env import load_env
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ApiSettings:
+    # 동시에 진행할 수 있는 LLM 호출 수 (초과 요청은 대기). 캐시 적중/컷오프 응답은 세지 않음
+    llm_concurrency: int = 8
+    # 클라이언트별 분당 요청 수 (0이면 제한 없음)와 순간 허용량
+    rate_limit_per_minute: float = 60.0
+    rate_burst: Optional[int] = None
+    # 리버스 프록시 뒤에서 X-Forwarded-For의 첫 주소를 클라이언트로 사용
+    trust_proxy: bool = False
+
+
+def create_api_settings_from_env() -> ApiSettings:
+    load_env()
+    burst = os.getenv("API_RATE_BURST")
+    return ApiSettings(
+        llm_concurrency=int(os.getenv("API_LLM_CONCURRENCY", "8")),
+        rate_limit_per_minute=float(os.getenv("API_RATE_LIMIT_PER_MINUTE", "60")),
+        rate_burst=int(burst) if burst else None,
+        trust_proxy=os.getenv("API_TRUST_PROXY", "off").lower() in ("on", "true", "1")
+    )
+
+
+class ChatRequest(BaseModel):
+    question: str = Field(..., min_length=1, max_length=1000)
+    campus: Optional[str] = None
+
+
+class SearchRequest(BaseModel):
+    query: str = Field(..., min_length=1, max_length=1000)
+    campus: Optional[str] = None
+    k: int = Field(5, ge=1, le=20)
+    categories: Optional[List[str]] = None
+    # 최근 days일 (오늘 포함) 공지사항만 검색
+    days: Optional[int] = Field(None, ge=1)
+
+
+class ApiState:
+    """서버 프로세스 하나의 RAG 시스템과 준비 상태, 요청 제한 상태."""
+
+    def __init__(self, rag_factory: Callable[[], NoticeRAGSystem], settings: ApiSettings):
+        self.rag_factory = rag_factory
+        self.settings = settings
+        self.rag: Optional[NoticeRAGSystem] = None
+        self.ready = False
+        self.error: Optional[str] = None
+        self.warmup_seconds: Optional[float] = None
+        self.started_at = time.time()
+        self.limiter = RateLimiter(settings.rate_limit_per_minute, settings.rate_burst) \
+            if settings.rate_limit_per_minute > 0 else None
+        self.coalescer = RequestCoalescer()
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    async def start(self) -> None:
+        """RAG 시스템을 만들고 warm-up까지 마치면 ready로 바꿉니다. 모델 로딩은 이벤트 루프를 막지 않도록 스레드에서 실행합니다."""
+        try:
+            rag = await asyncio.to_thread(self.rag_factory)
+            rag.llm_semaphore = self.semaphore
+            self.rag = rag
+            self.warmup_seconds = await asyncio.to_thread(rag.warmup)
+            self.ready = True
+            print(f"✅ API 준비 완료 (warm-up {self.warmup_seconds:.1f}s, pid {os.getpid()})")
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.exception("RAG 시스템 준비 실패")
+
+    def client_key(self, request: Request) -> str:
+        if self.settings.trust_proxy:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    def admit(self, request: Request) -> NoticeRAGSystem:
+        """준비되지 않았으면 503, 요청 한도를 넘으면 429(Retry-After)를 냅니다."""
+        if not self.ready:
+            raise HTTPException(status_code=503, detail="서버가 아직 준비되지 않았습니다", headers={"Retry-After": "1"})
+        if self.limiter is not None:
+            retry_after = self.limiter.acquire(self.client_key(request))
+            if retry_after > 0:
+                raise HTTPException(
+                    status_code=429,
+                    detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+                    headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+                )
+        return self.rag
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_events(rag: NoticeRAGSystem, question: str, campus: Optional[str]) -> AsyncIterator[str]:
+    """astream_chat 이벤트(sources → token* → done)를 SSE로 바꿉니다. 도중에 실패하면 error 이벤트로 끝냅니다."""
+    try:
+        async for event in rag.astream_chat(question, campus):
+            event_type = event.pop("type")
+            yield format_sse(event_type, event)
+    except Exception as e:
+        logger.exception("스트리밍 답변 실패")
+        yield format_sse("error", {"error": str(e)})
+
+
+def create_app(
+        rag_factory: Callable[[], NoticeRAGSystem],
+        settings: Optional[ApiSettings] = None
+) -> FastAPI:
+    """비동기 HTTP API를 만듭니다.
+
+    rag_factory는 시작 시 스레드에서 한 번 호출되고, warm-up이 끝나야 /health/ready가 200을 반환합니다.
+    같은 질문(정규화 후)과 캠퍼스로 동시에 들어온 /chat 요청은 LLM을 한 번만 호출해 결과를 나눠 받습니다.
+    """
+    state = ApiState(rag_factory, settings or create_api_settings_from_env())
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # 세마포어는 서버의 이벤트 루프에 묶이므로 시작 시점에 만듦
+        state.semaphore = asyncio.Semaphore(state.settings.llm_concurrency)
+        startup = asyncio.create_task(state.start())
+        try:
+            yield
+        finally:
+            startup.cancel()
+
+    app = FastAPI(title="LikeKNU RAG API", lifespan=lifespan)
+    app.state.api = state
+
+    @app.get("/health/live")
+    async def live():
+        return {"status": "ok"}
+
+    @app.get("/health/ready")
+    async def ready():
+        if state.ready:
+            return {"status": "ready", "warmup_seconds": state.warmup_seconds}
+        status = "failed" if state.error else "starting"
+        return JSONResponse(status_code=503, content={"status": status, "error": state.error})
+
+    @app.post("/chat")
+    async def chat(body: ChatRequest, request: Request):
+        rag = state.admit(request)
+        campus = parse_campus(body.campus)
+        key = (normalize_text(body.question), campus.value if campus else "ALL")
+        try:
+            response, coalesced = await state.coalescer.run(key, lambda: rag.achat(body.question, body.campus))
+        except Exception as e:
+            logger.exception("답변 생성 실패")
+            raise HTTPException(status_code=502, detail=f"답변 생성 실패: {e}")
+        response["coalesced"] = coalesced
+        return response
+
+    @app.post("/chat/stream")
+    async def chat_stream(body: ChatRequest, request: Request):
+        # 스트림은 클라이언트마다 토큰을 따로 받아야 하므로 합치지 않음 (LLM 동시 호출 제한은 그대로 적용)
+        rag = state.admit(request)
+        return StreamingResponse(
+            stream_events(rag, body.question, body.campus),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @app.post("/search")
+    async def search(body: SearchRequest, request: Request):
+        rag = state.admit(request)
+        campus = parse_campus(body.campus)
+        metadata_filter = None
+        if body.days is not None:
+            metadata_filter = MetadataFilter.recent(body.days, categories=body.categories)
+        elif body.categories:
+            metadata_filter = MetadataFilter(categories=frozenset(body.categories))
+        results = await asyncio.to_thread(
+            rag.search_documents_with_scores, body.query, body.k, campus, metadata_filter
+        )
+        return {
+            "query": body.query,
+            "results": [
+                {
+                    "content": doc.page_content,
+                    "metadata": doc.metadata,
+                    "similarity": round(distance_to_similarity(distance), 4)
+                }
+                for doc, distance in results
+            ]
+        }
+
+    @app.get("/stats")
+    async def stats():
+        rag = state.rag
+        return {
+            "pid": os.getpid(),
+            "ready": state.ready,
+            "uptime_seconds": round(time.time() - state.started_at, 1),
+            "llm_concurrency": state.settings.llm_concurrency,
+            "rate_limit": dict(state.limiter.stats, clients=state.limiter.clients) if state.limiter else None,
+            "coalescing": dict(state.coalescer.stats, inflight=state.coalescer.inflight),
+            "retrieval": rag.get_retrieval_stats() if rag else None,
+            "answer_cache": rag.get_answer_cache_stats() if rag else None
+        }
+
+    return app
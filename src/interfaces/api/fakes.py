@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import math
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class FakeChatModel(BaseChatModel):
+    """OpenAI 대신 쓰는 로컬 부하 테스트용 채팅 모델.
+
+    첫 토큰까지 first_token_ms, 이후 토큰마다 token_ms만큼 기다린 뒤 고정된 답변을 토큰 단위로 돌려줍니다.
+    calls로 실제 호출 횟수를 세므로 요청 합치기/동시 호출 제한을 확인할 수 있습니다.
+    """
+
+    first_token_ms: float = 300.0
+    token_ms: float = 20.0
+    tokens: int = 40
+    calls: int = 0
+    active: int = 0
+    max_active: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _answer_tokens(self, messages: List[BaseMessage]) -> List[str]:
+        question = str(messages[-1].content) if messages else ""
+        words = [f"'{question[:40]}'에", "대한", "테스트", "답변입니다."]
+        return [f"{words[i % len(words)]} " for i in range(self.tokens)]
+
+    def _begin(self) -> None:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+    def _iter_tokens(self, messages: List[BaseMessage]) -> Iterator[ChatGenerationChunk]:
+        self._begin()
+        try:
+            for index, token in enumerate(self._answer_tokens(messages)):
+                time.sleep((self.first_token_ms if index == 0 else self.token_ms) / 1000)
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        finally:
+            self.active -= 1
+
+    async def _aiter_tokens(self, messages: List[BaseMessage]) -> AsyncIterator[ChatGenerationChunk]:
+        self._begin()
+        try:
+            for index, token in enumerate(self._answer_tokens(messages)):
+                await asyncio.sleep((self.first_token_ms if index == 0 else self.token_ms) / 1000)
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        finally:
+            self.active -= 1
+
+    def _generate(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[CallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> ChatResult:
+        text = "".join(chunk.message.content for chunk in self._iter_tokens(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _agenerate(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> ChatResult:
+        text = "".join([chunk.message.content async for chunk in self._aiter_tokens(messages)])
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _stream(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[CallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        for chunk in self._iter_tokens(messages):
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async for chunk in self._aiter_tokens(messages):
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+
+class HashingEmbeddings:
+    """모델 파일 없이 서버를 띄울 때 쓰는 결정적 임베딩 (문자 2-gram 해싱, L2 정규화).
+
+    의미 검색 품질은 없지만 글자가 많이 겹치는 질의와 문서는 유사도가 높게 나와 검색/캐시 경로를 그대로 탈 수 있습니다.
+    """
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+        self.model_name = f"hashing-{dimension}"
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimension
+        compact = "".join(text.lower().split())
+        for i in range(max(1, len(compact) - 1)):
+            digest = hashlib.blake2b(compact[i:i + 2].encode("utf-8"), digest_size=4).digest()
+            vector[int.from_bytes(digest, "little") % self.dimension] += 1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    def warmup(self) -> float:
+        return 0.0
+
+    def get_embedding_dimension(self) -> int:
+        return self.dimension
@@ -0,0 +1,82 @@
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class RateLimiter:
+    """클라이언트별 토큰 버킷 요청 제한.
+
+    분당 rate_per_minute개씩 토큰이 차고 최대 burst개까지 쌓입니다. 추적하는 클라이언트는 max_clients개까지만
+    유지하고, 가장 오래 요청하지 않은 클라이언트부터 버립니다 (버려진 클라이언트는 가득 찬 버킷으로 다시 시작).
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None, max_clients: int = 10000):
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst if burst is not None else max(1, int(rate_per_minute)))
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"allowed": 0, "limited": 0}
+
+    def acquire(self, client: Hashable, now: Optional[float] = None) -> float:
+        """토큰 하나를 씁니다. 허용되면 0, 제한되면 다시 시도할 수 있을 때까지 남은 초를 반환합니다."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens >= 1.0:
+                tokens -= 1.0
+                retry_after = 0.0
+                self.stats["allowed"] += 1
+            else:
+                retry_after = (1.0 - tokens) / self.rate if self.rate > 0 else 60.0
+                self.stats["limited"] += 1
+            self._buckets[client] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    @property
+    def clients(self) -> int:
+        return len(self._buckets)
+
+
+class RequestCoalescer:
+    """같은 키로 동시에 들어온 요청을 한 번만 실행합니다 (single-flight).
+
+    처음 들어온 요청이 작업을 시작하고, 작업이 끝나기 전에 같은 키로 들어온 요청은 그 결과를 함께 기다립니다.
+    작업은 asyncio.shield로 감싸므로 기다리던 클라이언트 하나가 연결을 끊어도 나머지 요청은 계속 결과를 받습니다.
+    결과는 요청마다 깊은 복사본을 돌려주고, 작업이 끝나면 키를 지우므로 결과를 캐시하지는 않습니다 (캐시는 답변 캐시가 담당).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """(결과, 다른 요청과 합쳐졌는지)를 반환합니다. 작업이 예외로 끝나면 기다리던 요청 모두에 같은 예외가 전달됩니다."""
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["executed"] += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key, task=task: self._discard(key, task))
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result), coalesced
+
+    def _discard(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리는 요청이 모두 끊긴 채 실패한 작업의 예외가 "never retrieved" 경고로 남지 않도록 읽어 둠
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
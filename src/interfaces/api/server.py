@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""RAG API 서버 실행.
+
+    python -m src.interfaces.api.server --port 8000
+    python -m src.interfaces.api.server --fake-llm --fake-embeddings --sample-data   # 로컬 부하 테스트용 (OpenAI/모델 파일 불필요)
+    python -m src.interfaces.api.server --store faiss --workers 4                      # pre-fork 워커 (모델 가중치 공유)
+
+--workers가 2 이상이면 부모가 소켓을 열고 모델을 올린 뒤 PreforkServer로 워커를 fork합니다.
+각 워커는 자기 이벤트 루프에서 uvicorn을 실행하고, LLM 동시 호출 제한과 요청 합치기는 워커 단위로 적용됩니다.
+"""
+
+import argparse
+import atexit
+import multiprocessing
+import os
+import shutil
+import socket
+import tempfile
+from typing import Any, Callable, Optional
+
+from .app import create_app
+from ...shared.utils.env import load_env
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LikeKNU RAG API 서버")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("API_WORKERS", "1")))
+    parser.add_argument("--store", choices=["chroma", "faiss"], default=os.getenv("API_VECTOR_STORE", "chroma"))
+    parser.add_argument("--persist-directory", default=None)
+    parser.add_argument("--sample-data", action="store_true", help="시작 시 샘플 공지사항을 (중복 없이) 추가")
+    parser.add_argument("--fake-llm", action="store_true", help="OpenAI 대신 지연만 흉내 내는 FakeChatModel 사용")
+    parser.add_argument("--fake-first-token-ms", type=float, default=300.0)
+    parser.add_argument("--fake-token-ms", type=float, default=20.0)
+    parser.add_argument("--fake-embeddings", action="store_true", help="모델 대신 해싱 임베딩 사용 (임시 저장소)")
+    parser.add_argument("--log-level", default="warning")
+    return parser.parse_args(argv)
+
+
+def make_embeddings(args: argparse.Namespace) -> Any:
+    if args.fake_embeddings:
+        from .fakes import HashingEmbeddings
+        return HashingEmbeddings()
+    from ...infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+    return KoreanEmbeddings()
+
+
+def make_store(args: argparse.Namespace, embeddings: Any) -> Any:
+    if args.store == "faiss":
+        from ...infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+        return FaissNoticeVectorStore(args.persist_directory, embeddings=embeddings)
+    from ...infrastructure.vector_store.chroma_store import NoticeVectorStore
+    return NoticeVectorStore(args.persist_directory, embeddings=embeddings)
+
+
+def add_sample_data(store: Any) -> None:
+    from ...application.processors.document_processor import create_sample_langchain_documents
+
+    store.add_documents_with_dedup(create_sample_langchain_documents())
+    print(f"📊 현재 총 문서 수: {store.get_collection_info()['count']}개")
+
+
+def load_sample_data_in_child(args: argparse.Namespace) -> None:
+    """부모에서 임베딩 추론을 하거나 Chroma 클라이언트를 열면 fork된 워커가 쓸 수 없으므로, 잠깐 띄운 자식 프로세스에서 샘플 데이터를 넣습니다."""
+    def load():
+        store = make_store(args, make_embeddings(args))
+        add_sample_data(store)
+
+    process = multiprocessing.get_context("fork").Process(target=load)
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError("샘플 데이터 추가 실패")
+
+
+def make_rag_factory(args: argparse.Namespace, store_factory: Callable[[], Any]) -> Callable[[], Any]:
+    def factory():
+        from ...application.services.rag_service import NoticeRAGSystem
+
+        llm = None
+        if args.fake_llm:
+            from .fakes import FakeChatModel
+            llm = FakeChatModel(first_token_ms=args.fake_first_token_ms, token_ms=args.fake_token_ms)
+        return NoticeRAGSystem(store_factory(), llm=llm)
+
+    return factory
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app: Any, sock: socket.socket, log_level: str) -> None:
+    import uvicorn
+
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def run_prefork(args: argparse.Namespace) -> None:
+    from ..prefork import PreforkServer, init_store_worker, prepare_shared_store
+
+    sock = bind_socket(args.host, args.port)
+    shared_store: Optional[Any] = None
+    embeddings: Optional[Any] = None
+
+    if args.sample_data:
+        load_sample_data_in_child(args)
+    if args.store == "faiss":
+        # 저장소와 임베딩 모델을 부모에서 올려 워커와 copy-on-write로 공유
+        shared_store = make_store(args, make_embeddings(args))
+        prepare_shared_store(shared_store)
+    else:
+        # Chroma 저장소는 워커마다 따로 열고 임베딩 모델만 공유
+        embeddings = make_embeddings(args)
+        if hasattr(embeddings, "load"):
+            embeddings.load()
+
+    def serve(worker_id: int):
+        if shared_store is not None:
+            init_store_worker(shared_store, args.workers)
+            store_factory = lambda: shared_store
+        else:
+            if hasattr(embeddings, "after_fork"):
+                embeddings.after_fork(num_threads=max(1, (os.cpu_count() or 1) // args.workers))
+            store_factory = lambda: make_store(args, embeddings)
+        run_worker(create_app(make_rag_factory(args, store_factory)), sock, args.log_level)
+
+    print(f"🚀 API 서버 http://{args.host}:{args.port} (워커 {args.workers}개, {args.store})")
+    PreforkServer(serve, workers=args.workers).run()
+
+
+def main(argv=None) -> None:
+    load_env()
+    args = parse_args(argv)
+    if args.persist_directory is None:
+        # 해싱 임베딩은 실제 모델과 차원/공간이 다르므로 기존 저장소를 건드리지 않도록 임시 디렉터리 사용
+        if args.fake_embeddings:
+            args.persist_directory = tempfile.mkdtemp(prefix="likeknu-api-")
+            atexit.register(shutil.rmtree, args.persist_directory, True)
+        else:
+            args.persist_directory = f"./data/{args.store}_db"
+
+    if args.workers > 1:
+        run_prefork(args)
+        return
+
+    def store_factory():
+        store = make_store(args, make_embeddings(args))
+        if args.sample_data:
+            add_sample_data(store)
+        return store
+
+    sock = bind_socket(args.host, args.port)
+    print(f"🚀 API 서버 http://{args.host}:{args.port} ({args.store})")
+    run_worker(create_app(make_rag_factory(args, store_factory)), sock, args.log_level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def process_memory(pid: int) -> Dict[str, float]:
+    """/proc/<pid>/smaps_rollup에서 RSS/PSS/USS를 MB 단위로 읽습니다 (Linux 전용).
+
+    RSS는 공유 페이지를 프로세스마다 중복해서 세므로, 여러 워커의 실제 메모리 합계는 PSS 합으로 봐야 합니다.
+    """
+    values: Dict[str, int] = {}
+    with open(f"/proc/{pid}/smaps_rollup") as rollup:
+        for line in rollup:
+            parts = line.split()
+            if len(parts) >= 3 and parts[0].endswith(":"):
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss_mb": values.get("Rss", 0) / 1024,
+        "pss_mb": values.get("Pss", 0) / 1024,
+        "uss_mb": (values.get("Private_Clean", 0) + values.get("Private_Dirty", 0)) / 1024
+    }
+
+
+def memory_report(pids: Iterable[int]) -> Dict[str, float]:
+    """여러 프로세스의 RSS/PSS/USS 합계. 이미 종료된 프로세스는 건너뜁니다."""
+    total = {"processes": 0, "rss_mb": 0.0, "pss_mb": 0.0, "uss_mb": 0.0}
+    for pid in pids:
+        try:
+            memory = process_memory(pid)
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+        total["processes"] += 1
+        for key, value in memory.items():
+            total[key] += value
+    return total
+
+
+class PreforkServer:
+    """부모 프로세스에서 모델과 인덱스를 올린 뒤 workers개 자식을 fork해 serve(worker_id)를 실행합니다.
+
+    자식은 부모의 메모리 페이지를 copy-on-write로 공유하므로 모델 가중치와 인덱스가 워커 수만큼 복제되지 않습니다.
+    fork 전에 gc.freeze()로 부모 객체를 GC 추적에서 빼서, 자식의 GC가 객체 헤더를 건드려 공유 페이지가 복사되는 것을 줄입니다.
+    부모는 워커를 감시하다가 비정상 종료한 워커를 다시 fork하고, SIGTERM/SIGINT를 받으면 워커를 모두 종료합니다.
+
+    fork 전에 부모에서 추론을 실행하거나 스레드/SQLite 연결을 쓰지 말고, 워커에서 after_fork 계열 메서드로 다시 엽니다
+    (prepare_shared_store / init_store_worker 참고).
+    """
+
+    def __init__(
+            self,
+            serve: Callable[[int], Any],
+            workers: Optional[int] = None,
+            restart: bool = True,
+            restart_delay: float = 1.0,
+            freeze_gc: bool = True
+    ):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("PreforkServer는 fork를 지원하는 POSIX 환경에서만 사용할 수 있습니다")
+        self.serve = serve
+        self.workers = workers or os.cpu_count() or 1
+        self.restart = restart
+        self.restart_delay = restart_delay
+        self.freeze_gc = freeze_gc
+        self._children: Dict[int, int] = {}
+        self._stopping = False
+
+    @property
+    def pids(self) -> List[int]:
+        return list(self._children)
+
+    def _spawn(self, worker_id: int) -> int:
+        # 부모 버퍼에 남은 출력이 자식에서 한 번 더 찍히지 않도록 fork 전에 비움
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self.serve(worker_id)
+            except BaseException:
+                logger.exception("워커 %d 실행 실패", worker_id)
+                code = 1
+            finally:
+                # 부모의 atexit 핸들러를 자식에서 다시 실행하지 않도록 출력만 비우고 바로 종료
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        self._children[pid] = worker_id
+        return pid
+
+    def start(self) -> List[int]:
+        if self.freeze_gc:
+            gc.collect()
+            gc.freeze()
+        for worker_id in range(self.workers):
+            self._spawn(worker_id)
+        print(f"🍴 워커 {self.workers}개 시작 (부모 pid {os.getpid()})")
+        return self.pids
+
+    def _handle_signal(self, signum, frame):
+        self._stopping = True
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def wait(self) -> None:
+        """워커가 모두 끝날 때까지 감시합니다. 종료 신호 전에 비정상 종료한 워커는 restart_delay 뒤 다시 fork합니다."""
+        previous = {sig: signal.signal(sig, self._handle_signal) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            while self._children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                worker_id = self._children.pop(pid, None)
+                if worker_id is None:
+                    continue
+
+                code = os.waitstatus_to_exitcode(status)
+                if code != 0 and self.restart and not self._stopping:
+                    print(f"⚠️ 워커 {worker_id} (pid {pid}) 비정상 종료 (code {code}), 다시 시작")
+                    time.sleep(self.restart_delay)
+                    if not self._stopping:
+                        self._spawn(worker_id)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """워커에 SIGTERM을 보내고 timeout 안에 끝나지 않으면 SIGKILL로 종료합니다."""
+        self._stopping = True
+        self._handle_signal(signal.SIGTERM, None)
+        deadline = time.monotonic() + timeout
+        while self._children and time.monotonic() < deadline:
+            for pid in self.pids:
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    self._children.pop(pid, None)
+            time.sleep(0.05)
+
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._children.pop(pid, None)
+
+    def run(self) -> None:
+        self.start()
+        try:
+            self.wait()
+        finally:
+            self.stop()
+
+
+def prepare_shared_store(store: Any) -> None:
+    """부모에서 호출합니다. 추론 없이 임베딩 모델만 올려 워커와 가중치를 공유합니다.
+
+    fork 후 연결을 다시 열 수 있는 저장소(FaissNoticeVectorStore)만 공유할 수 있습니다.
+    Chroma 클라이언트는 fork 후 쓸 수 없으므로 NoticeVectorStore는 워커에서 만들고 임베딩 객체만 공유합니다.
+    """
+    if not hasattr(store, "reopen_after_fork"):
+        raise ValueError(f"{type(store).__name__}는 fork된 워커와 공유할 수 없습니다. 워커에서 저장소를 만드세요")
+    embeddings = getattr(store, "embeddings", None)
+    if hasattr(embeddings, "load"):
+        embeddings.load()
+
+
+def init_store_worker(store: Any, workers: int) -> None:
+    """fork된 워커에서 호출합니다. SQLite 연결/스레드를 새로 만들고, 코어를 워커 수로 나눈 만큼 추론 스레드를 쓰게 한 뒤 warm-up합니다."""
+    if hasattr(store, "reopen_after_fork"):
+        store.reopen_after_fork()
+    embeddings = getattr(store, "embeddings", None)
+    if hasattr(embeddings, "after_fork"):
+        threads = None if os.getenv("EMBEDDING_THREADS") else max(1, (os.cpu_count() or 1) // workers)
+        embeddings.after_fork(num_threads=threads)
+    if hasattr(store, "warmup"):
+        store.warmup()
@@ -0,0 +1,23 @@
+import threading
+
+_env_lock = threading.Lock()
+_env_loaded = False
+
+
+def load_env() -> None:
+    """.env 파일을 프로세스당 한 번만 읽습니다.
+
+    모듈 import 시점에 읽지 않고, 환경 변수를 실제로 사용하는 생성자와 create_*_from_env 팩토리에서 호출합니다.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _env_lock:
+        if _env_loaded:
+            return
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+        _env_loaded = True
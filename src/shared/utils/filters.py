@@ -1,19 +1,15 @@
-from typing import List
-from langchain.schema import Document
+from typing import TYPE_CHECKING, List
 
 from ...domain.models import Campus
 
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
 
 def filter_documents_by_campus(
-        documents: List[Document],
+        documents: List["Document"],
         user_campus: Campus
-) -> List[Document]:
-    allowed_campuses = [Campus.ALL, user_campus]
-    filtered_docs = []
-
-    for doc in documents:
-        doc_campus = Campus(doc.metadata["campus"])
-        if doc_campus in allowed_campuses:
-            filtered_docs.append(doc)
-
-    return filtered_docs
\ No newline at end of file
+) -> List["Document"]:
+    # 문서마다 Campus enum을 만들지 않고 문자열 값으로 비교
+    allowed_campuses = {Campus.ALL.value, user_campus.value}
+    return [doc for doc in documents if doc.metadata.get("campus") in allowed_campuses]
@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.application.services.answer_cache import SemanticAnswerCache
+from src.domain.models import Campus
+
+
+def unit(*values) -> list:
+    vector = np.asarray(values, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def test_hit_is_scoped_by_campus_and_expires():
+    cache = SemanticAnswerCache(similarity_threshold=0.95, ttl_seconds=60)
+    cache.store(unit(1, 0, 0), Campus.SINGWAN, {"answer": "수강신청은 2월 15일부터"}, {"n1"}, 0.5)
+
+    assert cache.lookup(unit(1, 0.1, 0), Campus.SINGWAN)["answer"] == "수강신청은 2월 15일부터"
+    assert cache.lookup(unit(1, 0.1, 0), Campus.CHEONAN) is None
+    assert cache.lookup(unit(0, 1, 0), Campus.SINGWAN) is None
+
+    cache.ttl_seconds = 0
+    assert cache.lookup(unit(1, 0, 0), Campus.SINGWAN) is None
+    assert cache.stats()["hit_rate"] == 0.25
+    print("✅ 답변 캐시 조회 테스트 통과")
+
+
+def test_invalidation_by_notice_id_and_new_chunks():
+    cache = SemanticAnswerCache()
+    cache.store(unit(1, 0, 0), Campus.SINGWAN, {"answer": "a"}, {"n1"}, 0.8)
+    cache.store(unit(0, 1, 0), Campus.CHEONAN, {"answer": "b"}, {"n2"}, 0.8)
+
+    # 다른 캠퍼스 공지나 검색 결과에 들어오지 못할 만큼 먼 청크는 영향 없음
+    assert cache.invalidate({"n3"}, {Campus.YESAN.value}, [unit(1, 0, 0)]) == 0
+    assert cache.invalidate({"n3"}, {Campus.ALL.value}, [unit(0, 0, 1)]) == 0
+
+    # 기존 근거 문서가 바뀌거나, 가까운 새 청크가 들어오면 무효화
+    assert cache.invalidate({"n1"}, set()) == 1
+    assert cache.invalidate({"n4"}, {Campus.ALL.value}, [unit(0, 1, 0.1)]) == 1
+    assert cache.stats()["size"] == 0
+
+    # 검색 도중 무효화가 일어났다면 답변을 저장하지 않음
+    generation = cache.generation
+    cache.invalidate({"n5"}, set())
+    assert not cache.store(unit(1, 0, 0), None, {"answer": "c"}, {"n5"}, 0.8, generation=generation)
+    print("✅ 답변 캐시 무효화 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_hit_is_scoped_by_campus_and_expires()
+    test_invalidation_by_notice_id_and_new_chunks()
+    print("\n✅ 모든 답변 캐시 테스트 통과!")
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from langchain_core.documents import Document
+
+from src.application.services.rag_service import NoticeRAGSystem
+from src.interfaces.api.app import ApiSettings, create_app
+from src.interfaces.api.fakes import FakeChatModel
+
+
+class FakeStore:
+    """항상 같은 공지사항 하나를 돌려주고, gate가 열릴 때까지 warm-up을 끝내지 않는 저장소."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.document = Document(
+            page_content="2024년 1학기 수강신청은 2월 15일부터 2월 17일까지입니다.",
+            metadata={"notice_id": "12345", "title": "수강신청 안내", "campus": "ALL", "category": "ACADEMIC"}
+        )
+
+    def warmup(self):
+        self.gate.wait(timeout=10)
+
+    def similarity_search_with_score(self, query, k=5, campus_filter=None, metadata_filter=None):
+        return [(self.document, 0.0)]
+
+
+def make_app(llm: FakeChatModel, **settings):
+    store = FakeStore()
+    rag_factory = lambda: NoticeRAGSystem(store, llm=llm, use_answer_cache=False, retrieval_mode="vector")
+    return store, create_app(rag_factory, ApiSettings(**settings))
+
+
+async def wait_ready(client: httpx.AsyncClient):
+    for _ in range(200):
+        if (await client.get("/health/ready")).status_code == 200:
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("준비 상태가 되지 않음")
+
+
+async def serve(app, scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await scenario(client)
+
+
+def test_readiness_follows_warmup():
+    store, app = make_app(FakeChatModel(first_token_ms=0, token_ms=0, tokens=2))
+
+    async def scenario(client):
+        await asyncio.sleep(0.05)
+        assert (await client.get("/health/live")).status_code == 200
+        assert (await client.get("/health/ready")).json()["status"] == "starting"
+        assert (await client.post("/chat", json={"question": "수강신청"})).status_code == 503
+
+        store.gate.set()
+        await wait_ready(client)
+        assert (await client.post("/chat", json={"question": "수강신청"})).status_code == 200
+
+    asyncio.run(serve(app, scenario))
+    print("✅ warm-up 준비 상태 테스트 통과")
+
+
+def test_identical_questions_coalesced_and_llm_limited():
+    llm = FakeChatModel(first_token_ms=100, token_ms=0, tokens=3)
+    store, app = make_app(llm, llm_concurrency=1, rate_limit_per_minute=0)
+    store.gate.set()
+
+    async def scenario(client):
+        await wait_ready(client)
+        questions = ["수강신청 언제?"] * 4 + ["  수강신청   언제? "] + ["도서관 휴관", "주차장 공사"]
+        responses = await asyncio.gather(*(client.post("/chat", json={"question": q}) for q in questions))
+        assert all(response.status_code == 200 for response in responses)
+        # 정규화 후 같은 질문 5개는 LLM을 한 번만 호출
+        assert llm.calls == 3
+        assert sum(response.json()["coalesced"] for response in responses) == 4
+        assert len({response.json()["answer"] for response in responses[:5]}) == 1
+        # 서로 다른 질문도 동시에 한 번에 하나씩만 LLM을 호출
+        assert llm.max_active == 1
+
+        stats = (await client.get("/stats")).json()
+        assert stats["coalescing"] == {"executed": 3, "coalesced": 4, "inflight": 0}
+
+    asyncio.run(serve(app, scenario))
+    print("✅ 요청 합치기/LLM 동시 호출 제한 테스트 통과")
+
+
+def test_rate_limit_per_client():
+    store, app = make_app(FakeChatModel(), rate_limit_per_minute=60, rate_burst=2, trust_proxy=True)
+    store.gate.set()
+
+    async def scenario(client):
+        await wait_ready(client)
+        first = {"X-Forwarded-For": "10.0.0.1"}
+        statuses = [(await client.post("/search", json={"query": "수강신청"}, headers=first)).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+
+        limited = await client.post("/search", json={"query": "수강신청"}, headers=first)
+        assert limited.status_code == 429 and int(limited.headers["Retry-After"]) >= 1
+        # 다른 클라이언트는 영향 없음
+        other = await client.post("/search", json={"query": "수강신청"}, headers={"X-Forwarded-For": "10.0.0.2, 10.0.0.1"})
+        assert other.status_code == 200
+        assert other.json()["results"][0]["similarity"] == 1.0
+
+    asyncio.run(serve(app, scenario))
+    print("✅ 클라이언트별 요청 제한 테스트 통과")
+
+
+def test_stream_sends_sse_events():
+    store, app = make_app(FakeChatModel(first_token_ms=0, token_ms=0, tokens=3))
+    store.gate.set()
+
+    async def scenario(client):
+        await wait_ready(client)
+        async with client.stream("POST", "/chat/stream", json={"question": "수강신청"}) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [line[len("event: "):] async for line in response.aiter_lines() if line.startswith("event: ")]
+        assert events == ["sources", "token", "token", "token", "done"]
+
+    asyncio.run(serve(app, scenario))
+    print("✅ SSE 스트리밍 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_readiness_follows_warmup()
+    test_identical_questions_coalesced_and_llm_limited()
+    test_rate_limit_per_client()
+    test_stream_sends_sse_events()
+    print("\n✅ 모든 API 테스트 통과!")
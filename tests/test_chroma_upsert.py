@@ -0,0 +1,109 @@
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from langchain_core.documents import Document
+
+from src.domain.models import Campus
+from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+from src.interfaces.api.fakes import HashingEmbeddings
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    """임베딩한 텍스트를 기록합니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+def chunk(notice_id, text, campus="ALL", title=None):
+    metadata = {"title": title or f"공지 {notice_id}", "campus": campus, "category": "ACADEMIC"}
+    if notice_id:
+        metadata["notice_id"] = notice_id
+    return Document(page_content=text, metadata=metadata)
+
+
+def make_store(directory):
+    embeddings = CountingEmbeddings()
+    store = NoticeVectorStore(directory, embeddings=embeddings)
+    changes = []
+    store.add_change_listener(changes.append)
+    return store, embeddings, changes
+
+
+def test_unchanged_changed_and_removed_chunks():
+    with tempfile.TemporaryDirectory() as directory:
+        store, embeddings, changes = make_store(directory)
+        store.update_documents([
+            chunk("1", "수강신청 안내 첫 청크"), chunk("1", "수강신청 안내 둘째 청크"), chunk("2", "도서관 휴관 안내")
+        ])
+        embeddings.embedded.clear()
+
+        # 1번 공지: 첫 청크만 바뀌고 둘째 청크는 빠짐 / 2번 공지: 그대로 / 3번 공지: 새로 추가
+        store.update_documents([chunk("1", "수강신청 일정 변경"), chunk("2", "도서관 휴관 안내"), chunk("3", "주차장 공사")])
+        assert embeddings.embedded == ["수강신청 일정 변경", "주차장 공사"]
+        assert store.notice_index.get_chunk_ids("1") == ["1:0"]
+        assert store.get_existing_notice_ids() == {"1", "2", "3"}
+
+        # 목록에서 빠진 공지사항은 삭제
+        embeddings.embedded.clear()
+        store.update_documents([chunk("1", "수강신청 일정 변경"), chunk("3", "주차장 공사")])
+        assert embeddings.embedded == []
+        assert store.get_existing_notice_ids() == {"1", "3"}
+        assert store.get_collection_info()["count"] == 2
+        assert any(change.notice_ids == {"2"} for change in changes)
+    print("✅ 유지/변경/삭제 청크 upsert 테스트 통과")
+
+
+def test_metadata_only_change_updates_indexes_without_reembedding():
+    with tempfile.TemporaryDirectory() as directory:
+        store, embeddings, changes = make_store(directory)
+        store.update_documents([chunk("1", "천안캠퍼스 도서관 휴관", campus="SINGWAN")])
+        embeddings.embedded.clear()
+        changes.clear()
+
+        store.update_documents([chunk("1", "천안캠퍼스 도서관 휴관", campus="CHEONAN", title="도서관 휴관 (수정)")])
+        assert embeddings.embedded == []
+        stored = store.get_documents_by_id("1")[0].metadata
+        assert (stored["campus"], stored["title"]) == ("CHEONAN", "도서관 휴관 (수정)")
+        assert [doc.metadata["notice_id"] for doc, _ in store.similarity_search_with_score(
+            "도서관 휴관", k=1, campus_filter=Campus.CHEONAN
+        )] == ["1"]
+        assert store.similarity_search_with_score("도서관 휴관", k=1, campus_filter=Campus.SINGWAN) == []
+        # 답변 캐시가 바뀐 공지사항을 무효화할 수 있도록 알림
+        assert [change.notice_ids for change in changes] == [{"1"}]
+    print("✅ 메타데이터만 바뀐 청크 upsert 테스트 통과")
+
+
+def test_chunks_without_notice_id_are_not_duplicated():
+    with tempfile.TemporaryDirectory() as directory:
+        store, embeddings, changes = make_store(directory)
+        documents = [chunk("1", "수강신청 안내"), chunk(None, "notice_id 없는 안내문"), chunk(None, "notice_id 없는 안내문")]
+        first_ids = store.update_documents(documents)
+        assert len(set(first_ids)) == 3
+
+        embeddings.embedded.clear()
+        assert store.update_documents(documents) == first_ids
+        assert embeddings.embedded == []
+        assert store.get_collection_info()["count"] == 3
+
+        # 본문이 바뀐 id 없는 청크는 새 ID로 쓰이고 이전 청크는 정리됨
+        changes.clear()
+        store.update_documents([chunk("1", "수강신청 안내"), chunk(None, "바뀐 안내문")])
+        assert store.get_collection_info()["count"] == 2
+        assert any(change.reset for change in changes)
+    print("✅ notice_id 없는 청크 upsert 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_unchanged_changed_and_removed_chunks()
+    test_metadata_only_change_updates_indexes_without_reembedding()
+    test_chunks_without_notice_id_are_not_duplicated()
+    print("\n✅ 모든 upsert 테스트 통과!")
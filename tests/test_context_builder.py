@@ -0,0 +1,67 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from langchain.schema import Document
+
+from src.application.processors.text_splitter import NoticeTextSplitter
+from src.application.services.context_builder import ContextBuilder
+
+CONTENT = " ".join(f"{i}번 안내: 수강신청 기간에는 포털 접속이 지연될 수 있습니다." for i in range(60))
+
+
+def make_results():
+    chunks = NoticeTextSplitter().split_text(CONTENT)
+    results = [
+        (Document(page_content=chunk, metadata={"notice_id": "n1", "chunk_index": i, "title": "수강신청"}), 1.0 + i / 10)
+        for i, chunk in enumerate(chunks[:3])
+    ]
+    results.insert(1, (Document(page_content="국가장학금 신청 안내", metadata={"notice_id": "n2", "title": "장학금"}), 0.5))
+    return results
+
+
+def test_merges_adjacent_chunks_and_keeps_retriever_order():
+    packed = ContextBuilder(max_tokens=100000).build(make_results())
+
+    # n2의 벡터 거리가 더 가깝지만 검색기가 n1 청크를 먼저 돌려줬으므로 n1이 앞에 옴
+    assert [section.notice_id for section in packed.sections] == ["n1", "n2"]
+    merged = packed.sections[0].content
+    # 인접 청크의 겹치는 부분이 한 번만 남아 원문과 같아야 함
+    assert CONTENT.startswith(merged)
+    assert packed.stats["saved_tokens"] > 0
+    print("✅ 청크 병합 테스트 통과")
+
+
+def test_hybrid_order_is_not_resorted_by_distance():
+    # RRF 순위: 키워드로 찾은 n3(벡터 거리 1.5)가 1위, n1 청크는 뒤 순위에 흩어져 있어도 n1 자리에서 합쳐짐
+    chunks = NoticeTextSplitter().split_text(CONTENT)
+    results = [
+        (Document(page_content="졸업유예 신청 안내", metadata={"notice_id": "n3", "title": "졸업유예"}), 1.5),
+        (Document(page_content=chunks[1], metadata={"notice_id": "n1", "chunk_index": 1, "title": "수강신청"}), 0.4),
+        (Document(page_content="국가장학금 신청 안내", metadata={"notice_id": "n2", "title": "장학금"}), 0.3),
+        (Document(page_content=chunks[0], metadata={"notice_id": "n1", "chunk_index": 0, "title": "수강신청"}), 0.6),
+    ]
+    packed = ContextBuilder(max_tokens=100000).build(results)
+
+    assert [section.notice_id for section in packed.sections] == ["n3", "n1", "n2"]
+    assert packed.sections[1].chunk_count == 2
+    assert CONTENT.startswith(packed.sections[1].content)
+    assert packed.context.index("졸업유예") < packed.context.index("국가장학금")
+    print("✅ 하이브리드 검색 순서 유지 테스트 통과")
+
+
+def test_respects_token_budget():
+    builder = ContextBuilder(max_tokens=300)
+    packed = builder.build(make_results())
+
+    assert builder.count_tokens(packed.context) <= 300
+    assert packed.stats["truncated"]
+    print("✅ 토큰 예산 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_merges_adjacent_chunks_and_keeps_retriever_order()
+    test_hybrid_order_is_not_resorted_by_distance()
+    test_respects_token_budget()
+    print("\n✅ 모든 컨텍스트 빌더 테스트 통과!")
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.messaging.dispatcher import ConcurrentDispatcher
+
+
+def event(notice_id, action, event_id=None):
+    return SimpleNamespace(notice_id=notice_id, action=action, event_id=event_id or f"{notice_id}-{action}")
+
+
+class RecordingHandler:
+    """시작/종료 순서와 최대 동시 실행 수를 기록합니다."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.log = []
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, item):
+        self.log.append(("start", item.notice_id, item.action))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+            self.log.append(("end", item.notice_id, item.action))
+
+
+def test_same_key_runs_strictly_in_order():
+    async def scenario():
+        handler = RecordingHandler()
+        dispatcher = ConcurrentDispatcher(max_in_flight=8)
+        for action in ["created", "updated", "deleted"]:
+            await dispatcher.dispatch(handler.handle, event("1", action))
+        await dispatcher.drain()
+
+        # 앞선 이벤트가 끝난 뒤에야 다음 이벤트가 시작됨
+        assert handler.log == [
+            ("start", "1", "created"), ("end", "1", "created"),
+            ("start", "1", "updated"), ("end", "1", "updated"),
+            ("start", "1", "deleted"), ("end", "1", "deleted"),
+        ]
+        assert handler.max_active == 1
+        assert dispatcher.in_flight == 0
+
+    asyncio.run(scenario())
+    print("✅ 같은 키 순차 실행 테스트 통과")
+
+
+def test_different_keys_overlap_up_to_limit():
+    async def scenario():
+        handler = RecordingHandler(delay=0.1)
+        dispatcher = ConcurrentDispatcher(max_in_flight=3)
+        start = time.perf_counter()
+        for notice_id in range(6):
+            await dispatcher.dispatch(handler.handle, event(str(notice_id), "created"))
+        await dispatcher.drain()
+        elapsed = time.perf_counter() - start
+
+        # 서로 다른 공지사항은 한도(3)까지만 동시에 실행되어 두 차례에 나뉘어 처리됨
+        assert handler.max_active == 3
+        assert 0.2 <= elapsed < 0.5
+        assert len([entry for entry in handler.log if entry[0] == "end"]) == 6
+
+    asyncio.run(scenario())
+    print("✅ 다른 키 동시 실행/한도 테스트 통과")
+
+
+def test_failure_does_not_block_following_events():
+    async def scenario():
+        handled = []
+
+        def handler(item):
+            # 동기 핸들러는 스레드에서 실행됨
+            if item.action == "created":
+                raise RuntimeError("처리 실패")
+            handled.append(item.action)
+
+        dispatcher = ConcurrentDispatcher(max_in_flight=2)
+        await dispatcher.dispatch(handler, event("1", "created"))
+        await dispatcher.dispatch(handler, event("1", "updated"))
+        await dispatcher.drain()
+        assert handled == ["updated"]
+
+    asyncio.run(scenario())
+    print("✅ 실패 이벤트 이후 처리 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_same_key_runs_strictly_in_order()
+    test_different_keys_overlap_up_to_limit()
+    test_failure_does_not_block_following_events()
+    print("\n✅ 모든 디스패처 테스트 통과!")
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.batching import EmbeddingBatcher
+
+
+class RecordingModel:
+    """텍스트 길이로 벡터를 만들고 배치 크기를 기록하는 테스트용 모델."""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        with self._lock:
+            self.batches.append(list(texts))
+        if self.fail_on in texts:
+            raise ValueError("model failure")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_concurrent_sync_callers_share_batches():
+    model = RecordingModel()
+    batcher = EmbeddingBatcher(model.embed_documents, max_batch_size=8, max_wait_ms=50)
+    texts = [f"질의{'!' * i}" for i in range(20)] + ["질의", "질의"]
+
+    with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+        results = list(executor.map(batcher.embed, texts))
+
+    # 각 호출자는 자기 텍스트의 벡터를 받음
+    assert results == [[float(len(text)), 1.0] for text in texts]
+    # 최대 배치 크기를 넘지 않고, 호출 수보다 훨씬 적은 배치로 처리됨
+    assert all(len(batch) <= 8 for batch in model.batches)
+    assert len(model.batches) < len(texts) // 2
+    assert batcher.stats()["items"] == len(texts)
+    batcher.close()
+    print("✅ 동기 호출 배칭 테스트 통과")
+
+
+def test_async_callers_and_errors():
+    model = RecordingModel(fail_on="실패")
+    batcher = EmbeddingBatcher(model.embed_documents, max_batch_size=32, max_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(batcher.aembed(text) for text in ["a", "bb", "ccc"]))
+
+    assert asyncio.run(run()) == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert model.batches[-1] == ["a", "bb", "ccc"]
+
+    # 모델 오류는 해당 배치의 호출자에게 전달되고 워커는 계속 동작함
+    try:
+        batcher.embed("실패")
+        assert False, "예외가 전달되어야 함"
+    except ValueError:
+        pass
+    assert batcher.embed("dd") == [2.0, 1.0]
+
+    batcher.close()
+    try:
+        batcher.submit("e")
+        assert False, "종료 후에는 요청을 받지 않아야 함"
+    except RuntimeError:
+        pass
+    print("✅ asyncio 호출/오류 전달 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_concurrent_sync_callers_share_batches()
+    test_async_callers_and_errors()
+    print("\n✅ 모든 임베딩 배칭 테스트 통과!")
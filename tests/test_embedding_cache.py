@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.embedding_cache import EmbeddingCache, make_cache_key
+from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+
+
+class RecordingModel:
+    """텍스트 길이로 벡터를 만들고 모델에 들어온 텍스트를 기록합니다."""
+
+    def __init__(self):
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+class RecordingEmbeddings(KoreanEmbeddings):
+    def _load_model(self):
+        return RecordingModel()
+
+
+def test_hits_misses_and_model_separation():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "cache.sqlite3"))
+        key_a = make_cache_key("model-a", "수강신청")
+        key_b = make_cache_key("model-b", "수강신청")
+        assert key_a != key_b
+        # 공백/유니코드 정규화만 다른 텍스트는 같은 키
+        assert make_cache_key("model-a", "  수강신청 ") == key_a
+
+        cache.put_many({key_a: [1.0, 2.0]})
+        assert cache.get_many([key_a, key_b]) == {key_a: [1.0, 2.0]}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        cache.close()
+    print("✅ 임베딩 캐시 적중/모델 분리 테스트 통과")
+
+
+def test_lru_eviction_keeps_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "cache.sqlite3"), max_entries=3)
+        for index in range(3):
+            cache.put_many({f"k{index}": [float(index)]})
+            time.sleep(0.01)
+        # k0을 최근에 사용했으므로 넘칠 때 k1부터 방출
+        cache.get_many(["k0"])
+        time.sleep(0.01)
+        cache.put_many({"k3": [3.0]})
+
+        remaining = cache.get_many(["k0", "k1", "k2", "k3"])
+        assert set(remaining) == {"k0", "k3"}
+        assert cache.stats()["size"] == 2
+        cache.close()
+    print("✅ LRU 방출 테스트 통과")
+
+
+def test_periodic_recount_sees_other_writers():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.sqlite3")
+        cache = EmbeddingCache(path, max_entries=5, recount_interval=2)
+        other = EmbeddingCache(path, max_entries=5)
+        other.put_many({f"o{index}": [0.0] for index in range(5)})
+
+        # 이 연결의 추정치는 0이지만 recount_interval마다 실제 행 수를 세어 한도를 지킴
+        cache.put_many({"a": [1.0]})
+        cache.put_many({"b": [1.0]})
+        assert cache.stats()["size"] <= 5
+        other.close()
+        cache.close()
+    print("✅ 주기적 재계산 테스트 통과")
+
+
+def test_hits_do_not_write_until_flush():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.sqlite3")
+        cache = EmbeddingCache(path)
+        cache.put_many({"k0": [0.0]})
+        reader = EmbeddingCache(path)
+        stored = reader._conn.execute("SELECT last_used FROM embeddings WHERE key = 'k0'").fetchone()[0]
+
+        # 적중은 메모리에만 기록되고, put_many/flush 때 한 번에 디스크에 반영
+        time.sleep(0.01)
+        cache.get_many(["k0"])
+        assert reader._conn.execute("SELECT last_used FROM embeddings WHERE key = 'k0'").fetchone()[0] == stored
+        cache.flush()
+        assert reader._conn.execute("SELECT last_used FROM embeddings WHERE key = 'k0'").fetchone()[0] > stored
+        reader.close()
+        cache.close()
+    print("✅ 조회 시 last_used 지연 기록 테스트 통과")
+
+
+def test_embeddings_keep_original_text():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "cache.sqlite3"))
+        embeddings = RecordingEmbeddings(model_name="fake-model", cache=cache)
+
+        first = embeddings.embed_documents(["수강신청\n\n안내", "수강신청 안내 "])
+        # 모델에는 줄바꿈이 살아 있는 원문이 들어가고, 공백만 다른 입력은 같은 캐시 항목을 나눠 씀
+        assert embeddings.embeddings.texts == ["수강신청\n\n안내"]
+        assert first[0] == first[1] == [8.0, 1.0]
+
+        assert embeddings.embed_query(" 수강신청 안내") == [8.0, 1.0]
+        assert embeddings.embeddings.texts == ["수강신청\n\n안내"]
+
+        # 캐시를 쓰지 않으면 입력 그대로 임베딩
+        uncached = RecordingEmbeddings(model_name="fake-model", use_cache=False)
+        uncached.embed_documents(["첫 줄\n둘째 줄"])
+        assert uncached.embeddings.texts == ["첫 줄\n둘째 줄"]
+        cache.close()
+    print("✅ 원문 임베딩/정규화 캐시 키 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_hits_misses_and_model_separation()
+    test_lru_eviction_keeps_recently_used()
+    test_periodic_recount_sees_other_writers()
+    test_hits_do_not_write_until_flush()
+    test_embeddings_keep_original_text()
+    print("\n✅ 모든 임베딩 캐시 테스트 통과!")
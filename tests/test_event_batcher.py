@@ -0,0 +1,131 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.messaging.handlers.event_batcher import EventBatcher
+
+
+def event(notice_id, action="created"):
+    return SimpleNamespace(notice_id=notice_id, action=action)
+
+
+class RecordingHandler:
+    """받은 배치를 기록하고, fail_times번까지는 실패합니다."""
+
+    def __init__(self, fail_times=0, delay=0.0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, batch):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.calls <= self.fail_times:
+                raise RuntimeError("저장 실패")
+            self.batches.append([(item.notice_id, item.action) for item in batch])
+        finally:
+            self.active -= 1
+
+
+def test_size_and_timer_triggers():
+    async def scenario():
+        handler = RecordingHandler()
+        batcher = EventBatcher(handler, max_batch_size=3, max_batch_delay=0.05)
+        for notice_id in ["1", "2", "3"]:
+            await batcher.add(event(notice_id))
+        # 가득 찬 배치는 add 안에서 바로 처리
+        assert handler.batches == [[("1", "created"), ("2", "created"), ("3", "created")]]
+
+        await batcher.add(event("4"))
+        assert len(handler.batches) == 1
+        await asyncio.sleep(0.15)
+        assert handler.batches[-1] == [("4", "created")]
+        assert batcher.get_stats()["total_batches"] == 2
+
+    asyncio.run(scenario())
+    print("✅ 크기/시간 조건 배치 테스트 통과")
+
+
+def test_close_drains_pending_events():
+    async def scenario():
+        handler = RecordingHandler()
+        batcher = EventBatcher(handler, max_batch_size=10, max_batch_delay=60)
+        await batcher.add(event("1"))
+        await batcher.add(event("2"))
+        await batcher.close()
+        assert handler.batches == [[("1", "created"), ("2", "created")]]
+        assert batcher.get_stats()["pending"] == 0
+
+    asyncio.run(scenario())
+    print("✅ 종료 시 남은 이벤트 처리 테스트 통과")
+
+
+def test_failed_batch_is_retried_then_handed_to_error_handler():
+    async def scenario():
+        handler = RecordingHandler(fail_times=1)
+        batcher = EventBatcher(handler, max_batch_size=2, max_retries=2, retry_delay=0.01)
+        await batcher.add(event("1"))
+        await batcher.add(event("2"))
+        # 한 번 실패한 뒤 같은 배치로 다시 시도해 성공
+        assert handler.batches == [[("1", "created"), ("2", "created")]]
+        assert batcher.get_stats()["retried_batches"] == 1
+
+        failed = []
+        always_failing = RecordingHandler(fail_times=100)
+        batcher = EventBatcher(
+            always_failing, max_batch_size=1, max_retries=1, retry_delay=0.01,
+            error_handler=lambda batch, error: failed.append(([item.notice_id for item in batch], str(error)))
+        )
+        await batcher.add(event("3"))
+        assert always_failing.calls == 2
+        assert failed == [(["3"], "저장 실패")]
+        assert batcher.get_stats()["failed_events"] == 1
+
+        # error_handler가 없으면 예외가 호출자에게 전달됨
+        batcher = EventBatcher(RecordingHandler(fail_times=100), max_batch_size=1, max_retries=0)
+        try:
+            await batcher.add(event("4"))
+            raise AssertionError("예외가 전달되지 않음")
+        except RuntimeError:
+            pass
+
+    asyncio.run(scenario())
+    print("✅ 실패 배치 재시도/오류 핸들러 테스트 통과")
+
+
+def test_concurrent_flushes_keep_per_notice_order():
+    async def scenario():
+        handler = RecordingHandler(delay=0.05)
+        batcher = EventBatcher(handler, max_batch_size=1, max_concurrent_flushes=2)
+        # 같은 공지사항의 생성/수정/삭제는 순서대로, 다른 공지사항은 동시에 처리
+        await asyncio.gather(
+            batcher.add(event("1", "created")),
+            batcher.add(event("2", "created")),
+            batcher.add(event("1", "updated")),
+            batcher.add(event("1", "deleted")),
+        )
+        await batcher.close()
+
+        order = [item for batch in handler.batches for item in batch]
+        assert [action for notice_id, action in order if notice_id == "1"] == ["created", "updated", "deleted"]
+        assert handler.max_active == 2
+
+    asyncio.run(scenario())
+    print("✅ 동시 배치 처리 시 공지사항별 순서 보장 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_size_and_timer_triggers()
+    test_close_drains_pending_events()
+    test_failed_batch_is_retried_then_handed_to_error_handler()
+    test_concurrent_flushes_keep_per_notice_order()
+    print("\n✅ 모든 이벤트 배처 테스트 통과!")
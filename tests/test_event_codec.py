@@ -0,0 +1,58 @@
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.domain.models import Campus, NoticeCategory
+from src.infrastructure.messaging.codecs import BinaryEventCodec, JsonEventCodec, decode_event
+from src.infrastructure.messaging.events import NoticeEvent, EventType
+
+
+def make_event() -> NoticeEvent:
+    return NoticeEvent(
+        event_id="codec-1",
+        event_type=EventType.NOTICE_CREATED,
+        timestamp=datetime(2024, 2, 10, 9, 0, 0),
+        source_service="test",
+        notice_id="12345",
+        title="2024년 1학기 수강신청 안내",
+        content="신청 기간: 2024년 2월 15일(목) 09:00 ~ 2월 17일(토) 18:00\n" * 20,
+        url="https://www.kongju.ac.kr/notice/12345",
+        campus=Campus.ALL,
+        category=NoticeCategory.ACADEMIC,
+        published_date=datetime(2024, 2, 10, 9, 0, 0),
+        attachments=["수강신청_안내.pdf"]
+    )
+
+
+def test_binary_codec_roundtrip():
+    event = make_event()
+    codecs = [BinaryEventCodec(serializer="orjson", compression="zlib")]
+    try:
+        codecs.append(BinaryEventCodec(serializer="msgpack", compression="zstd"))
+    except ImportError:
+        pass
+
+    for codec in codecs:
+        payload = codec.encode(event)
+        assert payload[:2] == b"KE", "버전 헤더 누락"
+        assert decode_event(payload) == event, f"{codec.name} 왕복 변환 실패"
+
+    print("✅ 바이너리 코덱 왕복 테스트 통과")
+
+
+def test_legacy_json_messages_still_decode():
+    event = make_event()
+    payload = JsonEventCodec().encode(event)
+
+    assert payload.startswith(b"{"), "기존 JSON 형식이 바뀜"
+    assert decode_event(payload) == event
+    assert decode_event(payload.decode("utf-8")) == event
+    print("✅ 기존 JSON 메시지 호환성 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_binary_codec_roundtrip()
+    test_legacy_json_messages_still_decode()
+    print("\n✅ 모든 이벤트 코덱 테스트 통과!")
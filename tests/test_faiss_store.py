@@ -0,0 +1,157 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+faiss = pytest.importorskip("faiss")
+
+from langchain_core.documents import Document
+
+from src.domain.models import Campus
+from src.infrastructure.vector_store.faiss_store import FaissNoticeVectorStore
+from src.infrastructure.vector_store.metadata_index import MetadataFilter
+from src.interfaces.api.fakes import HashingEmbeddings
+
+NOTICES = [
+    ("1", "CHEONAN", "SCHOLARSHIP", "천안캠퍼스 국가장학금 2차 신청 안내"),
+    ("2", "SINGWAN", "SCHOLARSHIP", "신관캠퍼스 교내장학금 신청 안내"),
+    ("3", "ALL", "ACADEMIC", "2024학년도 1학기 수강신청 일정 안내"),
+    ("4", "CHEONAN", "ACADEMIC", "천안캠퍼스 졸업유예 신청 안내"),
+    ("5", "SINGWAN", "DORMITORY", "신관캠퍼스 기숙사 입사 신청 안내"),
+]
+
+
+def notice(notice_id, campus, category, text):
+    return Document(
+        page_content=text,
+        metadata={"notice_id": notice_id, "title": text, "campus": campus, "category": category}
+    )
+
+
+def make_store(directory, index_type, **options):
+    # exact_scan_limit=0: 필터 검색도 정확 계산 대신 faiss 인덱스의 ID 선택자를 거치도록 함
+    options.setdefault("exact_scan_limit", 0)
+    return FaissNoticeVectorStore(directory, index_type=index_type, embeddings=HashingEmbeddings(), **options)
+
+
+def notice_ids(results):
+    return [doc.metadata["notice_id"] for doc, _ in results]
+
+
+def run_store_lifecycle(index_type):
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory, index_type)
+        documents = [notice(*row) for row in NOTICES]
+        assert len(store.add_documents_with_dedup(documents)) == len(NOTICES)
+
+        # notice_id 중복은 건너뛰고, 같은 청크를 다시 넣으면 교체되어 개수가 그대로
+        assert store.add_documents_with_dedup(documents[:2]) == []
+        store.add_documents([documents[0]])
+        assert store.get_collection_info()["count"] == len(NOTICES)
+        assert store.get_existing_notice_ids() == {row[0] for row in NOTICES}
+
+        # 캠퍼스 필터는 전체(ALL) 공지사항을 포함하고 다른 캠퍼스는 제외
+        results = store.similarity_search_with_score("장학금 신청", k=5, campus_filter=Campus.CHEONAN)
+        assert set(notice_ids(results)) == {"1", "3", "4"}
+        results = store.similarity_search_with_score(
+            "장학금 신청", k=5, metadata_filter=MetadataFilter(categories=frozenset({"SCHOLARSHIP"}))
+        )
+        assert set(notice_ids(results)) == {"1", "2"}
+        assert notice_ids(store.similarity_search_with_score("천안캠퍼스 국가장학금 2차 신청 안내", k=1)) == ["1"]
+
+        # 삭제한 공지사항은 검색에 나오지 않음 (HNSW는 선택자로 제외)
+        assert store.delete_documents_by_id("1") == 1
+        assert not store.has_notice("1")
+        assert "1" not in notice_ids(store.similarity_search_with_score("천안캠퍼스 국가장학금 2차 신청 안내", k=5))
+        store.close()
+
+        # 저장한 인덱스와 문서 저장소를 다시 열어도 같은 결과
+        reopened = make_store(directory, index_type)
+        assert reopened.get_collection_info()["count"] == len(NOTICES) - 1
+        assert notice_ids(reopened.similarity_search_with_score("신관캠퍼스 기숙사 입사", k=1)) == ["5"]
+        assert "1" not in notice_ids(reopened.similarity_search_with_score("천안캠퍼스 국가장학금", k=5))
+        reopened.close()
+    print(f"✅ FAISS {index_type} 추가/중복 방지/필터 검색/삭제/재로드 테스트 통과")
+
+
+def test_flat_store():
+    run_store_lifecycle("flat")
+
+
+def test_hnsw_store():
+    run_store_lifecycle("hnsw")
+
+
+def test_ivf_store():
+    run_store_lifecycle("ivf")
+
+
+def run_reingest_with_fewer_chunks(index_type):
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory, index_type)
+        chunks = ["졸업유예 신청 기간 안내", "졸업유예 신청 서류 목록", "졸업유예 등록금 납부 안내"]
+        store.add_documents([notice("7", "CHEONAN", "ACADEMIC", text) for text in chunks])
+        store.add_documents([notice(*row) for row in NOTICES])
+
+        # 청크 3개 → 2개로 다시 넣으면 남는 7:2 청크가 삭제되고, 바뀌지 않은 7:0 청크는 다시 임베딩하지 않음
+        embedded = []
+        embed_documents = store.embeddings.embed_documents
+        store.embeddings.embed_documents = lambda texts: embedded.extend(texts) or embed_documents(texts)
+        revised = [chunks[0], "졸업유예 신청 서류 변경 안내"]
+        store.upsert_documents([notice("7", "CHEONAN", "ACADEMIC", text) for text in revised])
+        assert embedded == ["졸업유예 신청 서류 변경 안내"]
+        assert [doc.page_content for doc in store.get_documents_by_id("7")] == revised
+        assert store.get_collection_info()["count"] == len(NOTICES) + 2
+        results = store.similarity_search_with_score("졸업유예 등록금 납부 안내", k=10)
+        assert "졸업유예 등록금 납부 안내" not in [doc.page_content for doc, _ in results]
+
+        # update_documents는 목록에 없는 공지사항도 지워 Chroma 저장소와 같은 상태가 됨
+        store.update_documents([notice(*row) for row in NOTICES[:3]])
+        assert store.get_existing_notice_ids() == {"1", "2", "3"}
+        assert set(notice_ids(store.similarity_search_with_score("졸업유예 신청", k=10))) == {"1", "2", "3"}
+        store.close()
+
+        reopened = make_store(directory, index_type)
+        assert reopened.get_collection_info()["count"] == 3
+        assert set(notice_ids(reopened.similarity_search_with_score("졸업유예 신청", k=10))) == {"1", "2", "3"}
+        reopened.close()
+    print(f"✅ FAISS {index_type} 청크 수가 줄어든 공지사항 재적재 테스트 통과")
+
+
+def test_reingest_with_fewer_chunks_removes_orphans():
+    for index_type in ("flat", "hnsw", "ivf"):
+        run_reingest_with_fewer_chunks(index_type)
+
+
+def test_read_only_mmap_store():
+    with tempfile.TemporaryDirectory() as directory:
+        writer = make_store(directory, "ivf")
+        writer.add_documents([notice(*row) for row in NOTICES])
+        writer.close()
+
+        reader = make_store(directory, "ivf", read_only=True)
+        assert reader.get_collection_info()["metadata"]["read_only"] is True
+        assert notice_ids(reader.similarity_search_with_score("2024학년도 1학기 수강신청 일정", k=1)) == ["3"]
+        results = reader.similarity_search_with_score("신청 안내", k=5, campus_filter=Campus.SINGWAN)
+        assert set(notice_ids(results)) == {"2", "3", "5"}
+
+        # 읽기 전용 저장소는 쓰기를 거부하고 인덱스 파일을 바꾸지 않음
+        with pytest.raises(RuntimeError):
+            reader.add_documents([notice("6", "ALL", "ACADEMIC", "새 공지")])
+        with pytest.raises(RuntimeError):
+            reader.delete_collection()
+        assert reader.get_collection_info()["count"] == len(NOTICES)
+        reader.close()
+    print("✅ FAISS 읽기 전용(mmap) 로드 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_flat_store()
+    test_hnsw_store()
+    test_ivf_store()
+    test_reingest_with_fewer_chunks_removes_orphans()
+    test_read_only_mmap_store()
+    print("\n✅ 모든 FAISS 저장소 테스트 통과!")
@@ -0,0 +1,84 @@
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.vector_store.keyword_index import KeywordIndex
+
+CHUNKS = [
+    ("n1:0", "제2주차장 공사 안내. 문의: 시설과 041-850-8000", "SINGWAN"),
+    ("n2:0", "천안캠퍼스 제2주차장 임시 폐쇄 안내", "CHEONAN"),
+    ("n3:0", "2024학년도 1학기 수강신청 일정 안내", "ALL"),
+]
+
+
+def test_bm25_search_with_campus_filter():
+    with tempfile.TemporaryDirectory() as directory:
+        index = KeywordIndex(os.path.join(directory, "keyword.sqlite3"))
+        index.add_many(CHUNKS)
+
+        hits = index.search("041-850-8000", k=3)
+        assert hits[0][0] == "n1:0"
+
+        hits = index.search("제2주차장", k=3, campuses={"ALL", "CHEONAN"})
+        assert [chunk_id for chunk_id, _, _ in hits] == ["n2:0"]
+        index.close()
+    print("✅ BM25 검색/캠퍼스 필터 테스트 통과")
+
+
+def test_incremental_updates_survive_reload():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keyword.sqlite3")
+        index = KeywordIndex(path)
+        index.add_many(CHUNKS)
+        index.remove_chunks(["n1:0"])
+        index.add_many([("n3:0", "도서관 운영 시간 변경 안내", "ALL")])
+        index.close()
+
+        reloaded = KeywordIndex(path, tokenizer=index.tokenizer)
+        assert reloaded.chunk_count() == 2
+        assert reloaded.search("041-850-8000") == []
+        assert reloaded.search("수강신청") == []
+        assert reloaded.search("도서관")[0][0] == "n3:0"
+        reloaded.close()
+    print("✅ 증분 갱신/재시작 테스트 통과")
+
+
+def test_store_resyncs_when_counts_match_but_contents_differ():
+    from langchain_core.documents import Document
+    from src.infrastructure.vector_store.chroma_store import NoticeVectorStore, compute_content_hash
+    from src.interfaces.api.fakes import HashingEmbeddings
+
+    def notice(notice_id, text):
+        return Document(page_content=text, metadata={"notice_id": notice_id, "title": text, "campus": "ALL"})
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        store.add_documents([notice("1", "제2주차장 공사 안내"), notice("2", "수강신청 일정 안내")])
+
+        # 다른 프로세스가 키워드 인덱스를 거치지 않고 2번을 지우고 3번을 추가, 1번 본문을 수정한 상황 (청크 수는 같음)
+        embeddings = HashingEmbeddings()
+        store.collection.delete(ids=["2:0"])
+        for chunk_id, notice_id, text in [("3:0", "3", "기숙사 입사 신청 안내"), ("1:0", "1", "도서관 휴관 안내")]:
+            store.collection.upsert(
+                ids=[chunk_id],
+                embeddings=embeddings.embed_documents([text]),
+                documents=[text],
+                metadatas=[{"notice_id": notice_id, "campus": "ALL", "chunk_index": 0, "content_hash": compute_content_hash(text)}]
+            )
+
+        reopened = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        index = reopened.keyword_index
+        assert index.chunk_count() == 2
+        assert index.search("수강") == [] and index.search("주차장") == []
+        assert index.search("기숙사")[0][0] == "3:0"
+        assert index.search("도서관")[0][0] == "1:0"
+    print("✅ 청크 수가 같아도 내용이 다르면 키워드 인덱스 보정 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_bm25_search_with_campus_filter()
+    test_incremental_updates_survive_reload()
+    test_store_resyncs_when_counts_match_but_contents_differ()
+    print("\n✅ 모든 키워드 인덱스 테스트 통과!")
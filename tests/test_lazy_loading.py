@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.embedding_cache import EmbeddingCache, make_cache_key
+from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+class CountingModel:
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+class LazyEmbeddings(KoreanEmbeddings):
+    """모델 대신 CountingModel을 불러오고 불러온 횟수를 셉니다."""
+    loads = 0
+
+    def _load_model(self):
+        LazyEmbeddings.loads += 1
+        return CountingModel()
+
+
+def test_model_loaded_on_first_use_only():
+    LazyEmbeddings.loads = 0
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "cache.sqlite3"))
+        embeddings = LazyEmbeddings(model_name="fake-model", cache=cache)
+        assert LazyEmbeddings.loads == 0 and not embeddings.is_loaded
+
+        # 캐시에 있는 질의는 모델을 불러오지 않고, 차원은 한 번만 계산
+        cache.put_many({make_cache_key("fake-model", "테스트"): [0.5, 0.5, 0.5, 0.5]})
+        assert embeddings.get_embedding_dimension() == 4
+        assert LazyEmbeddings.loads == 0
+
+        embeddings.warmup()
+        assert embeddings.is_loaded and LazyEmbeddings.loads == 1
+        assert embeddings.get_embedding_dimension() == 3
+
+        embeddings.embed_query("새 질문")
+        assert LazyEmbeddings.loads == 1
+        cache.close()
+    print("✅ 지연 모델 로딩 테스트 통과")
+
+
+def test_lightweight_entry_points_skip_heavy_imports():
+    code = (
+        "import sys\n"
+        "from src.infrastructure.messaging.brokers.redis_streams_broker import RedisStreamsMessageBroker\n"
+        "from src.infrastructure.embedding.korean_embeddings import KoreanEmbeddings\n"
+        "from src.infrastructure.vector_store.chroma_store import NoticeVectorStore\n"
+        "heavy = ['chromadb', 'langchain_openai', 'sentence_transformers', 'torch', 'langchain_community.embeddings']\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT)
+    assert output.returncode == 0, output.stderr
+    assert output.stdout.strip() == "", f"import 시점에 불러온 무거운 모듈: {output.stdout.strip()}"
+    print("✅ 가벼운 진입점 import 테스트 통과")
+
+
+def test_keyword_index_built_on_first_hybrid_search():
+    from langchain_core.documents import Document
+    from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+    from src.interfaces.api.fakes import HashingEmbeddings
+
+    def notice(notice_id, text):
+        return Document(page_content=text, metadata={"notice_id": notice_id, "title": text, "campus": "ALL"})
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        store.add_documents([notice("1", "제2주차장 공사 안내"), notice("2", "수강신청 일정 안내")])
+        store.delete_documents_by_id("2")
+        # 벡터 검색만 쓰는 동안에는 Kiwi 분석기와 BM25 색인을 만들지 않음
+        assert store._keyword_index is None
+        assert not os.path.exists(store.keyword_index_path)
+
+        # 첫 하이브리드 검색에서 만들면서 그동안 쓰인 청크를 색인하고, 이후 쓰기는 바로 반영
+        results, _ = store.hybrid_search("제2주차장", k=2)
+        assert results[0][0].metadata["notice_id"] == "1"
+        assert store.keyword_index.chunk_count() == 1
+        store.add_documents([notice("3", "기숙사 입사 신청 안내")])
+        assert store.keyword_index.search("기숙사")[0][0] == "3:0"
+    print("✅ 키워드 인덱스 지연 생성 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_model_loaded_on_first_use_only()
+    test_lightweight_entry_points_skip_heavy_imports()
+    test_keyword_index_built_on_first_hybrid_search()
+    print("\n✅ 모든 지연 로딩 테스트 통과!")
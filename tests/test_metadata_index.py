@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+import threading
+from datetime import date
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.domain.models import Campus
+from src.infrastructure.vector_store.metadata_index import MetadataFilter, MetadataIndex
+
+TODAY = date(2024, 3, 31)
+
+METADATAS = {
+    1: {"campus": "CHEONAN", "category": "SCHOLARSHIP", "published_date": "2024-03-30T09:00:00"},
+    2: {"campus": "ALL", "category": "SCHOLARSHIP", "date": "2024-03-02T10:00:00"},
+    3: {"campus": "SINGWAN", "category": "SCHOLARSHIP", "published_date": "2024-03-29T09:00:00"},
+    4: {"campus": "CHEONAN", "category": "ACADEMIC", "published_date": "2024-03-28T09:00:00"},
+    5: {"campus": "CHEONAN", "category": "SCHOLARSHIP", "published_date": "2024-01-05T09:00:00"},
+}
+
+
+def test_combined_filters():
+    index = MetadataIndex()
+    index.add_many(METADATAS.items())
+
+    recent = MetadataFilter.recent(30, Campus.CHEONAN, ["SCHOLARSHIP"], today=TODAY)
+    assert index.candidates(recent).tolist() == [1, 2]
+    assert index.candidates(MetadataFilter(campus=Campus.CHEONAN)).tolist() == [1, 2, 4, 5]
+    assert index.candidates(MetadataFilter(until=date(2024, 3, 2))).tolist() == [2, 5]
+    assert index.candidates(None) is None
+
+    # 인덱스 결과와 메타데이터 직접 검사 결과가 같아야 함
+    expected = [chunk_id for chunk_id, metadata in METADATAS.items() if recent.matches(metadata)]
+    assert expected == [1, 2]
+    print("✅ 조건 결합 테스트 통과")
+
+
+def test_updates_on_ingest_and_delete():
+    index = MetadataIndex()
+    index.add_many(METADATAS.items())
+    recent = MetadataFilter.recent(30, Campus.CHEONAN, ["SCHOLARSHIP"], today=TODAY)
+    assert index.candidates(recent).tolist() == [1, 2]
+
+    index.remove_many([2])
+    index.add_many([(6, {"campus": "CHEONAN", "category": "SCHOLARSHIP", "published_date": "2024-03-31"})])
+    index.add_many([(1, {"campus": "CHEONAN", "category": "GENERAL", "published_date": "2024-03-30"})])
+
+    assert index.candidates(recent).tolist() == [6]
+    assert len(index) == 5
+    index.clear()
+    assert index.candidates(recent).tolist() == []
+    print("✅ 추가/삭제 반영 테스트 통과")
+
+
+def test_remap_compacts_ids():
+    index = MetadataIndex()
+    index.add_many(METADATAS.items())
+    index.remove_many([1, 3])
+    index.remap({2: 0, 4: 1, 5: 2})
+
+    assert index.ids().tolist() == [0, 1, 2]
+    assert index.candidates(MetadataFilter(campus=Campus.CHEONAN)).tolist() == [0, 1, 2]
+    assert index.candidates(MetadataFilter(until=date(2024, 3, 2))).tolist() == [0, 2]
+    print("✅ ID 재배치 테스트 통과")
+
+
+def test_store_compacts_deleted_positions():
+    from langchain_core.documents import Document
+    from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+    from src.interfaces.api.fakes import HashingEmbeddings
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        store.metadata_compact_min = 4
+        store.warmup()
+        store.add_documents([
+            Document(page_content=f"{i}번 장학금 신청 안내", metadata={"notice_id": str(i), **METADATAS[i % 5 + 1]})
+            for i in range(10)
+        ])
+        assert len(store._position_chunks) == 10
+
+        # 빈 자리가 4개 이상이면서 25%를 넘는 순간 살아 있는 청크만 남도록 위치를 다시 매김
+        for notice_id in ["0", "1", "2"]:
+            store.delete_documents_by_id(notice_id)
+        assert len(store._position_chunks) == 10
+        store.delete_documents_by_id("3")
+        assert store._position_chunks == [f"{i}:0" for i in range(4, 10)]
+        assert store._chunk_positions == {f"{i}:0": i - 4 for i in range(4, 10)}
+
+        # 새 청크는 압축된 위치 뒤에 붙고, 필터 검색은 새 위치로도 같은 결과
+        store.add_documents([Document(page_content="10번 장학금 신청 안내", metadata={"notice_id": "10", **METADATAS[1]})])
+        assert store._chunk_positions["10:0"] == 6
+        results = store.similarity_search_with_score(
+            "장학금 신청", k=10, metadata_filter=MetadataFilter(campus=Campus.SINGWAN)
+        )
+        assert sorted(doc.metadata["notice_id"] for doc, _ in results) == ["6", "7"]
+    print("✅ 저장소 메타데이터 위치 압축 테스트 통과")
+
+
+def test_store_warmup_waits_for_writers():
+    from langchain_core.documents import Document
+    from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+    from src.interfaces.api.fakes import HashingEmbeddings
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        store.add_documents([Document(page_content="장학금 신청 안내", metadata={"notice_id": "1", **METADATAS[1]})])
+
+        # 컬렉션 교체 등으로 write lock을 잡고 있는 동안에는 warm-up이 메타데이터 인덱스를 채우지 않음
+        store._handle_lock.acquire_write()
+        warmup = threading.Thread(target=store.warmup)
+        warmup.start()
+        warmup.join(timeout=0.2)
+        assert warmup.is_alive() and not store._metadata_ready
+        store._handle_lock.release_write()
+        warmup.join(timeout=5)
+        assert not warmup.is_alive() and store._metadata_ready
+    print("✅ 저장소 warm-up 잠금 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_combined_filters()
+    test_updates_on_ingest_and_delete()
+    test_remap_compacts_ids()
+    test_store_compacts_deleted_positions()
+    test_store_warmup_waits_for_writers()
+    print("\n✅ 모든 메타데이터 인덱스 테스트 통과!")
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from langchain_core.documents import Document
+
+from src.infrastructure.vector_store.chroma_store import NoticeVectorStore
+from src.infrastructure.vector_store.notice_index import NoticeIdIndex
+from src.interfaces.api.fakes import HashingEmbeddings
+
+
+def notice(notice_id, text="공지 본문", **metadata):
+    metadata = {"notice_id": notice_id, "title": f"공지 {notice_id}", "campus": "ALL", **metadata}
+    if notice_id is None:
+        del metadata["notice_id"]
+    return Document(page_content=text, metadata=metadata)
+
+
+def test_index_persists_and_moves_chunks():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "notice_index.sqlite3")
+        index = NoticeIdIndex(path)
+        index.add_many([("n1", "n1:0"), ("n1", "n1:1"), ("n2", "n2:0"), (None, "orphan")])
+        assert index.contains("n1") and index.get_chunk_ids("n1") == ["n1:0", "n1:1"]
+        assert index.chunk_ids() == {"n1:0", "n1:1", "n2:0"}
+
+        # 같은 청크 ID가 다른 공지사항으로 옮겨 가면 이전 공지사항에서 빠짐
+        index.add_many([("n3", "n2:0")])
+        assert not index.contains("n2") and index.get_chunk_ids("n3") == ["n2:0"]
+        index.remove_chunks(["n1:1"])
+        index.close()
+
+        reopened = NoticeIdIndex(path)
+        assert reopened.notice_ids() == {"n1", "n3"}
+        assert reopened.remove("n1") == ["n1:0"]
+        assert reopened.chunk_ids() == {"n2:0"}
+        reopened.close()
+    print("✅ notice_id 인덱스 영속화 테스트 통과")
+
+
+def test_store_dedup_and_startup_sync():
+    with tempfile.TemporaryDirectory() as directory:
+        store = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        store.add_documents_with_dedup([notice("1"), notice("2"), notice("2", "두 번째 청크")])
+        store.add_documents([notice(None, "notice_id 없는 청크")])
+        assert store.add_documents_with_dedup([notice("1"), notice("3")]) == ["3:0"]
+        assert store.get_existing_notice_ids() == {"1", "2", "3"}
+
+        # 청크 수는 같지만 내용이 다른 인덱스: 2번 공지의 청크를 가짜 공지로 바꿔 둠
+        tampered = NoticeIdIndex(os.path.join(directory, "notice_index.sqlite3"))
+        tampered.remove("2")
+        tampered.add_many([("999", "999:0"), ("999", "999:1")])
+        tampered.close()
+
+        reopened = NoticeVectorStore(directory, embeddings=HashingEmbeddings())
+        assert reopened.get_existing_notice_ids() == {"1", "2", "3"}
+        assert reopened.notice_index.get_chunk_ids("2") == ["2:0", "2:1"]
+        assert not reopened.has_notice("999")
+        # notice_id 없는 청크가 있어도 인덱스는 notice_id가 있는 청크만 가짐
+        assert len(reopened.notice_index.chunk_ids()) == reopened.get_collection_info()["count"] - 1
+    print("✅ 저장소 중복 방지/시작 시 인덱스 보정 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_index_persists_and_moves_chunks()
+    test_store_dedup_and_startup_sync()
+    print("\n✅ 모든 notice_id 인덱스 테스트 통과!")
@@ -0,0 +1,74 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.onnx_encoder import OnnxSentenceEncoder
+
+
+class FakeTokenizer:
+    """글자 하나를 토큰 하나로 취급하는 테스트용 토크나이저."""
+    pad_token_id = 0
+    model_max_length = 8
+
+    def __call__(self, texts, truncation=True, max_length=None):
+        return {"input_ids": [[ord(char) for char in text][:max_length] for text in texts]}
+
+
+class FakeSession:
+    """토큰 값을 은닉 상태로 돌려주고 배치 모양을 기록하는 테스트용 세션."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, feeds):
+        ids = feeds["input_ids"].astype(np.float32)
+        self.shapes.append(ids.shape)
+        return [np.stack([ids, np.ones_like(ids)], axis=-1)]
+
+
+def make_encoder(batch_size=2):
+    return OnnxSentenceEncoder(
+        "fake-model", batch_size=batch_size, tokenizer=FakeTokenizer(), session=FakeSession(), pooling="mean"
+    )
+
+
+def test_length_bucketing_keeps_input_order():
+    encoder = make_encoder()
+    texts = ["aaaaaa", "b", "cccc", "dd", "eeeee"]
+    vectors = encoder.encode(texts)
+
+    # 길이순으로 (b, dd) (cccc, eeeee) (aaaaaa) 배치가 되어 패딩이 최소화됨
+    assert encoder.session.shapes == [(2, 2), (2, 5), (1, 6)]
+
+    # mean pooling은 패딩을 제외하고, 결과는 정규화되어 입력 순서대로 반환됨
+    for text, vector in zip(texts, vectors):
+        expected = np.array([ord(text[0]), 1.0], dtype=np.float32)
+        expected /= np.linalg.norm(expected)
+        assert np.allclose(vector, expected, atol=1e-6)
+    print("✅ 길이 버킷 배치 테스트 통과")
+
+
+def test_truncation_and_embedding_interface():
+    encoder = make_encoder(batch_size=32)
+    assert encoder.max_length == 8
+
+    encoder.embed_documents(["x" * 20])
+    assert encoder.session.shapes[-1] == (1, 8)
+
+    query = encoder.embed_query("a")
+    assert isinstance(query, list) and abs(sum(value * value for value in query) - 1.0) < 1e-6
+    assert encoder.encode([]).shape[0] == 0
+    print("✅ 최대 길이/인터페이스 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_length_bucketing_keeps_input_order()
+    test_truncation_and_embedding_interface()
+    print("\n✅ 모든 ONNX 인코더 테스트 통과!")
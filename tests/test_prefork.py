@@ -0,0 +1,59 @@
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.embedding_cache import EmbeddingCache
+from src.interfaces.prefork import PreforkServer, memory_report
+
+
+def test_workers_share_parent_state_and_restart():
+    context = multiprocessing.get_context("fork")
+    results = context.SimpleQueue()
+    shared = {"weights": list(range(1000))}
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "cache.sqlite3"))
+        cache.put_many({"부모": [1.0, 2.0]})
+        marker = os.path.join(directory, "crashed")
+
+        def serve(worker_id: int):
+            # 워커 1은 첫 실행에서 비정상 종료해 재시작을 확인
+            if worker_id == 1 and not os.path.exists(marker):
+                open(marker, "w").close()
+                raise RuntimeError("첫 실행 실패")
+            cache.reopen_after_fork()
+            cache.put_many({f"워커{worker_id}": [float(worker_id)]})
+            results.put((worker_id, os.getpid(), sum(shared["weights"]), cache.get_many(["부모"])["부모"]))
+            while True:
+                time.sleep(1)
+
+        # 감시 루프는 시그널 핸들러를 쓰므로 별도 프로세스의 메인 스레드에서 실행
+        launcher = context.Process(target=PreforkServer(serve, workers=2, restart_delay=0.05).run)
+        launcher.start()
+        received = sorted(results.get() for _ in range(2))
+        assert [(worker_id, total, vector) for worker_id, _, total, vector in received] == [
+            (0, 499500, [1.0, 2.0]), (1, 499500, [1.0, 2.0])
+        ]
+        assert os.path.exists(marker)
+        assert memory_report(pid for _, pid, _, _ in received)["processes"] == 2
+
+        os.kill(launcher.pid, signal.SIGTERM)
+        launcher.join(timeout=10)
+        assert launcher.exitcode == 0
+        # 종료 신호를 받으면 워커도 모두 종료됨
+        assert memory_report(pid for _, pid, _, _ in received)["processes"] == 0
+
+        # 자식이 새 연결로 쓴 값이 부모에게도 보임
+        assert set(cache.get_many(["워커0", "워커1"])) == {"워커0", "워커1"}
+        cache.close()
+    print("✅ pre-fork 워커 공유/재시작 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_workers_share_parent_state_and_restart()
+    print("\n✅ 모든 pre-fork 테스트 통과!")
@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.infrastructure.embedding.query_cache import QueryEmbeddingCache
+
+
+class CountingEmbedder:
+    """호출 횟수를 세고, 다른 요청이 모두 합류할 때까지 임베딩을 붙잡아 둡니다."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+        self.cache = None
+        self.wait_for_coalesced = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query):
+        with self._lock:
+            self.calls.append(query)
+        deadline = time.time() + 2
+        while self.cache is not None and self.cache.coalesced < self.wait_for_coalesced and time.time() < deadline:
+            time.sleep(0.005)
+        if self.fail:
+            raise RuntimeError("임베딩 실패")
+        return [float(len(query))]
+
+    def embed_many(self, queries):
+        return [self(query) for query in queries]
+
+
+def test_lru_eviction_and_normalized_keys():
+    embedder = CountingEmbedder()
+    cache = QueryEmbeddingCache(embedder, max_entries=2)
+    cache.get("수강신청")
+    cache.get("장학금")
+    # 공백만 다른 질의는 캐시 적중, 최근 사용한 항목은 남음
+    cache.get("  수강신청 ")
+    cache.get("기숙사")
+
+    assert embedder.calls == ["수강신청", "장학금", "기숙사"]
+    cache.get("수강신청")
+    assert len(embedder.calls) == 3
+    cache.get("장학금")
+    assert embedder.calls[-1] == "장학금"
+
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (2, 2, 4)
+    print("✅ 질의 임베딩 LRU 방출 테스트 통과")
+
+
+def test_concurrent_identical_queries_embed_once():
+    embedder = CountingEmbedder()
+    cache = QueryEmbeddingCache(embedder)
+    embedder.cache = cache
+    embedder.wait_for_coalesced = 7
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: cache.get("졸업 요건"), range(8)))
+
+    assert embedder.calls == ["졸업 요건"]
+    assert all(result == [5.0] for result in results)
+    assert cache.stats()["coalesced"] == 7
+    print("✅ 동시 동일 질의 single-flight 테스트 통과")
+
+
+def test_error_propagates_to_all_waiters():
+    embedder = CountingEmbedder(fail=True)
+    cache = QueryEmbeddingCache(embedder)
+    embedder.cache = cache
+    embedder.wait_for_coalesced = 3
+
+    def query(_):
+        try:
+            cache.get("휴학 신청")
+            return None
+        except RuntimeError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        errors = list(pool.map(query, range(4)))
+
+    assert errors == ["임베딩 실패"] * 4
+    assert len(embedder.calls) == 1
+    # 실패한 질의는 캐시에 남지 않아 다음 요청에서 다시 시도
+    embedder.fail = False
+    embedder.cache = None
+    assert cache.get("휴학 신청") == [5.0]
+    assert len(embedder.calls) == 2
+    print("✅ 실패 전파 테스트 통과")
+
+
+def test_get_many_batches_misses():
+    embedder = CountingEmbedder()
+    batches = []
+
+    def embed_many(queries):
+        batches.append(list(queries))
+        return embedder.embed_many(queries)
+
+    cache = QueryEmbeddingCache(embedder, embed_many_fn=embed_many)
+    cache.get("수강신청")
+    results = cache.get_many(["수강신청", "장학금", " 장학금", "기숙사"])
+
+    assert batches == [["장학금", "기숙사"]]
+    assert results == [[4.0], [3.0], [3.0], [3.0]]
+    print("✅ 여러 질의 일괄 임베딩 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_lru_eviction_and_normalized_keys()
+    test_concurrent_identical_queries_embed_once()
+    test_error_propagates_to_all_waiters()
+    test_get_many_batches_misses()
+    print("\n✅ 모든 질의 임베딩 캐시 테스트 통과!")
@@ -0,0 +1,202 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from langchain_core.documents import Document
+
+from src.application.services.rag_service import NoticeRAGSystem
+from src.interfaces.api.fakes import FakeChatModel
+
+
+def notice(notice_id, text="2024년 1학기 수강신청은 2월 15일부터 2월 17일까지입니다.", **metadata):
+    return Document(
+        page_content=text,
+        metadata={"notice_id": notice_id, "title": f"공지 {notice_id}", "campus": "ALL", "category": "ACADEMIC", **metadata}
+    )
+
+
+class FakeStore:
+    """질의별로 정해 둔 (문서, 벡터 거리) 목록을 돌려주는 저장소. 'hybrid 실패'가 든 질의는 하이브리드 검색에서 실패합니다."""
+
+    def __init__(self, results_by_query=None, default=None):
+        self.results_by_query = results_by_query or {}
+        self.default = default if default is not None else [(notice("12345"), 0.2)]
+        self.batch_calls = 0
+
+    def _results(self, query):
+        return self.results_by_query.get(query, self.default)
+
+    def embed_queries(self, queries):
+        return [[0.0] for _ in queries]
+
+    def similarity_search_with_score(self, query, k=5, campus_filter=None, metadata_filter=None):
+        return self._results(query)[:k]
+
+    def similarity_search_with_score_batch(self, queries, k=5, campus_filters=None):
+        self.batch_calls += 1
+        return [self._results(query)[:k] for query in queries]
+
+    def hybrid_search(self, query, k=5, campus_filter=None):
+        if "hybrid 실패" in query:
+            raise RuntimeError("키워드 인덱스 오류")
+        return self._results(query)[:k], {"total_ms": 0.0}
+
+
+def make_rag(store, llm=None, **options):
+    options.setdefault("retrieval_mode", "vector")
+    return NoticeRAGSystem(
+        store,
+        llm=llm or FakeChatModel(first_token_ms=0, token_ms=0, tokens=3),
+        use_answer_cache=False,
+        **options
+    )
+
+
+def test_batch_isolates_failures_per_item():
+    store = FakeStore({
+        "컨텍스트 실패": [(notice("bad-context"), 0.2)],
+        "저장 실패": [(notice("bad-store"), 0.2)]
+    })
+    rag = make_rag(store)
+
+    build = rag.context_builder.build
+
+    def failing_build(relevant):
+        if any(doc.metadata["notice_id"] == "bad-context" for doc, _ in relevant):
+            raise ValueError("컨텍스트 구성 오류")
+        return build(relevant)
+
+    finish = rag._finish_answer
+
+    def failing_finish(pending, answer):
+        if pending.query == "저장 실패":
+            raise ValueError("응답 저장 오류")
+        return finish(pending, answer)
+
+    rag.context_builder.build = failing_build
+    rag._finish_answer = failing_finish
+
+    responses = rag.generate_answers_batch(["수강신청 기간", "컨텍스트 실패", "저장 실패", "장학금 신청"])
+    assert store.batch_calls == 1
+    assert [response.get("error") for response in responses] == [None, "컨텍스트 구성 오류", "응답 저장 오류", None]
+    assert responses[0]["answer"] and responses[3]["answer"]
+    assert rag.llm.calls == 3
+    print("✅ 배치 답변 항목별 오류 격리 테스트 통과")
+
+
+def test_batch_hybrid_retrieval_failure_is_isolated():
+    rag = make_rag(FakeStore(), retrieval_mode="hybrid")
+    responses = rag.generate_answers_batch(["수강신청 기간", "hybrid 실패 질의", "장학금 신청"], max_concurrency=2)
+
+    assert [response.get("error") for response in responses] == [None, "키워드 인덱스 오류", None]
+    assert responses[0]["retrieval"]["mode"] == "hybrid"
+    assert rag.llm.calls == 2
+    print("✅ 하이브리드 배치 검색 오류 격리 테스트 통과")
+
+
+def test_agenerate_answer_uses_llm_once():
+    async def scenario():
+        rag = make_rag(FakeStore())
+        response = await rag.agenerate_answer("수강신청 기간")
+        assert response["answer"].startswith("'")
+        assert [source["notice_id"] for source in response["sources"]] == ["12345"]
+        assert response["cache_hit"] is False
+        assert rag.llm.calls == 1
+
+    asyncio.run(scenario())
+    print("✅ 비동기 답변 생성 테스트 통과")
+
+
+def test_astream_answer_event_order():
+    async def scenario():
+        rag = make_rag(FakeStore(), llm=FakeChatModel(first_token_ms=0, token_ms=0, tokens=4))
+        events = [event async for event in rag.astream_answer("수강신청 기간")]
+
+        # sources → token(여러 번) → done
+        assert [event["type"] for event in events] == ["sources", "token", "token", "token", "token", "done"]
+        assert events[0]["sources"][0]["notice_id"] == "12345"
+        done = events[-1]["response"]
+        assert done["answer"] == "".join(event["content"] for event in events[1:-1])
+        assert done["sources"] == events[0]["sources"]
+
+        # 관련 문서가 없으면 LLM 없이 같은 순서로 한 번에 전달
+        rag = make_rag(FakeStore(default=[]))
+        events = [event async for event in rag.astream_answer("수강신청 기간")]
+        assert [event["type"] for event in events] == ["sources", "token", "done"]
+        assert events[1]["content"] == "죄송합니다. 관련된 정보를 찾을 수 없습니다."
+        assert rag.llm.calls == 0
+
+    asyncio.run(scenario())
+    print("✅ 스트리밍 이벤트 순서 테스트 통과")
+
+
+def test_below_threshold_skips_llm():
+    # 거리 1.4 → 코사인 유사도 0.3
+    rag = make_rag(FakeStore(default=[(notice("1"), 1.4)]), relevance_threshold=0.5)
+    response = rag.generate_answer("식당 메뉴")
+
+    assert response["answer"] == "죄송합니다. 관련된 정보를 찾을 수 없습니다."
+    assert response["sources"] == []
+    assert response["retrieval"]["decision"] == "no_relevant_documents"
+    assert response["retrieval"]["best_similarity"] == 0.3
+    assert rag.llm.calls == 0
+    assert rag.get_retrieval_stats()["short_circuited"] == 1
+    print("✅ 임계값 미달 시 LLM 생략 테스트 통과")
+
+
+def test_margin_drops_documents_far_below_best():
+    # 유사도 0.9 / 0.75 / 0.6: 모두 임계값은 넘지만 최고 점수 - margin(0.2) = 0.7 아래인 문서는 버림
+    store = FakeStore(default=[(notice("1"), 0.2), (notice("2"), 0.5), (notice("3"), 0.8)])
+    rag = make_rag(store, relevance_threshold=0.35, relevance_margin=0.2)
+    response = rag.generate_answer("수강신청 기간")
+
+    assert response["retrieval"]["cutoff"] == 0.7
+    assert response["retrieval"]["used_k"] == 2
+    assert [source["notice_id"] for source in response["sources"]] == ["1", "2"]
+    assert rag.llm.calls == 1
+    print("✅ 최고 점수 대비 margin 컷오프 테스트 통과")
+
+
+def test_keyword_coverage_bypasses_cutoff():
+    # 벡터 유사도는 0.3이지만 질의어를 대부분 포함한 키워드 검색 결과는 통과
+    store = FakeStore(default=[
+        (notice("1", keyword_coverage=0.8), 1.4),
+        (notice("2", keyword_coverage=0.2), 1.4)
+    ])
+    rag = make_rag(store, retrieval_mode="hybrid", relevance_threshold=0.5, keyword_min_coverage=0.5)
+    response = rag.generate_answer("졸업유예 신청")
+
+    assert response["retrieval"]["decision"] == "answer"
+    assert [source["notice_id"] for source in response["sources"]] == ["1"]
+    assert rag.llm.calls == 1
+    print("✅ 키워드 포함률 컷오프 통과 테스트 통과")
+
+
+def test_retrieval_stats_are_consistent_across_threads():
+    # 유사도 0.9(답변) / 0.3(컷오프) 질의를 여러 스레드에서 동시에 처리해도 카운터가 빠짐없이 집계됨
+    store = FakeStore({"식당 메뉴": [(notice("1"), 1.4)]})
+    rag = make_rag(store, relevance_threshold=0.5)
+    queries = ["수강신청 기간", "식당 메뉴"] * 200
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(rag.generate_answer, queries))
+
+    stats = rag.get_retrieval_stats()
+    assert (stats["answered"], stats["short_circuited"]) == (200, 200)
+    assert stats["short_circuit_rate"] == 0.5
+    print("✅ 멀티스레드 검색 통계 집계 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_batch_isolates_failures_per_item()
+    test_batch_hybrid_retrieval_failure_is_isolated()
+    test_agenerate_answer_uses_llm_once()
+    test_astream_answer_event_order()
+    test_below_threshold_skips_llm()
+    test_margin_drops_documents_far_below_best()
+    test_keyword_coverage_bypasses_cutoff()
+    test_retrieval_stats_are_consistent_across_threads()
+    print("\n✅ 모든 RAG 서비스 테스트 통과!")
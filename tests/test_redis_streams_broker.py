@@ -0,0 +1,240 @@
+import asyncio
+import os
+import sys
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.domain.models import Campus, NoticeCategory
+from src.infrastructure.messaging.brokers.redis_streams_broker import RedisStreamsMessageBroker
+from src.infrastructure.messaging.events import NoticeEvent, EventType
+
+TOPIC = "university.notices"
+
+
+def make_event(notice_id: str) -> NoticeEvent:
+    return NoticeEvent(
+        event_id=str(uuid4()),
+        event_type=EventType.NOTICE_CREATED,
+        timestamp=datetime.now(),
+        source_service="test",
+        notice_id=notice_id,
+        title=f"테스트 공지사항 {notice_id}",
+        content="스트림 브로커 테스트용 공지사항입니다.",
+        url=f"https://www.kongju.ac.kr/notice/{notice_id}",
+        campus=Campus.ALL,
+        category=NoticeCategory.GENERAL,
+        published_date=datetime.now()
+    )
+
+
+def make_broker(server, consumer_name: str, **kwargs) -> RedisStreamsMessageBroker:
+    client = fakeredis.aioredis.FakeRedis(server=server)
+    return RedisStreamsMessageBroker(consumer_name=consumer_name, block_ms=50, client=client, **kwargs)
+
+
+async def wait_until(condition, timeout: float = 3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("시간 내에 조건을 만족하지 못함")
+        await asyncio.sleep(0.02)
+
+
+def test_consumer_group_shares_load_and_keeps_messages_without_subscribers():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        publisher = make_broker(server, "publisher")
+        await publisher.start()
+
+        # 구독자가 없을 때 발행된 메시지도 스트림에 남아 있어야 함
+        await publisher._ensure_group(TOPIC)
+        for i in range(20):
+            await publisher.publish(TOPIC, make_event(f"n{i}"))
+
+        received = {"w1": [], "w2": []}
+        workers = []
+        for name in received:
+            async def handler(event, name=name):
+                await asyncio.sleep(0.01)
+                received[name].append(event.notice_id)
+
+            worker = make_broker(server, name, batch_size=2, max_in_flight=2)
+            await worker.start()
+            await worker.subscribe(TOPIC, handler)
+            workers.append(worker)
+
+        await wait_until(lambda: len(received["w1"]) + len(received["w2"]) == 20)
+        assert sorted(received["w1"] + received["w2"]) == sorted(f"n{i}" for i in range(20))
+        assert received["w1"] and received["w2"], "두 워커가 메시지를 나눠 처리하지 않음"
+        assert await workers[0].get_pending_count(TOPIC) == 0
+
+        for worker in workers:
+            await worker.stop()
+
+    asyncio.run(scenario())
+    print("✅ 컨슈머 그룹 분산 처리 테스트 통과")
+
+
+def test_failed_message_is_reclaimed_by_another_consumer():
+    async def scenario():
+        server = fakeredis.FakeServer()
+
+        async def failing_handler(event):
+            raise RuntimeError("처리 실패")
+
+        failing = make_broker(server, "failing")
+        await failing.start()
+        await failing.subscribe(TOPIC, failing_handler)
+        await failing.publish(TOPIC, make_event("retry-1"))
+        await wait_until(lambda: failing.dispatcher.in_flight == 0)
+        await asyncio.sleep(0.1)
+        await failing.stop()
+
+        received = []
+        healthy = make_broker(server, "healthy", claim_idle_ms=0)
+        await healthy.start()
+        await healthy.subscribe(TOPIC, lambda event: received.append(event.notice_id))
+
+        await wait_until(lambda: "retry-1" in received)
+        await wait_until(lambda: healthy.dispatcher.in_flight == 0)
+        assert await healthy.get_pending_count(TOPIC) == 0
+        await healthy.stop()
+
+    asyncio.run(scenario())
+    print("✅ pending 메시지 재처리 테스트 통과")
+
+
+def test_publish_many_and_batch_delivery():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        broker = make_broker(server, "batch-worker")
+        await broker.start()
+
+        batches = []
+        await broker.subscribe_batch(
+            TOPIC,
+            lambda events: batches.append([e.notice_id for e in events]),
+            max_batch_size=10
+        )
+
+        stats = await broker.publish_many(TOPIC, [make_event(f"b{i}") for i in range(25)], chunk_size=10)
+        assert stats["published"] == 25
+        assert stats["batches"] == 3
+
+        await wait_until(lambda: sum(len(batch) for batch in batches) == 25)
+        assert all(len(batch) <= 10 for batch in batches)
+        assert [notice_id for batch in batches for notice_id in batch] == [f"b{i}" for i in range(25)]
+        await wait_until(lambda: broker.dispatcher.in_flight == 0)
+        assert await broker.get_pending_count(TOPIC) == 0
+        await broker.stop()
+
+    asyncio.run(scenario())
+    print("✅ 배치 발행/배치 수신 테스트 통과")
+
+
+def test_batch_options_are_per_topic_and_delay_fills_batches():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        broker = make_broker(server, "batch-options", batch_size=4)
+        await broker.start()
+
+        batches = []
+        await broker.subscribe_batch(
+            TOPIC,
+            lambda events: batches.append([e.notice_id for e in events]),
+            max_batch_size=10,
+            max_batch_delay=0.3
+        )
+        await broker.subscribe("other.topic", lambda event: None)
+        # 배치 크기는 배치 토픽에만 적용되고 다른 토픽의 읽기 개수는 그대로
+        assert broker.batch_size == 4
+        assert broker._read_count(TOPIC) == 10 and broker._read_count("other.topic") == 4
+
+        # 따로 발행된 이벤트도 max_batch_delay 안이면 한 배치로 모임
+        for i in range(3):
+            await broker.publish(TOPIC, make_event(f"d{i}"))
+            await asyncio.sleep(0.05)
+        await wait_until(lambda: sum(len(batch) for batch in batches) == 3)
+        assert batches == [["d0", "d1", "d2"]]
+        await broker.stop()
+
+    asyncio.run(scenario())
+    print("✅ 토픽별 배치 설정/지연 배치 테스트 통과")
+
+
+def test_concurrent_batch_lanes_keep_per_notice_order():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        broker = make_broker(server, "lanes", max_in_flight=4)
+        await broker.start()
+
+        received = []
+
+        async def handler(events):
+            await asyncio.sleep(0.01)
+            received.extend((event.notice_id, event.title) for event in events)
+
+        await broker.subscribe_batch(TOPIC, handler, max_batch_size=4, max_batch_delay=0, max_concurrent_batches=2)
+        events = []
+        for version in range(5):
+            for notice_id in ["a", "b", "c", "d"]:
+                event = make_event(notice_id)
+                event.title = f"v{version}"
+                events.append(event)
+        await broker.publish_many(TOPIC, events)
+
+        await wait_until(lambda: len(received) == 20)
+        for notice_id in ["a", "b", "c", "d"]:
+            assert [title for received_id, title in received if received_id == notice_id] == [f"v{i}" for i in range(5)]
+        await wait_until(lambda: broker.dispatcher.in_flight == 0)
+        assert await broker.get_pending_count(TOPIC) == 0
+        await broker.stop()
+
+    asyncio.run(scenario())
+    print("✅ 동시 배치 레인별 공지사항 순서 테스트 통과")
+
+
+def test_dead_lettered_batch_is_reported_to_error_handler():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        broker = make_broker(server, "failing-batch", claim_idle_ms=0, max_deliveries=2)
+        await broker.start()
+
+        async def failing_handler(events):
+            raise RuntimeError("저장 실패")
+
+        failed = []
+        await broker.subscribe_batch(
+            TOPIC,
+            failing_handler,
+            max_batch_delay=0,
+            on_batch_error=lambda events, error: failed.append(([e.notice_id for e in events], str(error)))
+        )
+        await broker.publish(TOPIC, make_event("dead-1"))
+
+        # 재시도 한도를 넘기면 dead-letter로 옮기고 마지막 오류와 함께 오류 핸들러에 전달
+        await wait_until(lambda: failed)
+        assert failed == [(["dead-1"], "저장 실패")]
+        assert await broker.client.xlen(f"{TOPIC}.dead") == 1
+        await wait_until(lambda: broker.dispatcher.in_flight == 0)
+        assert await broker.get_pending_count(TOPIC) == 0
+        await broker.stop()
+
+    asyncio.run(scenario())
+    print("✅ dead-letter 배치 오류 핸들러 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_consumer_group_shares_load_and_keeps_messages_without_subscribers()
+    test_failed_message_is_reclaimed_by_another_consumer()
+    test_publish_many_and_batch_delivery()
+    test_batch_options_are_per_topic_and_delay_fills_batches()
+    test_concurrent_batch_lanes_keep_per_notice_order()
+    test_dead_lettered_batch_is_reported_to_error_handler()
+    print("\n✅ 모든 Redis Streams 브로커 테스트 통과!")
@@ -0,0 +1,69 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.infrastructure.embedding.similarity import (
+    cosine_similarity, mmr_select, near_duplicate_pairs, normalize, squared_l2_distances, top_k, top_k_similar
+)
+
+
+def test_batch_scores_match_pairwise():
+    rng = np.random.default_rng(0)
+    matrix = normalize(rng.standard_normal((500, 32)))
+    query = normalize(rng.standard_normal(32))[0]
+
+    indices, scores = top_k_similar(query, matrix, 5)
+    expected = sorted(range(len(matrix)), key=lambda i: cosine_similarity(query, matrix[i]), reverse=True)[:5]
+    assert indices.tolist() == expected
+    assert np.all(np.diff(scores) <= 0)
+
+    distances = squared_l2_distances(query, matrix)[0]
+    assert np.allclose(distances, ((matrix - query) ** 2).sum(axis=1), atol=1e-5)
+    assert top_k(distances, 5, largest=False)[0].tolist() == expected
+
+    rows, _ = top_k(np.array([[3.0, 1.0, 2.0], [0.0, 5.0, 4.0]]), 2)
+    assert rows.tolist() == [[0, 2], [1, 2]]
+    print("✅ 배치 유사도/top-k 테스트 통과")
+
+
+def test_near_duplicate_pairs():
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((300, 16))
+    vectors[250] = vectors[3] * 2 + 0.01
+    vectors[120] = vectors[7]
+
+    pairs = near_duplicate_pairs(vectors, threshold=0.99, normalized=False, block_size=64)
+    assert [(i, j) for i, j, _ in pairs] == [(3, 250), (7, 120)]
+    print("✅ 중복 후보 탐지 테스트 통과")
+
+
+def test_mmr_diversifies_and_caps_groups():
+    rng = np.random.default_rng(2)
+    axes = np.eye(8, dtype=np.float32)
+    # 질의는 두 주제의 중간. 공지사항 A는 첫 주제의 거의 같은 청크 3개, B와 C는 두 번째 주제
+    query = normalize(axes[0] + axes[1])[0]
+    candidates = np.vstack([
+        normalize(axes[0] + 0.01 * rng.standard_normal((3, 8))),
+        normalize(axes[1] + 0.3 * axes[2]),
+        normalize(axes[1] + 0.3 * axes[3])
+    ])
+    groups = ["A", "A", "A", "B", "C"]
+
+    assert mmr_select(query, candidates, 3, lambda_mult=1.0) == top_k_similar(query, candidates, 3)[0].tolist()
+
+    diverse = mmr_select(query, candidates, 3, lambda_mult=0.5)
+    assert diverse[0] in (0, 1, 2) and {3, 4} <= set(diverse)
+
+    capped = mmr_select(query, candidates, 4, lambda_mult=1.0, groups=groups, max_per_group=1)
+    assert sorted(groups[i] for i in capped) == ["A", "B", "C"]
+    print("✅ MMR 다양성/공지사항별 제한 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_batch_scores_match_pairwise()
+    test_near_duplicate_pairs()
+    test_mmr_diversifies_and_caps_groups()
+    print("\n✅ 모든 유사도 테스트 통과!")